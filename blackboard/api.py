@@ -24,30 +24,44 @@ an interface to make Blackboard REST API calls on a session basis.
 import logging
 import requests
 from typing import Any
+from collections.abc import Mapping
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests.cookies import RequestsCookieJar
+from xml.etree.ElementTree import Element
 
-from tiny_api_client import api_client, get
+from tiny_api_client import api_client, api_client_method, get
 
 from .blackboard import (
     BBMembership,
     BBCourse,
     BBCourseContent,
-    BBAttachment
+    BBAttachment,
+    BBWebDAVEntry
 )
 
+from .webdav import parse_multistatus
+from .transport import Timeout
+from .timeouts import TimeoutTransport
 from .exceptions import status_handler
 
 _logger = logging.getLogger(__name__)
 
+propfind = api_client_method('PROPFIND')
+
 
 @api_client(timeout=12, status_handler=status_handler)
 class BlackboardSession:
     """Represents a user session in Blackboard."""
 
-    def __init__(self, url: str, *, cookies: RequestsCookieJar):
+    def __init__(self, url: str, *, cookies: RequestsCookieJar,
+                 transport: BaseAdapter | None = None,
+                 timeouts: Mapping[str, Timeout] | None = None):
         """
         :param url: The URL of the blackboard API to use
         :param cookies: A `RequestsCookieJar` authorised to use the API
+        :param transport: A `requests` adapter that sends all requests
+        :param timeouts: Connect and read timeouts by regular expression
+            of the URL path, see `TimeoutTransport`
         """
 
         self._instance_url = url
@@ -55,6 +69,17 @@ class BlackboardSession:
         self._cookies = cookies
         self._user_id: str | None = None
 
+        self._http_session = requests.Session()
+        adapter = TimeoutTransport(transport or HTTPAdapter(),
+                                   timeouts=timeouts)
+        self._http_session.mount("http://", adapter)
+        self._http_session.mount("https://", adapter)
+        # tiny-api-client has no hook for the session it sends requests
+        # with, but only creates one when this attribute is missing.
+        # Its versions are pinned, and test_session_transport fails if
+        # requests stop going through this session.
+        setattr(self, '__client_session', self._http_session)
+
     @property
     def user_id(self) -> str:
         """User id field used for API requests."""
@@ -70,6 +95,15 @@ class BlackboardSession:
         """Downloads an arbitrary webdav file"""
         return response
 
+    @propfind("{webdav_url}", json=False, xml=True, use_api=False,
+              headers={'Depth': '1'})
+    def list_webdav(self, response: Element) -> list[BBWebDAVEntry]:
+        """Lists an arbitrary webdav folder.
+
+        The folder itself is usually included in the results.
+        """
+        return parse_multistatus(response)
+
     # API CALLS
     # https://developer.blackboard.com/portal/displayApi
 
@@ -771,20 +805,18 @@ class BlackboardSession:
         """
         return response
 
-    # Get Users Avatar
-    # TODO: Handle this API call (HTTP header)
-    @get("/users/{user_id}/avatar")
-    def fetch_avatar(self, response: Any) -> Any:
+    # The API redirects to the image, which requests follows
+    @get("/users/{user_id}/avatar", json=False, stream=True,
+         allow_redirects=True)
+    def fetch_avatar(self, response: requests.Response
+                     ) -> requests.Response:
         """Get a user avatar image.
 
-        The response: Any is an HTTP redirect rather than image raw
-        data. It is up to the caller of the api to follow the redirect
-        and download the image.
+        The response is streamed and should be closed once read,
+        its status is not checked.
 
-        Not yet implemented.
         :param user_id: The user ID.
         """
-        raise NotImplementedError("API has not implemented this method yet.")
         return response
 
     @get("/users/{user_id}/observees")
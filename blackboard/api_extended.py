@@ -21,16 +21,108 @@ an extension of the Blackboard REST API
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
 # MA  02110-1301, USA.
 
+import os
+import time
+import heapq
 import logging
+import itertools
+from pathlib import Path
 from typing import Any
+from dataclasses import dataclass, field
+from collections import deque
+from datetime import datetime, timezone
+from urllib.parse import urljoin
+from xml.etree.ElementTree import ParseError
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import (
+    Future,
+    FIRST_COMPLETED,
+    as_completed,
+    wait
+)
+
+from .blackboard import (
+    BBCourse,
+    BBMeeting,
+    BBNode,
+    BBGroup,
+    BBCategory,
+    BBAnnouncement,
+    BBMembership,
+    BBAttachment,
+    BBCourseChild,
+    BBNodeCourse,
+    BBContentEntry,
+    BBWebDAVEntry,
+    BBResourceType,
+    BBCourseContent,
+    BBCategoryCourse,
+    BBReviewStatus,
+    BBGroupMembership,
+    BBAttendanceRecord
+)
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import RequestsCookieJar
 
-from .blackboard import BBCourse
 from .api import BlackboardSession
 from .filters import BBMembershipFilter
-from .exceptions import BBForbiddenError
+from .hierarchy import BBHierarchy
+from .catalog import CATEGORY_TYPES, BBCatalog
+from .groups import BBGroupRoster
+from .reviews import BBReviewIndex
+from .terms import TermResolver
+from .avatars import AvatarCache
+from .layout import LayoutPlanner
+from .embedded import EmbeddedFile, find_embedded_files
+from .transport import Timeout
+from .timeouts import ContextExecutor
+from .sink import DownloadSink
+from .attendance import BBAttendanceMatrix, parse_attendance_csv
+from .webdav import (
+    MirrorReport,
+    WebDAVManifest,
+    relative_path
+)
+from .exceptions import (
+    BBStatusError,
+    BBForbiddenError,
+    BBUnauthorizedError
+)
 
 logger = logging.getLogger(__name__)
 
+# Sorts items without a date last
+_NO_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _posted(announcement: BBAnnouncement) -> datetime:
+    return announcement.posted or _NO_DATE
+
+
+@dataclass
+class _AnnouncementMark:
+    """The announcements of a course already returned by a session."""
+    #: Every announcement posted up to this time was returned
+    posted: datetime | None = None
+    #: Later announcements that were returned, by ID and time posted
+    seen: set[tuple[str, datetime]] = field(default_factory=set)
+
+    def is_new(self, announcement: BBAnnouncement) -> bool:
+        posted = _posted(announcement)
+        return (self.posted is None or posted > self.posted) and \
+            (announcement.id, posted) not in self.seen
+
+    def advance(self, new: list[BBAnnouncement],
+                returned: set[tuple[str, datetime]]) -> None:
+        """Record which of the new announcements were returned."""
+        keys = {(a.id, _posted(a)) for a in new}
+        if keys <= returned:
+            self.posted = max(p for _, p in keys | self.seen)
+            self.seen.clear()
+        else:
+            self.seen |= keys & returned
+
 
 class BlackboardExtended(BlackboardSession):
     """An extension of `BlackboardSession` with QOL improvements.
@@ -38,10 +130,34 @@ class BlackboardExtended(BlackboardSession):
     fetching data from the API, or filtering results.
     """
 
+    def __init__(self, url: str, *, cookies: RequestsCookieJar,
+                 transport: BaseAdapter | None = None,
+                 timeouts: Mapping[str, Timeout] | None = None,
+                 terms: TermResolver | None = None):
+        """
+        :param terms: Caches terms, may be shared with other sessions,
+            other parameters are those of `BlackboardSession`
+        """
+        super().__init__(url, cookies=cookies, transport=transport,
+                         timeouts=timeouts)
+        self.terms = terms or TermResolver(self)
+        # Parent course of each known course, cross-listed or not
+        self._cross_list_parents: dict[str, str] = {}
+        # Announcements returned so far in each course
+        self._announcement_marks: dict[str, _AnnouncementMark] = {}
+
     def ex_fetch_courses(self, *,
                          result_filter: BBMembershipFilter | None = None,
+                         term_ids: Iterable[str] | None = None,
+                         current_term: bool = False,
                          **kwargs: Any) -> list[BBCourse]:
-        """Fetch all the user's courses and their details"""
+        """Fetch all the user's courses and their details
+
+        :param result_filter: Filters the memberships of the user
+        :param term_ids: Only courses of these terms
+        :param current_term: Only courses whose term is current,
+            courses without a term are left out
+        """
         courses = []
 
         memberships = self.fetch_user_memberships(**kwargs)
@@ -62,4 +178,857 @@ class BlackboardExtended(BlackboardSession):
                     course = course.model_copy(update={'created': ms.created})
                     courses.append(course)
 
+        if term_ids is not None:
+            wanted = set(term_ids)
+            courses = [c for c in courses if c.termId in wanted]
+
+        if current_term:
+            terms = self.terms.resolve(c.termId for c in courses)
+            courses = [c for c in courses if c.termId in terms and
+                       terms[c.termId].is_current()]
+
         return courses
+
+    def ex_group_courses_by_term(self, courses: Iterable[BBCourse]
+                                 ) -> dict[str | None, list[BBCourse]]:
+        """Group courses by term, the most recent terms first.
+
+        Terms are looked up through `terms`, once each. Courses
+        without a term are grouped under `None`, last.
+
+        :param courses: Courses, e.g. from `ex_fetch_courses`
+        """
+        groups: dict[str | None, list[BBCourse]] = {}
+        for course in courses:
+            groups.setdefault(course.termId, []).append(course)
+
+        terms = self.terms.resolve(groups)
+
+        def start(term_id: str | None) -> datetime:
+            term = terms.get(term_id) if term_id is not None else None
+            if term is None or term.availability is None or \
+                    term.availability.duration is None:
+                return _NO_DATE
+            return term.availability.duration.start or _NO_DATE
+
+        order = sorted(groups, key=start, reverse=True)
+        order.sort(key=lambda t: t is None)
+        return {t: groups[t] for t in order}
+
+    def _download_attendance(self, course_id: str,
+                             matrix: BBAttendanceMatrix) -> bool:
+        """Fill in attendance from the bulk download, if possible."""
+        try:
+            download = self.fetch_attendance_data_download_url(
+                course_id=course_id
+            )
+            url = urljoin(self.instance_url, download['downloadUrl'])
+            response = self.download_webdav(webdav_url=url)
+        except (BBStatusError, KeyError, TypeError) as e:
+            logger.info(f"Attendance download unavailable: {e!r}")
+            return False
+
+        with response:
+            response.encoding = response.encoding or 'utf-8'
+            records = parse_attendance_csv(
+                response.iter_lines(decode_unicode=True)
+            )
+
+            if records is None:
+                logger.info("Attendance download format not recognised")
+                return False
+
+            matrix.add_records(records)
+        return True
+
+    @staticmethod
+    def _fetch_pages(fetch: Callable[..., Any], page_size: int,
+                     **route: str) -> Iterator[Any]:
+        """Page through a listing with offset and limit parameters.
+
+        :param fetch: An API method returning a page of results
+        :param route: Route parameters of the method
+        """
+        offset = 0
+        largest = 0
+
+        while True:
+            # Keyword arguments other than route parameters go to requests
+            page = fetch(**route, params={'offset': offset,
+                                          'limit': page_size})
+            yield from page
+
+            # The server may cap the page size below the one requested,
+            # so only a page shorter than an earlier one is the last
+            if not page or len(page) < largest:
+                return
+            largest = max(largest, len(page))
+            offset += len(page)
+
+    def ex_fetch_attendance(self, course_id: str, *,
+                            max_workers: int = 8,
+                            use_download: bool = True,
+                            page_size: int = 100
+                            ) -> BBAttendanceMatrix:
+        """Fetch the attendance of every user in every meeting of a
+        course.
+
+        The bulk attendance download is preferred, otherwise records
+        are fetched with one concurrent request per meeting.
+
+        :param course_id: The course or organization ID.
+        :param max_workers: Maximum number of concurrent requests
+        :param use_download: Try the bulk attendance download first
+        :param page_size: Meetings or records requested per page
+        """
+        meetings = [BBMeeting(**m) for m in self._fetch_pages(
+            self.fetch_course_meetings, page_size, course_id=course_id
+        )]
+        matrix = BBAttendanceMatrix(m.id for m in meetings)
+
+        if use_download and self._download_attendance(course_id, matrix):
+            return matrix
+
+        def fetch(meeting: BBMeeting) -> list[BBAttendanceRecord]:
+            return [BBAttendanceRecord(**r) for r in self._fetch_pages(
+                self.fetch_attendance_records_by_meeting_id, page_size,
+                course_id=course_id, meeting_id=str(meeting.id)
+            )]
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetch, m) for m in meetings]
+
+            for future in as_completed(futures):
+                matrix.add_records(future.result())
+
+        return matrix
+
+    def ex_list_webdav_tree(self, webdav_url: str, *,
+                            max_workers: int = 8,
+                            failed: dict[Path, BaseException] | None = None,
+                            planner: LayoutPlanner | None = None
+                            ) -> list[tuple[Path, str, BBWebDAVEntry]]:
+        """List every file below a webdav folder.
+
+        Folders are listed level by level, concurrently. Siblings whose
+        names collide once sanitized are given unique local names.
+
+        :param webdav_url: The URL of the folder
+        :param max_workers: Maximum number of concurrent requests
+        :param failed: If given, folders that cannot be listed are
+            recorded here by relative path and skipped, instead of
+            raising
+        :param planner: Assigns unique local names below its root
+        :returns: The local relative path, URL and entry of each file
+        """
+        planner = planner or LayoutPlanner()
+        files = []
+        folders = [(webdav_url, planner.root)]
+        seen = {webdav_url.rstrip('/')}
+
+        def list_folder(url: str) -> list[BBWebDAVEntry]:
+            return self.list_webdav(webdav_url=url)
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            while folders:
+                listings = [(url, local, executor.submit(list_folder, url))
+                            for url, local in folders]
+                folders = []
+
+                for folder_url, folder, future in listings:
+                    try:
+                        entries = future.result()
+                    except (BBStatusError, requests.RequestException,
+                            ParseError) as e:
+                        if failed is None:
+                            raise
+                        logger.warning(f"Could not list {folder_url}: {e!r}")
+                        failed[folder.relative_to(planner.root)] = e
+                        continue
+
+                    children = []
+                    for entry in entries:
+                        url = urljoin(folder_url.rstrip('/') + '/',
+                                      entry.href)
+                        path = relative_path(webdav_url, url)
+
+                        if path is None or url.rstrip('/') in seen:
+                            continue
+                        seen.add(url.rstrip('/'))
+                        children.append((url, path.name, entry))
+
+                    # Sorted, so each mirror gives the same names
+                    children.sort(key=lambda c: c[0])
+                    placed = planner.place_files(
+                        folder, ((url, name) for url, name, _ in children)
+                    )
+
+                    for url, _, entry in children:
+                        if entry.isCollection:
+                            folders.append((url, placed[url]))
+                        else:
+                            files.append((
+                                placed[url].relative_to(planner.root),
+                                url, entry
+                            ))
+
+        return files
+
+    def ex_mirror_webdav(self, webdav_url: str,
+                         destination: str | os.PathLike[str], *,
+                         max_workers: int = 8,
+                         planner: LayoutPlanner | None = None,
+                         sink: DownloadSink | None = None) -> MirrorReport:
+        """Mirror a webdav folder into a local directory.
+
+        Only files whose size, ETag or modification date changed
+        since the last mirror are downloaded. Folders that cannot be
+        listed are reported as failed, and the rest is mirrored.
+
+        :param webdav_url: The URL of the folder
+        :param destination: The local directory
+        :param max_workers: Maximum number of concurrent requests
+        :param planner: Assigns unique local names to the files
+        :param sink: Writes the downloaded files
+        """
+        destination = Path(destination)
+        planner = planner or LayoutPlanner(destination)
+        sink = sink or DownloadSink()
+        destination.mkdir(parents=True, exist_ok=True)
+        manifest = WebDAVManifest(destination)
+        report = MirrorReport()
+        pending = []
+
+        for path, url, entry in self.ex_list_webdav_tree(
+                webdav_url, max_workers=max_workers, failed=report.failed,
+                planner=planner):
+            if manifest.is_current(destination / path, path, entry):
+                report.unchanged.append(path)
+            else:
+                pending.append((path, url, entry))
+
+        def fetch(path: Path, url: str, entry: BBWebDAVEntry) -> None:
+            local = destination / path
+            sink.write(self.download_webdav(webdav_url=url), local)
+
+            if entry.lastModified is not None:
+                mtime = entry.lastModified.timestamp()
+                os.utime(local, (mtime, mtime))
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch, *p): p for p in pending}
+
+            for future in as_completed(futures):
+                path, _, entry = futures[future]
+
+                if (e := future.exception()) is not None:
+                    logger.warning(f"Could not mirror {path}: {e!r}")
+                    report.failed[path] = e
+                    continue
+
+                manifest.update(path, entry)
+                report.downloaded.append(path)
+
+        manifest.save()
+        return report
+
+    def _list_contents(self, course_id: str,
+                       content_id: str | None) -> list[BBCourseContent]:
+        """List the top level of a course, or the children of a content."""
+        if content_id is None:
+            return self.fetch_contents(course_id=course_id)
+        return self.fetch_content_children(course_id=course_id,
+                                           content_id=content_id)
+
+    def _fetch_attachments(self, course_id: str,
+                           content: BBCourseContent) -> list[BBAttachment]:
+        try:
+            attachments = self.fetch_file_attachments(
+                course_id=course_id, content_id=content.id
+            )
+        except BBForbiddenError:
+            logger.warning(f"Attachments of {content.id} are not available")
+            return []
+        assert isinstance(attachments, list)
+        return attachments
+
+    def _join_attachments(self, course_id: str,
+                          contents: list[BBCourseContent],
+                          executor: ContextExecutor
+                          ) -> list[BBContentEntry]:
+        """Join contents with their attachments, looked up concurrently."""
+        futures = [
+            executor.submit(self._fetch_attachments, course_id, c)
+            if c.contentHandler == BBResourceType.File else None
+            for c in contents
+        ]
+        return [BBContentEntry(content=c,
+                               attachments=f.result() if f else [])
+                for c, f in zip(contents, futures)]
+
+    def ex_fetch_children_attachments(self, course_id: str,
+                                      content_id: str | None = None, *,
+                                      max_workers: int = 8
+                                      ) -> list[BBContentEntry]:
+        """List the children of a content joined with their attachments.
+
+        The attachments of every file are fetched concurrently.
+
+        :param course_id: The course or organization ID.
+        :param content_id: The Content ID, the top level if `None`
+        :param max_workers: Maximum number of concurrent requests
+        """
+        contents = self._list_contents(course_id, content_id)
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            return self._join_attachments(course_id, contents, executor)
+
+    def ex_walk_content_attachments(self, course_id: str, *,
+                                    prefetch: int = 2,
+                                    max_workers: int = 8
+                                    ) -> Iterator[tuple[str | None,
+                                                        list[BBContentEntry]]]:
+        """Walk the content tree of a course, breadth-first.
+
+        Each folder is yielded joined with the attachments of its
+        files. While the caller processes a folder, the next ones
+        are fetched in the background.
+
+        :param course_id: The course or organization ID.
+        :param prefetch: Number of folders fetched ahead of the caller
+        :param max_workers: Maximum number of concurrent attachment
+            requests
+        :returns: Pairs of folder ID, `None` for the top level, and its
+            children
+        """
+        def fetch(content_id: str | None) -> list[BBContentEntry]:
+            try:
+                contents = self._list_contents(course_id, content_id)
+            except BBForbiddenError:
+                logger.warning(f"Contents of {content_id} are not available")
+                return []
+            return self._join_attachments(course_id, contents, attachments)
+
+        # Listings wait on attachment lookups, so they use separate pools
+        folders = ContextExecutor(max_workers=prefetch + 1)
+        attachments = ContextExecutor(max_workers=max_workers)
+        pending: deque[str | None] = deque([None])
+        in_flight: deque[tuple[str | None, Future[list[BBContentEntry]]]] \
+            = deque()
+
+        def fill() -> None:
+            while pending and len(in_flight) < prefetch + 1:
+                content_id = pending.popleft()
+                in_flight.append((content_id,
+                                  folders.submit(fetch, content_id)))
+
+        try:
+            fill()
+            while in_flight:
+                content_id, future = in_flight.popleft()
+                entries = future.result()
+                pending.extend(e.content.id for e in entries
+                               if e.content.hasChildren)
+                # Start on the next folders before handing this one over
+                fill()
+                yield content_id, entries
+        finally:
+            folders.shutdown(cancel_futures=True)
+            attachments.shutdown(cancel_futures=True)
+
+    def _fetch_node(self, node_id: str
+                    ) -> tuple[list[BBNode], list[BBNodeCourse]]:
+        """Fetch the children and course associations of a node."""
+        children = self.fetch_node_children(node_id=node_id)
+        try:
+            courses = self.fetch_node_course_associations(node_id=node_id)
+        except BBForbiddenError:
+            logger.warning(f"Courses of node {node_id} are not available")
+            courses = []
+        return ([BBNode(**n) for n in children],
+                [BBNodeCourse(**c) for c in courses])
+
+    def ex_fetch_hierarchy(self, *, max_workers: int = 8,
+                           cache: str | os.PathLike[str] | None = None,
+                           max_age: float | None = None) -> BBHierarchy:
+        """Fetch the whole institutional hierarchy.
+
+        Nodes are fetched concurrently as they are discovered.
+
+        :param max_workers: Maximum number of concurrent requests
+        :param cache: JSON file where the hierarchy is kept
+        :param max_age: Seconds before the cache is refreshed, it is
+            never refreshed if `None`
+        """
+        if cache is not None and os.path.exists(cache):
+            age = time.time() - os.path.getmtime(cache)
+            if max_age is None or age < max_age:
+                try:
+                    return BBHierarchy.load(cache)
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Ignoring hierarchy cache: {e!r}")
+
+        hierarchy = BBHierarchy()
+
+        for node in self.fetch_nodes():
+            hierarchy.add_node(BBNode(**node))
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._fetch_node, n.id): n.id
+                       for n in hierarchy.roots}
+
+            while futures:
+                completed, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in completed:
+                    node_id = futures.pop(future)
+                    children, courses = future.result()
+                    hierarchy.add_courses(courses)
+
+                    for child in children:
+                        if child.id not in hierarchy:
+                            hierarchy.add_node(child, node_id)
+                            futures[executor.submit(self._fetch_node,
+                                                    child.id)] = child.id
+
+        if cache is not None:
+            hierarchy.save(cache)
+        return hierarchy
+
+    def _fetch_category(self, category_type: str, category_id: str
+                        ) -> tuple[list[BBCategory], list[BBCategoryCourse]]:
+        """Fetch the children and courses of a catalog category."""
+        children = self.fetch_child_categories(category_type=category_type,
+                                               parent_id=category_id)
+        courses = self.fetch_memberships(category_type=category_type,
+                                         category_id=category_id)
+        return ([BBCategory(**c) for c in children],
+                [BBCategoryCourse(**c) for c in courses])
+
+    def ex_fetch_catalog(self, *,
+                         category_types: Iterable[str] = CATEGORY_TYPES,
+                         max_workers: int = 8) -> dict[str, BBCatalog]:
+        """Fetch the category trees of the course catalog.
+
+        Every category type is fetched at once, and categories are
+        fetched concurrently as they are discovered.
+
+        :param category_types: The category types to fetch
+        :param max_workers: Maximum number of concurrent requests
+        :returns: The catalog of each category type
+        """
+        catalogs = {t: BBCatalog(t) for t in category_types}
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            listings = {
+                t: executor.submit(self.fetch_category, category_type=t)
+                for t in catalogs
+            }
+            futures: dict[Future[tuple[list[BBCategory],
+                                       list[BBCategoryCourse]]],
+                          tuple[str, str]] = {}
+
+            for category_type, listing in listings.items():
+                catalog = catalogs[category_type]
+
+                for category in listing.result():
+                    catalog.add_category(BBCategory(**category))
+
+                for category in catalog:
+                    key = (category_type, category.id)
+                    futures[executor.submit(self._fetch_category,
+                                            *key)] = key
+
+            while futures:
+                completed, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in completed:
+                    category_type, category_id = futures.pop(future)
+                    catalog = catalogs[category_type]
+                    children, courses = future.result()
+                    catalog.add_courses(courses)
+
+                    for child in children:
+                        if child.id not in catalog:
+                            catalog.add_category(child, category_id)
+                            key = (category_type, child.id)
+                            futures[executor.submit(self._fetch_category,
+                                                    *key)] = key
+
+        return catalogs
+
+    def _fetch_cross_list_parent(self, course_id: str) -> str:
+        """Look up the parent course of a course, caching its set."""
+        try:
+            children = [BBCourseChild(**c) for c in
+                        self.fetch_cross_list_set(course_id=course_id)]
+        except BBForbiddenError:
+            logger.warning(f"Cross-listing of {course_id} is not available")
+            return course_id
+
+        for child in children:
+            self._cross_list_parents[child.id] = child.parentId
+            self._cross_list_parents[child.parentId] = child.parentId
+
+        return self._cross_list_parents.setdefault(course_id, course_id)
+
+    def ex_resolve_cross_lists(self, courses: Iterable[str | BBMembership],
+                               *, max_workers: int = 8) -> dict[str, str]:
+        """Map courses to the parent course of their cross-list set.
+
+        The content of a cross-listed course lives in its parent, so
+        it only needs to be fetched once for the whole set. Parents
+        are known from memberships when possible, otherwise sets are
+        fetched concurrently. Sets are cached for the session.
+
+        :param courses: Course IDs or memberships
+        :param max_workers: Maximum number of concurrent requests
+        :returns: The parent of each course, itself if not cross-listed
+        """
+        course_ids = []
+
+        for course in courses:
+            if isinstance(course, BBMembership):
+                if course.childCourseId is not None:
+                    self._cross_list_parents[course.childCourseId] = \
+                        course.courseId
+                    self._cross_list_parents[course.courseId] = \
+                        course.courseId
+                    course_ids.append(course.childCourseId)
+                    continue
+                course = course.courseId
+            course_ids.append(course)
+
+        course_ids = list(dict.fromkeys(course_ids))
+        unknown = [c for c in course_ids if c not in self._cross_list_parents]
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            # Results are stored in the cache
+            list(executor.map(self._fetch_cross_list_parent, unknown))
+
+        return {c: self._cross_list_parents.get(c, c) for c in course_ids}
+
+    def ex_group_cross_lists(self, courses: Iterable[str | BBMembership],
+                             *, max_workers: int = 8
+                             ) -> dict[str, list[str]]:
+        """Group courses by the parent course of their cross-list set.
+
+        :param courses: Course IDs or memberships
+        :param max_workers: Maximum number of concurrent requests
+        :returns: The given courses that share each parent
+        """
+        groups: dict[str, list[str]] = {}
+        parents = self.ex_resolve_cross_lists(courses,
+                                              max_workers=max_workers)
+
+        for course_id, parent_id in parents.items():
+            groups.setdefault(parent_id, []).append(course_id)
+        return groups
+
+    def _fetch_group_members(self, course_id: str, group_id: str
+                             ) -> list[BBGroupMembership]:
+        try:
+            memberships = self.fetch_group_memberships(course_id=course_id,
+                                                       group_id=group_id)
+        except BBForbiddenError:
+            logger.warning(f"Members of group {group_id} are not available")
+            return []
+        return [BBGroupMembership(**{'groupId': group_id, **m})
+                for m in memberships]
+
+    def ex_fetch_groups(self, course_id: str, *,
+                        max_workers: int = 8) -> BBGroupRoster:
+        """Fetch the groups of a course and their members.
+
+        Group sets, their groups and the members of every group are
+        fetched concurrently.
+
+        :param course_id: The course or organization ID.
+        :param max_workers: Maximum number of concurrent requests
+        """
+        roster = BBGroupRoster(course_id)
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            top_level = executor.submit(self.fetch_groups,
+                                        course_id=course_id)
+            sets = [BBGroup(**g) for g in
+                    self.fetch_group_sets(course_id=course_id)]
+
+            set_ids = {s.id for s in sets}
+
+            for group_set in sets:
+                roster.add_set(group_set)
+
+            set_groups = executor.map(
+                lambda s: self.fetch_group_set_children(
+                    course_id=course_id, group_id=s.id
+                ),
+                sets
+            )
+
+            for listing in (top_level.result(), *set_groups):
+                for group in listing:
+                    # Top-level listings may include the sets themselves
+                    if group['id'] not in set_ids:
+                        roster.add_group(BBGroup(**group))
+
+            futures = {executor.submit(self._fetch_group_members,
+                                       course_id, g.id): g.id
+                       for g in roster}
+
+            for future in as_completed(futures):
+                roster.add_members(futures[future], future.result())
+
+        return roster
+
+    def _fetch_announcements(self, course_id: str,
+                             since: datetime | None
+                             ) -> list[BBAnnouncement]:
+        """Fetch the announcements of a course posted after a time,
+        newest first."""
+        try:
+            listing = self.fetch_course_announcements(course_id=course_id)
+        except BBForbiddenError:
+            logger.warning(f"Announcements of {course_id} are not available")
+            return []
+
+        announcements = [BBAnnouncement(**a, courseId=course_id)
+                         for a in listing]
+        if since is not None:
+            announcements = [a for a in announcements if _posted(a) > since]
+        return sorted(announcements, key=_posted, reverse=True)
+
+    def ex_fetch_announcements(self, course_ids: Iterable[str], *,
+                               since: datetime | None = None,
+                               new_only: bool = False,
+                               limit: int | None = None,
+                               max_workers: int = 8
+                               ) -> list[BBAnnouncement]:
+        """Fetch the announcements of many courses as a single feed.
+
+        Courses are fetched concurrently, and their announcements
+        merged newest first. The announcements returned from each course
+        are remembered by the session, so that later calls can return
+        only what is new.
+
+        :param course_ids: The course or organization IDs.
+        :param since: Only announcements posted or edited after this
+            time, which must be timezone aware
+        :param new_only: Only announcements not returned by a previous
+            call, or edited since
+        :param limit: Maximum number of announcements returned
+        :param max_workers: Maximum number of concurrent requests
+        """
+        course_ids = list(dict.fromkeys(course_ids))
+        marks = [self._announcement_marks.setdefault(c, _AnnouncementMark())
+                 for c in course_ids]
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            listings = list(executor.map(
+                lambda c: self._fetch_announcements(c, since), course_ids
+            ))
+
+        news = [[a for a in listing if mark.is_new(a)]
+                for mark, listing in zip(marks, listings)]
+        if new_only:
+            listings = news
+
+        # Every listing is sorted already, so they are merged lazily
+        feed = list(itertools.islice(
+            heapq.merge(*listings, key=_posted, reverse=True), limit
+        ))
+
+        # Only what was returned counts as seen, so a limited feed
+        # leaves the rest for the next call
+        returned = {(a.courseId, a.id, _posted(a)) for a in feed}
+        for course_id, mark, new in zip(course_ids, marks, news):
+            if new:
+                mark.advance(new, {(i, p) for c, i, p in returned
+                                   if c == course_id})
+        return feed
+
+    def _fetch_course_reviews(self, course_id: str,
+                              page_size: int) -> Iterator[BBReviewStatus]:
+        """Page through the review statuses of a whole course."""
+        return (BBReviewStatus(**r) for r in self._fetch_pages(
+            self.fetch_performance_review_status, page_size,
+            course_id=course_id
+        ))
+
+    def _fetch_item_review(self, course_id: str, content_id: str,
+                           user_id: str) -> BBReviewStatus | None:
+        try:
+            status = self.fetch_review_status(
+                course_id=course_id, content_id=content_id, user_id=user_id
+            )
+        except BBUnauthorizedError:
+            raise
+        except BBStatusError:
+            # The content item is not reviewable
+            return None
+        return BBReviewStatus(contentId=content_id, userId=user_id,
+                              **status)
+
+    def ex_fetch_review_progress(self, course_id: str,
+                                 content_ids: Iterable[str] | None = None,
+                                 *, user_ids: Iterable[str] | None = None,
+                                 page_size: int = 100,
+                                 max_workers: int = 8) -> BBReviewIndex:
+        """Fetch which users have reviewed which content items.
+
+        The statuses of the whole course are listed page by page,
+        which needs access to the performance dashboard. Otherwise,
+        as for students, each item is checked for each user with
+        concurrent requests.
+
+        :param course_id: The course or organization ID.
+        :param content_ids: Only these content items, required if
+            items have to be checked one by one
+        :param user_ids: Only these users, by default the current
+            user if items have to be checked one by one
+        :param page_size: Statuses requested per page
+        :param max_workers: Maximum number of concurrent requests
+        """
+        contents = None if content_ids is None else list(content_ids)
+        users = None if user_ids is None else list(user_ids)
+        index = BBReviewIndex(course_id)
+
+        try:
+            statuses = list(self._fetch_course_reviews(course_id, page_size))
+        except BBUnauthorizedError:
+            raise
+        except BBStatusError:
+            if contents is None:
+                raise
+            logger.info(f"Checking the review status of {course_id} "
+                        "item by item")
+        else:
+            wanted_contents = None if contents is None else set(contents)
+            wanted_users = None if users is None else set(users)
+
+            for status in statuses:
+                if (wanted_contents is None or
+                        status.contentId in wanted_contents) and \
+                        (wanted_users is None or
+                         status.userId in wanted_users):
+                    index.add(status)
+            return index
+
+        pairs = [(c, u) for c in contents for u in users or [self.user_id]]
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            for item in executor.map(
+                    lambda p: self._fetch_item_review(course_id, *p), pairs):
+                if item is not None:
+                    index.add(item)
+
+        return index
+
+    def _fetch_avatar(self, user_id: str, cache: AvatarCache,
+                      max_age: float) -> Path | None:
+        cached = cache.lookup(user_id)
+
+        if cached is not None and time.time() - cached.checked < max_age:
+            return cache.path(cached)
+
+        # Keyword arguments other than route parameters go to requests
+        conditional: dict[str, Any] = {}
+        if cached is not None and cached.etag is not None:
+            conditional['headers'] = {'If-None-Match': cached.etag}
+
+        try:
+            response = self.fetch_avatar(user_id=user_id, **conditional)
+        except requests.RequestException as e:
+            logger.warning(f"Could not fetch avatar of {user_id}: {e!r}")
+            return cache.path(cached) if cached is not None else None
+
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            return cache.path(cache.touch(cached))
+        if response.status_code == 404:
+            response.close()
+            cache.remove(user_id)
+            return None
+        if not response.ok:
+            response.close()
+            logger.warning(f"Could not fetch avatar of {user_id}: "
+                           f"{response.status_code}")
+            return cache.path(cached) if cached is not None else None
+
+        try:
+            return cache.path(cache.store(user_id, response))
+        except (requests.RequestException, OSError) as e:
+            logger.warning(f"Could not store avatar of {user_id}: {e!r}")
+            return cache.path(cached) if cached is not None else None
+
+    def ex_fetch_avatars(self, user_ids: Iterable[str],
+                         cache: AvatarCache | str | os.PathLike[str], *,
+                         max_age: float = 3600,
+                         max_workers: int = 8) -> dict[str, Path | None]:
+        """Fetch the avatars of many users into a disk cache.
+
+        Avatars are fetched concurrently. Cached ones are used as
+        they are for a while, and then revalidated with their ETag,
+        so unchanged images are not downloaded again.
+
+        :param user_ids: The user IDs.
+        :param cache: The cache, or a directory for one
+        :param max_age: Seconds a cached avatar is used without
+            revalidating it
+        :param max_workers: Maximum number of concurrent requests
+        :returns: The image file of each user, `None` if they have no
+            avatar or it could not be fetched
+        """
+        if not isinstance(cache, AvatarCache):
+            cache = AvatarCache(cache)
+
+        ids = list(dict.fromkeys(user_ids))
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            paths = executor.map(
+                lambda u: self._fetch_avatar(u, cache, max_age), ids
+            )
+            return dict(zip(ids, paths))
+
+    def ex_download_embedded(self, contents: Iterable[BBCourseContent],
+                             destination: str | os.PathLike[str], *,
+                             max_workers: int = 8,
+                             planner: LayoutPlanner | None = None,
+                             sink: DownloadSink | None = None
+                             ) -> tuple[list[EmbeddedFile], MirrorReport]:
+        """Download the files embedded in the bodies of contents.
+
+        Every file is downloaded once, even if many contents embed it.
+
+        :param contents: Contents of one or more crawled trees
+        :param destination: The local directory
+        :param max_workers: Maximum number of concurrent requests
+        :param planner: Assigns unique local names to the files
+        :param sink: Writes the downloaded files
+        :returns: The embedded files and the outcome of each download
+        """
+        destination = Path(destination)
+        planner = planner or LayoutPlanner(destination)
+        sink = sink or DownloadSink()
+        files = find_embedded_files(contents, self.instance_url)
+        paths = planner.place_files(destination,
+                                    ((f.url, f.name) for f in files))
+        report = MirrorReport()
+
+        def fetch(file: EmbeddedFile) -> None:
+            sink.write(self.download_webdav(webdav_url=file.url),
+                       paths[file.url])
+
+        with ContextExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch, f): f for f in files}
+
+            for future in as_completed(futures):
+                path = paths[futures[future].url]
+
+                if (e := future.exception()) is not None:
+                    logger.warning(f"Could not download {path}: {e!r}")
+                    report.failed[path] = e
+                else:
+                    report.downloaded.append(path)
+
+        return files, report
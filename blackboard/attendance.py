@@ -0,0 +1,164 @@
+"""
+Blackboard Attendance
+
+a compact meeting by user attendance matrix.
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import csv
+from typing import TextIO
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
+from .blackboard import BBAttendanceRecord, BBAttendanceStatus
+
+# Cells store the index of the status plus one, zero means no record
+_STATUSES = tuple(BBAttendanceStatus)
+_CODES = {status: i + 1 for i, status in enumerate(_STATUSES)}
+
+
+def _csv_status(status: BBAttendanceStatus | None) -> str:
+    # Unknown statuses are not kept, so they are left blank too
+    if status is None or status == BBAttendanceStatus.Other:
+        return ''
+    return str(status.value)
+
+
+class BBAttendanceMatrix:
+    """Attendance of every user in every meeting of a course.
+
+    Each cell takes a single byte, so records can be streamed in
+    for large courses without keeping the record models around.
+    """
+
+    def __init__(self, meeting_ids: Iterable[int | str] = ()):
+        """
+        :param meeting_ids: Meetings to include even without records
+        """
+        self._meetings: dict[str, int] = {}
+        self._users: dict[str, int] = {}
+        self._rows: list[bytearray] = []
+
+        for meeting_id in meeting_ids:
+            self._meeting_index(str(meeting_id))
+
+    def _meeting_index(self, meeting_id: str) -> int:
+        index = self._meetings.get(meeting_id)
+        if index is None:
+            index = self._meetings[meeting_id] = len(self._rows)
+            self._rows.append(bytearray())
+        return index
+
+    def _user_index(self, user_id: str) -> int:
+        index = self._users.get(user_id)
+        if index is None:
+            index = self._users[user_id] = len(self._users)
+        return index
+
+    @property
+    def meetings(self) -> list[str]:
+        """Meeting ids, in the order they were added."""
+        return list(self._meetings)
+
+    @property
+    def users(self) -> list[str]:
+        """User ids, in the order they were added."""
+        return list(self._users)
+
+    def add(self, meeting_id: int | str, user_id: str,
+            status: BBAttendanceStatus) -> None:
+        """Record the attendance of a user in a meeting."""
+        row = self._rows[self._meeting_index(str(meeting_id))]
+        column = self._user_index(user_id)
+
+        if len(row) <= column:
+            row.extend(bytes(column - len(row) + 1))
+        row[column] = _CODES[status]
+
+    def add_records(self, records: Iterable[BBAttendanceRecord]) -> None:
+        """Record the attendance of many users."""
+        for r in records:
+            self.add(r.meetingId, r.userId,
+                     r.status or BBAttendanceStatus.Other)
+
+    def get(self, meeting_id: int | str,
+            user_id: str) -> BBAttendanceStatus | None:
+        """Return the attendance of a user in a meeting, if recorded."""
+        m = self._meetings.get(str(meeting_id))
+        u = self._users.get(user_id)
+
+        if m is None or u is None or u >= len(self._rows[m]):
+            return None
+
+        code = self._rows[m][u]
+        return _STATUSES[code - 1] if code else None
+
+    def counts(self, meeting_id: int | str) -> Counter[BBAttendanceStatus]:
+        """Count the attendance statuses recorded for a meeting."""
+        m = self._meetings.get(str(meeting_id))
+        if m is None:
+            return Counter()
+        return Counter(_STATUSES[c - 1] for c in self._rows[m] if c)
+
+    def __len__(self) -> int:
+        """Number of attendance records."""
+        return sum(len(row) - row.count(0) for row in self._rows)
+
+    def write_csv(self, fp: TextIO) -> None:
+        """Write the matrix as CSV, with a row per user and a column
+        per meeting. Cells without a record or with an unknown status
+        are empty.
+
+        :param fp: A text file opened with `newline=''`
+        """
+        writer = csv.writer(fp)
+        writer.writerow(['userId', *self._meetings])
+
+        for user_id in self._users:
+            writer.writerow([user_id, *(
+                _csv_status(self.get(m, user_id)) for m in self._meetings
+            )])
+
+
+def parse_attendance_csv(lines: Iterable[str]
+                         ) -> Iterator[BBAttendanceRecord] | None:
+    """Parse an attendance download with a row per record.
+
+    Returns `None` when the file does not have a `meetingId`,
+    `userId` and `status` column, as the download format is not
+    part of the documented API.
+
+    :param lines: Lines of the downloaded file
+    """
+    reader = csv.reader(lines)
+    header = [h.strip().casefold() for h in next(reader, [])]
+
+    try:
+        m = header.index('meetingid')
+        u = header.index('userid')
+        s = header.index('status')
+    except ValueError:
+        return None
+
+    width = max(m, u, s)
+
+    return (
+        BBAttendanceRecord(meetingId=row[m], userId=row[u], status=row[s])
+        for row in reader if len(row) > width
+    )
@@ -0,0 +1,150 @@
+"""
+Blackboard Avatars
+
+a disk cache of user avatars, revalidated with their ETags.
+
+Basic usage:
+    >>> cache = AvatarCache('~/.cache/bblearn/avatars')
+    >>> paths = session.ex_fetch_avatars(user_ids, cache)
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import mimetypes
+from pathlib import Path
+from dataclasses import dataclass, asdict, replace
+
+import requests
+
+from .sink import DownloadSink
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CachedAvatar:
+    """An avatar stored on disk."""
+    user_id: str
+    #: Name of the image file in the cache directory
+    file_name: str
+    etag: str | None = None
+    content_type: str | None = None
+    #: Time it was last fetched or revalidated
+    checked: float = 0.0
+
+
+class AvatarCache:
+    """Avatar images of users, kept in a directory.
+
+    Each user has a small metadata file next to their image, so any
+    number of threads and processes may use the same directory.
+    Images are named after the user and ETag, and replaced when the
+    ETag changes.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], *,
+                 sink: DownloadSink | None = None):
+        """
+        :param directory: Where avatars are stored, created if missing
+        :param sink: Writes the images
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._sink = sink or DownloadSink(buffer_size=64 * 1024)
+
+    def _meta_path(self, user_id: str) -> Path:
+        return self.directory / f"{_digest(user_id)}.json"
+
+    def path(self, avatar: CachedAvatar) -> Path:
+        """The image file of an avatar."""
+        return self.directory / avatar.file_name
+
+    def lookup(self, user_id: str) -> CachedAvatar | None:
+        """The avatar of a user, if it is cached."""
+        try:
+            with self._meta_path(user_id).open(encoding='utf-8') as f:
+                avatar = CachedAvatar(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Discarding cached avatar of {user_id}: {e!r}")
+            return None
+
+        return avatar if self.path(avatar).exists() else None
+
+    def _save(self, avatar: CachedAvatar) -> None:
+        """Write the metadata of an avatar atomically."""
+        path = self._meta_path(avatar.user_id)
+        fd, tmp = tempfile.mkstemp(dir=self.directory,
+                                   prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(asdict(avatar), f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def store(self, user_id: str,
+              response: requests.Response) -> CachedAvatar:
+        """Store the image of a response as the avatar of a user.
+
+        :param response: A streamed, successful response
+        """
+        etag = response.headers.get('ETag')
+        content_type = response.headers.get('Content-Type', '') \
+            .split(';')[0].strip() or None
+        ext = mimetypes.guess_extension(content_type or '') or ''
+        avatar = CachedAvatar(
+            user_id=user_id,
+            file_name=f"{_digest(user_id)}-{_digest(etag or '')}{ext}",
+            etag=etag,
+            content_type=content_type,
+            checked=time.time()
+        )
+
+        previous = self.lookup(user_id)
+        self._sink.write(response, self.path(avatar))
+        self._save(avatar)
+
+        if previous is not None and previous.file_name != avatar.file_name:
+            self.path(previous).unlink(missing_ok=True)
+        return avatar
+
+    def touch(self, avatar: CachedAvatar) -> CachedAvatar:
+        """Record that an avatar is still current."""
+        avatar = replace(avatar, checked=time.time())
+        self._save(avatar)
+        return avatar
+
+    def remove(self, user_id: str) -> None:
+        """Forget the avatar of a user."""
+        avatar = self.lookup(user_id)
+        if avatar is not None:
+            self.path(avatar).unlink(missing_ok=True)
+        self._meta_path(user_id).unlink(missing_ok=True)
@@ -21,12 +21,30 @@ Blackboard Model Classes
 
 from enum import Enum
 from typing import Any
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 
 from pydantic import BaseModel, field_validator, ConfigDict
 from pathvalidate import sanitize_filename
 
 
+@lru_cache(maxsize=4096)
+def safe_filename(name: str) -> str:
+    """Return a path safe version of a file name.
+
+    Results are memoized, since the same titles are sanitized often.
+    """
+    return sanitize_filename(name, replacement_text='_')
+
+
+@lru_cache(maxsize=1024)
+def _split_course_name(name: str) -> tuple[str, str]:
+    """Split a course name into its code and path safe title."""
+    code_split = name.split(' : ', 1)
+    title = code_split[-1].split(',')[0]
+    return code_split[0], safe_filename(title)
+
+
 class ImmutableModel(BaseModel):
     """Model with const attributes."""
     model_config = ConfigDict(frozen=True)
@@ -52,6 +70,9 @@ class BBDurationType(str, Enum):
 
 class BBDuration(ImmutableModel):
     type: BBDurationType | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    daysOfUse: int | None = None
 
 
 class BBEnrollment(ImmutableModel):
@@ -78,6 +99,18 @@ class BBAttachment(ImmutableModel):
     mimeType: str | None = None
 
 
+class BBWebDAVEntry(ImmutableModel):
+    """A file or folder in the Blackboard content collection."""
+
+    href: str
+    displayName: str | None = None
+    isCollection: bool = False
+    contentLength: int | None = None
+    contentType: str | None = None
+    etag: str | None = None
+    lastModified: datetime | None = None
+
+
 class BBLink(ImmutableModel):
     """Blackboard Link."""
 
@@ -213,8 +246,14 @@ class BBCourseContent(ImmutableModel):
     @property
     def title_path_safe(self) -> str:
         """Return a path safe version of the title."""
-        return sanitize_filename(self.title or 'Untitled',
-                                 replacement_text='_') or 'Untitled'
+        return safe_filename(self.title or 'Untitled') or 'Untitled'
+
+
+class BBContentEntry(ImmutableModel):
+    """A content item joined with its file attachments."""
+
+    content: BBCourseContent
+    attachments: list[BBAttachment] = []
 
 
 class BBCourse(ImmutableModel):
@@ -233,19 +272,226 @@ class BBCourse(ImmutableModel):
     enrollment: BBEnrollment | None = None
     locale: BBLocale | None = None
     externalAccessUrl: str | None = None
+    termId: str | None = None
 
     @property
     def code(self) -> str | None:
         """Parse course code."""
         if self.name:
-            code_split = self.name.split(' : ', 1)
-            return code_split[0]
+            return _split_course_name(self.name)[0]
         return None
 
     @property
     def title(self) -> str | None:
         """Parse course title."""
         if self.name:
-            name_split = self.name.split(' : ', 1)[-1].split(',')
-            return sanitize_filename(name_split[0], replacement_text='_')
+            return _split_course_name(self.name)[1]
         return None
+
+
+class BBTerm(ImmutableModel):
+    """Blackboard Term. Groups courses by academic period."""
+
+    id: str
+    externalId: str | None = None
+    dataSourceId: str | None = None
+    name: str | None = None
+    description: str | None = None
+    availability: BBAvailability | None = None
+
+    def is_current(self, at: datetime | None = None) -> bool:
+        """Whether a time is within the dates of the term.
+
+        Terms without a date range are always current.
+
+        :param at: A timezone aware time, by default now
+        """
+        # Availability is falsy when unavailable, so compare with None
+        duration = self.availability.duration \
+            if self.availability is not None else None
+        if duration is None or duration.type != BBDurationType.DateRange:
+            return True
+
+        at = at or datetime.now(timezone.utc)
+        return (duration.start is None or duration.start <= at) and \
+            (duration.end is None or at <= duration.end)
+
+    def __str__(self) -> str:
+        return self.name or self.id
+
+
+class BBCourseChild(ImmutableModel):
+    """Cross-listing of a child course into a parent course."""
+
+    id: str
+    parentId: str
+    dataSourceId: str | None = None
+    created: datetime | None = None
+
+
+class BBAnnouncement(ImmutableModel):
+    """Blackboard Course Announcement."""
+
+    id: str
+    title: str | None = None
+    body: str | None = None
+    creator: str | None = None
+    draft: bool = False
+    availability: BBAvailability | None = None
+    created: datetime | None = None
+    modified: datetime | None = None
+    position: int | None = None
+    #: The course it belongs to, not part of the API object
+    courseId: str | None = None
+
+    @property
+    def posted(self) -> datetime | None:
+        """When the announcement was posted or last edited."""
+        return self.modified or self.created
+
+    def __str__(self) -> str:
+        return self.title or self.id
+
+
+class BBReviewStatus(ImmutableModel):
+    """Whether a user has marked a content item as reviewed."""
+
+    contentId: str
+    userId: str
+    isReviewed: bool = False
+    reviewDate: datetime | None = None
+
+
+class BBGroup(ImmutableModel):
+    """Blackboard Course Group or Group Set."""
+
+    id: str
+    externalId: str | None = None
+    groupSetId: str | None = None
+    name: str | None = None
+    description: str | None = None
+    availability: BBAvailability | None = None
+    created: datetime | None = None
+    modified: datetime | None = None
+
+    def __str__(self) -> str:
+        return self.name or self.id
+
+
+class BBGroupMembership(ImmutableModel):
+    """Membership of a user in a course group."""
+
+    userId: str
+    groupId: str | None = None
+    created: datetime | None = None
+
+
+class BBNode(ImmutableModel):
+    """Blackboard Institutional Hierarchy Node."""
+
+    id: str
+    externalId: str | None = None
+    title: str | None = None
+    description: str | None = None
+    parentId: str | None = None
+
+    def __str__(self) -> str:
+        return self.title or self.id
+
+
+class BBNodeCourse(ImmutableModel):
+    """Association between a hierarchy node and a course."""
+
+    nodeId: str
+    courseId: str
+    isPrimary: bool = False
+
+
+class BBCategory(ImmutableModel):
+    """Blackboard Course Catalog Category."""
+
+    id: str
+    categoryId: str | None = None
+    title: str | None = None
+    description: str | None = None
+    parentId: str | None = None
+    available: bool = True
+    frontPage: bool = False
+    restricted: bool = False
+    created: datetime | None = None
+
+    def __str__(self) -> str:
+        return self.title or self.id
+
+
+class BBCategoryCourse(ImmutableModel):
+    """Association between a catalog category and a course."""
+
+    categoryId: str
+    courseId: str
+    isDisplayed: bool = True
+
+
+class BBTaskStatus(str, Enum):
+    """Status of a background task."""
+
+    Queued = 'Queued'
+    Running = 'Running'
+    Complete = 'Complete'
+    Failed = 'Failed'
+    Other = '__bblearn_other'
+
+    @classmethod
+    def _missing_(cls, value: Any) -> 'BBTaskStatus':
+        return cls.Other
+
+    @property
+    def pending(self) -> bool:
+        """Whether the task has not finished yet."""
+        return self in (BBTaskStatus.Queued, BBTaskStatus.Running)
+
+
+class BBTask(ImmutableModel):
+    """Blackboard Background Task."""
+
+    id: str | None = None
+    type: str | None = None
+    status: BBTaskStatus | None = None
+    percentComplete: float | None = None
+    created: datetime | None = None
+    started: datetime | None = None
+
+
+class BBMeeting(ImmutableModel):
+    """Blackboard Course Meeting."""
+
+    id: int | str
+    courseId: str | None = None
+    title: str | None = None
+    description: str | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    externalLink: str | None = None
+
+
+class BBAttendanceStatus(str, Enum):
+    """Attendance status of a user in a meeting."""
+
+    Present = 'Present'
+    Late = 'Late'
+    Absent = 'Absent'
+    Excused = 'Excused'
+    Other = '__bblearn_other'
+
+    @classmethod
+    def _missing_(cls, value: Any) -> 'BBAttendanceStatus':
+        return cls.Other
+
+
+class BBAttendanceRecord(ImmutableModel):
+    """Attendance of a user in a course meeting."""
+
+    id: int | str | None = None
+    meetingId: int | str
+    userId: str
+    status: BBAttendanceStatus | None = None
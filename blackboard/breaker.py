@@ -0,0 +1,262 @@
+"""
+Blackboard Circuit Breaker
+
+stops sending requests to endpoints that keep failing.
+
+Basic usage:
+    >>> breaker = CircuitBreakerTransport(failure_threshold=5)
+    >>> session = BlackboardSession(url, cookies=..., transport=breaker)
+    >>> breaker.states()
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import re
+import time
+import logging
+import threading
+from enum import Enum
+from functools import lru_cache
+from dataclasses import dataclass, replace
+from collections.abc import Callable, Mapping
+from urllib.parse import urlsplit
+from typing import Any
+
+import requests
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from .transport import BBTransport, Timeout
+from .exceptions import BBCircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+# Path segments that identify a resource rather than an endpoint
+_ID_SEGMENT = re.compile(
+    r'_\d+_\d+|\d+|[0-9a-fA-F-]{32,36}|[A-Za-z]+:.+'
+)
+
+CircuitKey = tuple[str, str]
+
+
+class CircuitStatus(str, Enum):
+    """State of a circuit."""
+
+    Closed = 'closed'
+    Open = 'open'
+    HalfOpen = 'half-open'
+
+
+@dataclass(frozen=True)
+class CircuitState:
+    """A snapshot of a circuit, for metrics."""
+    status: CircuitStatus = CircuitStatus.Closed
+    #: Consecutive failures
+    failures: int = 0
+    #: Times the circuit has opened
+    trips: int = 0
+    #: Requests refused while open
+    rejected: int = 0
+    #: Monotonic time the circuit last opened
+    opened_at: float | None = None
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(path: str) -> str:
+    """Replace resource ids in a URL path with a placeholder.
+
+    e.g. ``/courses/_12_1/contents`` becomes ``/courses/{id}/contents``
+    """
+    if '/bbcswebdav/' in path:
+        return path[:path.index('/bbcswebdav/')] + '/bbcswebdav/*'
+
+    return '/'.join('{id}' if _ID_SEGMENT.fullmatch(s) else s
+                    for s in path.rstrip('/').split('/'))
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CircuitState()
+        self.probing = False
+        self.failed_probes = 0
+
+
+class CircuitBreakerTransport(BBTransport):
+    """Fails fast on endpoints whose requests keep failing.
+
+    Each host and endpoint template has its own circuit. A circuit
+    opens after a number of consecutive connection errors, timeouts
+    or server errors, and requests are refused with
+    `BBCircuitOpenError` while open. After a while a single probe is
+    let through: the circuit closes if it succeeds, and opens again
+    for longer if it fails.
+    """
+
+    def __init__(self, inner: BaseAdapter | None = None, *,
+                 failure_threshold: int = 5,
+                 recovery_time: float = 30.0,
+                 max_recovery_time: float = 300.0,
+                 on_change: Callable[[CircuitKey, CircuitState], Any]
+                 | None = None):
+        """
+        :param inner: The adapter that actually sends requests
+        :param failure_threshold: Consecutive failures that open a
+            circuit
+        :param recovery_time: Seconds before an open circuit is probed
+        :param max_recovery_time: Longest wait between probes, the
+            wait doubles each time a probe fails
+        :param on_change: Called with the key and new state whenever
+            a circuit changes status, without any lock held
+        """
+        super().__init__(inner)
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.max_recovery_time = max_recovery_time
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._circuits: dict[CircuitKey, _Circuit] = {}
+
+    @staticmethod
+    def key(url: str) -> CircuitKey:
+        """The circuit of a URL."""
+        parts = urlsplit(url)
+        return parts.netloc.lower(), endpoint_template(parts.path)
+
+    def _wait_time(self, circuit: _Circuit) -> float:
+        # Each failed probe doubles the wait
+        return min(self.recovery_time * 2.0 ** circuit.failed_probes,
+                   self.max_recovery_time)
+
+    def _set(self, key: CircuitKey, circuit: _Circuit,
+             **changes: Any) -> CircuitState | None:
+        """Update a circuit, with the lock held.
+
+        :returns: The new state if the status changed, to be passed
+            to `_notify` once the lock is released
+        """
+        previous = circuit.state.status
+        circuit.state = replace(circuit.state, **changes)
+
+        if circuit.state.status == previous:
+            return None
+        logger.warning(f"Circuit {key} is now {circuit.state.status}")
+        return circuit.state
+
+    def _notify(self, key: CircuitKey, state: CircuitState | None) -> None:
+        """Report a status change, without the lock held."""
+        if state is not None and self._on_change is not None:
+            self._on_change(key, state)
+
+    def _acquire(self, key: CircuitKey) -> bool:
+        """Check whether a request may be sent.
+
+        :returns: Whether the request is a probe
+        :raises BBCircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            state = circuit.state
+
+            if state.status == CircuitStatus.Closed:
+                return False
+
+            assert state.opened_at is not None
+            wait = state.opened_at + self._wait_time(circuit) \
+                - time.monotonic()
+
+            if wait > 0 or circuit.probing:
+                self._set(key, circuit, rejected=state.rejected + 1)
+                raise BBCircuitOpenError(key, max(wait, 0.0))
+
+            circuit.probing = True
+            changed = self._set(key, circuit, status=CircuitStatus.HalfOpen)
+
+        self._notify(key, changed)
+        return True
+
+    def _release(self, key: CircuitKey, probe: bool,
+                 ok: bool | None) -> None:
+        """Record the outcome of a request, `None` if unknown."""
+        changes: dict[str, Any] = {}
+        changed = None
+
+        with self._lock:
+            circuit = self._circuits[key]
+            state = circuit.state
+
+            if probe:
+                circuit.probing = False
+
+            if ok is None:
+                # Let the next request probe again
+                if probe:
+                    changes = {'status': CircuitStatus.Open}
+            elif ok:
+                if probe:
+                    circuit.failed_probes = 0
+                if state.status != CircuitStatus.Closed or state.failures:
+                    changes = {'status': CircuitStatus.Closed, 'failures': 0}
+            elif probe:
+                circuit.failed_probes += 1
+                changes = {'status': CircuitStatus.Open,
+                           'failures': state.failures + 1,
+                           'opened_at': time.monotonic()}
+            elif state.status == CircuitStatus.Closed and \
+                    state.failures + 1 >= self.failure_threshold:
+                changes = {'status': CircuitStatus.Open,
+                           'failures': state.failures + 1,
+                           'trips': state.trips + 1,
+                           'opened_at': time.monotonic()}
+            else:
+                changes = {'failures': state.failures + 1}
+
+            if changes:
+                changed = self._set(key, circuit, **changes)
+
+        self._notify(key, changed)
+
+    def send(self, request: PreparedRequest, stream: bool = False,
+             timeout: Timeout = None, verify: bool | str = True,
+             cert: Any = None, proxies: Mapping[str, str] | None = None
+             ) -> Response:
+        key = self.key(request.url or '')
+        probe = self._acquire(key)
+
+        try:
+            response = super().send(request, stream=stream, timeout=timeout,
+                                    verify=verify, cert=cert,
+                                    proxies=proxies)
+        except (requests.ConnectionError, requests.Timeout):
+            self._release(key, probe, ok=False)
+            raise
+        except BaseException:
+            self._release(key, probe, ok=None)
+            raise
+
+        self._release(key, probe, ok=response.status_code < 500)
+        return response
+
+    def states(self) -> dict[CircuitKey, CircuitState]:
+        """A snapshot of every circuit, keyed by host and endpoint."""
+        with self._lock:
+            return {k: c.state for k, c in self._circuits.items()}
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            self._circuits.clear()
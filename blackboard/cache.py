@@ -0,0 +1,281 @@
+"""
+Blackboard Response Cache
+
+a response cache shared by every process on a host.
+
+Basic usage:
+    >>> cache = ResponseCache('~/.cache/bblearn.sqlite')
+    >>> session = BlackboardSession(url, cookies=...,
+    ...                             transport=CachingTransport(cache))
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from collections.abc import Mapping
+from urllib.parse import urlsplit
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from .transport import (
+    BBTransport,
+    Interaction,
+    Timeout,
+    _build_response,
+    _filter_headers,
+    _ENCODING_HEADERS,
+    _SENSITIVE_HEADERS
+)
+
+logger = logging.getLogger(__name__)
+
+#: Seconds each response is cached for, by regular expression of the
+#: URL path. The first matching expression is used.
+DEFAULT_TTLS: dict[str, float] = {
+    r'.*/v\d+/courses/[^/]+': 3600,
+    r'.*/v\d+/terms(/[^/]+)?': 86400,
+    r'.*/v\d+/courseRoles(/[^/]+)?': 86400,
+    r'.*/v\d+/system/version': 86400,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    interaction TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a cache, shared by all of its users."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Responses stored in an SQLite database in WAL mode.
+
+    Any number of threads and processes may use the same file.
+    Entries expire after their TTL, and the least recently used ones
+    are evicted once the total size goes over a limit.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *,
+                 max_size: int = 64 * 1024 * 1024):
+        """
+        :param path: The database file, created if missing
+        :param max_size: Maximum total size of the cached bodies
+        """
+        self.path = Path(path).expanduser()
+        self.max_size = max_size
+        self._local = threading.local()
+
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """The connection of the current thread and process."""
+        db: sqlite3.Connection | None = getattr(self._local, 'db', None)
+
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=30)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            self._local.db = db
+            self._local.pid = os.getpid()
+        return db
+
+    @staticmethod
+    def _count(db: sqlite3.Connection, name: str, n: int = 1) -> None:
+        db.execute("INSERT INTO stats VALUES (?, ?) ON CONFLICT(name) "
+                   "DO UPDATE SET value = value + excluded.value", (name, n))
+
+    def get(self, key: str) -> Interaction | None:
+        """Look up a fresh entry."""
+        now = time.time()
+
+        with self._connect() as db:
+            row = db.execute("SELECT interaction FROM responses "
+                             "WHERE key = ? AND expires > ?",
+                             (key, now)).fetchone()
+            if row is None:
+                self._count(db, 'misses')
+                return None
+
+            db.execute("UPDATE responses SET accessed = ? WHERE key = ?",
+                       (now, key))
+            self._count(db, 'hits')
+
+        return Interaction.from_json(json.loads(row[0]))
+
+    def put(self, key: str, interaction: Interaction, ttl: float) -> None:
+        """Store an entry, evicting others if the cache is full.
+
+        The entry and evictions are written in a single transaction.
+        """
+        now = time.time()
+        data = json.dumps(interaction.to_json(), separators=(',', ':'))
+
+        if len(data) > self.max_size:
+            return
+
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO responses "
+                       "VALUES (?, ?, ?, ?, ?)",
+                       (key, data, len(data), now + ttl, now))
+            db.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+            evicted = db.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM ("
+                "  SELECT key, SUM(size) OVER ("
+                "   ORDER BY accessed DESC, key"
+                "  ) AS total FROM responses"
+                " ) WHERE total > ?"
+                ")", (self.max_size,)
+            ).rowcount
+
+            if evicted > 0:
+                self._count(db, 'evictions', evicted)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._connect() as db:
+            db.execute("DELETE FROM responses")
+            db.execute("DELETE FROM stats")
+
+    def stats(self) -> CacheStats:
+        """Counters of every user of the cache."""
+        db = self._connect()
+        counters = dict(db.execute("SELECT name, value FROM stats"))
+        entries, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) "
+                                   "FROM responses").fetchone()
+        return CacheStats(hits=counters.get('hits', 0),
+                          misses=counters.get('misses', 0),
+                          evictions=counters.get('evictions', 0),
+                          entries=entries, size=size)
+
+    def close(self) -> None:
+        """Close the connection of the current thread."""
+        db = getattr(self._local, 'db', None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+
+class CachingTransport(BBTransport):
+    """Answers GET requests from a `ResponseCache` when possible.
+
+    Only successful responses of URLs that match a TTL rule are
+    cached, and never streamed ones such as downloads. Entries are
+    kept apart for different credentials.
+    """
+
+    def __init__(self, cache: ResponseCache, *,
+                 ttls: Mapping[str, float] | None = None,
+                 inner: BaseAdapter | None = None):
+        """
+        :param cache: Where responses are stored
+        :param ttls: Seconds responses are cached for, by regular
+            expression of the URL path, `DEFAULT_TTLS` if `None`
+        :param inner: The adapter that actually sends requests
+        """
+        super().__init__(inner)
+        self.cache = cache
+        self._ttls = [(re.compile(p), ttl) for p, ttl in
+                      (DEFAULT_TTLS if ttls is None else ttls).items()]
+
+    def _ttl(self, url: str) -> float | None:
+        path = urlsplit(url).path.rstrip('/')
+        for pattern, ttl in self._ttls:
+            if pattern.fullmatch(path):
+                return ttl
+        return None
+
+    @staticmethod
+    def _key(request: PreparedRequest) -> str:
+        credentials = '\0'.join(request.headers.get(h, '')
+                                for h in ('Cookie', 'Authorization'))
+        digest = hashlib.sha256(credentials.encode()).hexdigest()[:16]
+        return f"{request.method} {request.url} {digest}"
+
+    def send(self, request: PreparedRequest, stream: bool = False,
+             timeout: Timeout = None, verify: bool | str = True,
+             cert: Any = None, proxies: Mapping[str, str] | None = None
+             ) -> Response:
+        ttl = self._ttl(request.url or '')
+
+        if request.method != 'GET' or stream or ttl is None:
+            return super().send(request, stream=stream, timeout=timeout,
+                                verify=verify, cert=cert, proxies=proxies)
+
+        key = self._key(request)
+        interaction = self.cache.get(key)
+
+        if interaction is not None:
+            return _build_response(request, interaction)
+
+        start = time.perf_counter()
+        response = super().send(request, stream=stream, timeout=timeout,
+                                verify=verify, cert=cert, proxies=proxies)
+
+        if response.status_code != 200:
+            return response
+
+        interaction = Interaction(
+            method='GET',
+            url=request.url or '',
+            status=response.status_code,
+            reason=response.reason or '',
+            headers=_filter_headers(
+                response.headers, _SENSITIVE_HEADERS | _ENCODING_HEADERS
+            ),
+            body=response.content,
+            elapsed=time.perf_counter() - start
+        )
+        self.cache.put(key, interaction, ttl)
+
+        original = getattr(response.raw, '_original_response', None)
+        return _build_response(request, interaction, original)
@@ -0,0 +1,183 @@
+"""
+Blackboard Course Catalog
+
+an index of catalog categories and their courses.
+
+Basic usage:
+    >>> cache = CatalogCache(session, ttl=3600)
+    >>> cache.get()['Course'].courses(category_id, recursive=True)
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from .blackboard import BBCategory, BBCategoryCourse
+
+if TYPE_CHECKING:
+    from .api_extended import BlackboardExtended
+
+#: Category types of the catalog
+CATEGORY_TYPES = ('Course', 'Organization')
+
+
+class BBCatalog:
+    """Categories of one type, indexed by parent and by course."""
+
+    def __init__(self, category_type: str):
+        self.category_type = category_type
+        self._categories: dict[str, BBCategory] = {}
+        self._roots: list[str] = []
+        self._children: dict[str, list[str]] = {}
+        self._courses: dict[str, list[str]] = {}
+        self._course_categories: dict[str, list[str]] = {}
+        self._subtree_courses: dict[str, tuple[str, ...]] = {}
+
+    def add_category(self, category: BBCategory,
+                     parent_id: str | None = None) -> None:
+        """Add a category, below a parent or at the top level."""
+        if category.id in self._categories:
+            return
+
+        self._categories[category.id] = category
+        self._children.setdefault(category.id, [])
+        self._subtree_courses.clear()
+        parent_id = parent_id or category.parentId
+
+        if parent_id is None:
+            self._roots.append(category.id)
+        else:
+            self._children.setdefault(parent_id, []).append(category.id)
+
+    def add_courses(self, memberships: Iterable[BBCategoryCourse]) -> None:
+        """Add category-course memberships."""
+        for m in memberships:
+            self._courses.setdefault(m.categoryId, []).append(m.courseId)
+            self._course_categories.setdefault(m.courseId, []) \
+                .append(m.categoryId)
+        self._subtree_courses.clear()
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def __contains__(self, category_id: object) -> bool:
+        return category_id in self._categories
+
+    def __getitem__(self, category_id: str) -> BBCategory:
+        return self._categories[category_id]
+
+    def __iter__(self) -> Iterator[BBCategory]:
+        return iter(self._categories.values())
+
+    @property
+    def roots(self) -> list[BBCategory]:
+        """The top-level categories."""
+        return [self._categories[i] for i in self._roots]
+
+    def children(self, category_id: str) -> list[BBCategory]:
+        """The categories directly below a category."""
+        return [self._categories[i]
+                for i in self._children.get(category_id, [])
+                if i in self._categories]
+
+    def descendants(self, category_id: str) -> Iterator[BBCategory]:
+        """Every category below a category, breadth-first."""
+        pending = deque(self._children.get(category_id, []))
+        seen = {category_id}
+
+        while pending:
+            child_id = pending.popleft()
+            if child_id in seen or child_id not in self._categories:
+                continue
+            seen.add(child_id)
+            yield self._categories[child_id]
+            pending.extend(self._children.get(child_id, []))
+
+    def courses(self, category_id: str, *,
+                recursive: bool = False) -> tuple[str, ...]:
+        """Ids of the courses in a category.
+
+        :param recursive: Include the courses of every descendant,
+            these are computed once and reused
+        """
+        if not recursive:
+            return tuple(dict.fromkeys(self._courses.get(category_id, [])))
+
+        courses = self._subtree_courses.get(category_id)
+        if courses is None:
+            ids = [category_id, *(c.id for c in
+                                  self.descendants(category_id))]
+            courses = tuple(dict.fromkeys(
+                course for i in ids for course in self._courses.get(i, [])
+            ))
+            self._subtree_courses[category_id] = courses
+        return courses
+
+    def categories_of(self, course_id: str) -> list[BBCategory]:
+        """The categories a course belongs to."""
+        return [self._categories[i]
+                for i in self._course_categories.get(course_id, [])
+                if i in self._categories]
+
+
+class CatalogCache:
+    """Keeps the catalog of a session in memory for a while.
+
+    The catalog is loaded on first use and again once it expires.
+    It is safe to share between threads, concurrent callers wait
+    for a single load.
+    """
+
+    def __init__(self, session: 'BlackboardExtended', *,
+                 ttl: float = 3600,
+                 category_types: Iterable[str] = CATEGORY_TYPES,
+                 max_workers: int = 8):
+        """
+        :param session: The session used to load the catalog
+        :param ttl: Seconds before the catalog is loaded again
+        :param category_types: The category types to load
+        :param max_workers: Maximum number of concurrent requests
+        """
+        self._session = session
+        self._ttl = ttl
+        self._category_types = tuple(category_types)
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._catalogs: dict[str, BBCatalog] | None = None
+        self._loaded = 0.0
+
+    def get(self) -> dict[str, BBCatalog]:
+        """The catalog of each category type, loading it if needed."""
+        with self._lock:
+            if self._catalogs is None or \
+                    time.monotonic() - self._loaded >= self._ttl:
+                self._catalogs = self._session.ex_fetch_catalog(
+                    category_types=self._category_types,
+                    max_workers=self._max_workers
+                )
+                self._loaded = time.monotonic()
+            return self._catalogs
+
+    def invalidate(self) -> None:
+        """Load the catalog again on next use."""
+        with self._lock:
+            self._catalogs = None
@@ -0,0 +1,232 @@
+"""
+Blackboard Crawler
+
+crawls the content trees of many courses across a process pool.
+
+Basic usage:
+    >>> factory = functools.partial(BlackboardExtended, url, cookies=...)
+    >>> crawler = Crawler(factory, checkpoint='crawl.jsonl')
+    >>> result = crawler.crawl(course_ids)
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+import json
+import logging
+from pathlib import Path
+from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    FIRST_COMPLETED,
+    wait
+)
+
+from .api import BlackboardSession
+from .blackboard import BBCourseContent
+from .exceptions import BBForbiddenError
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], BlackboardSession]
+
+# Session of each worker process
+_session: BlackboardSession | None = None
+
+
+@dataclass(frozen=True)
+class CrawlUnit:
+    """A single listing of contents, the top level of a course when
+    `content_id` is `None` and the children of a content otherwise."""
+    course_id: str
+    content_id: str | None = None
+
+
+@dataclass
+class CrawlResult:
+    """Contents of every crawled course, parents before children."""
+    contents: dict[str, list[BBCourseContent]] = field(default_factory=dict)
+    #: Units that could not be crawled and will be retried on resume
+    failed: list[CrawlUnit] = field(default_factory=list)
+
+
+def _init_worker(factory: SessionFactory) -> None:
+    global _session
+    _session = factory()
+
+
+def _crawl_unit(unit: CrawlUnit) -> list[BBCourseContent]:
+    """List the contents of a unit, in a worker process."""
+    assert _session is not None
+
+    try:
+        if unit.content_id is None:
+            return _session.fetch_contents(course_id=unit.course_id)
+        return _session.fetch_content_children(
+            course_id=unit.course_id, content_id=unit.content_id
+        )
+    except BBForbiddenError:
+        logger.warning(f"Contents of {unit} are not available")
+        return []
+
+
+class _Checkpoint:
+    """Append-only log of completed units."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._path = Path(path)
+
+    def load(self) -> dict[CrawlUnit, list[BBCourseContent]]:
+        done: dict[CrawlUnit, list[BBCourseContent]] = {}
+
+        if not self._path.exists():
+            return done
+
+        with self._path.open('rb+') as f:
+            data = f.read()
+
+            # An interrupted write leaves a partial last line
+            if data and not data.endswith(b'\n'):
+                logger.warning("Discarding incomplete checkpoint entry")
+                data = data[:data.rfind(b'\n') + 1]
+                f.truncate(len(data))
+
+        for line in data.splitlines():
+            entry = json.loads(line)
+            unit = CrawlUnit(entry['course_id'], entry['content_id'])
+            done[unit] = [BBCourseContent(**c) for c in entry['contents']]
+
+        return done
+
+    def append(self, unit: CrawlUnit,
+               contents: list[BBCourseContent]) -> None:
+        entry = {
+            'course_id': unit.course_id,
+            'content_id': unit.content_id,
+            'contents': [c.model_dump(mode='json') for c in contents],
+        }
+        with self._path.open('a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+
+def _children_units(unit: CrawlUnit, contents: list[BBCourseContent]
+                    ) -> list[CrawlUnit]:
+    return [CrawlUnit(unit.course_id, c.id)
+            for c in contents if c.hasChildren]
+
+
+def _merge(course_id: str, done: dict[CrawlUnit, list[BBCourseContent]]
+           ) -> list[BBCourseContent]:
+    """Flatten the tree of a course depth-first, in a stable order."""
+    merged: list[BBCourseContent] = []
+    stack = [CrawlUnit(course_id)]
+
+    while stack:
+        contents = done.get(stack.pop(), [])
+        merged.extend(contents)
+        stack.extend(CrawlUnit(course_id, c.id)
+                     for c in reversed(contents) if c.hasChildren)
+    return merged
+
+
+class Crawler:
+    """Crawls content trees using a pool of worker processes.
+
+    Courses are split into units, one per listing of contents, and
+    idle workers pick up the next pending unit as subtrees are
+    discovered. Completed units can be saved to a checkpoint, so an
+    interrupted crawl resumes where it stopped.
+    """
+
+    def __init__(self, session_factory: SessionFactory, *,
+                 processes: int | None = None,
+                 checkpoint: str | os.PathLike[str] | None = None):
+        """
+        :param session_factory: Picklable callable that creates the
+            session of each worker, e.g. a `functools.partial`
+        :param processes: Number of worker processes, default CPU count
+        :param checkpoint: File where completed units are saved
+        """
+        self._factory = session_factory
+        self._processes = processes
+        self._checkpoint = _Checkpoint(checkpoint) if checkpoint else None
+
+    def crawl(self, course_ids: Iterable[str], *,
+              parents: Mapping[str, str] | None = None) -> CrawlResult:
+        """Crawl the content trees of the given courses.
+
+        :param course_ids: The course or organization IDs
+        :param parents: The course whose tree is crawled in place of
+            each course, see `BlackboardExtended.ex_resolve_cross_lists`.
+            Courses sharing a parent are crawled once.
+        """
+        course_ids = list(dict.fromkeys(course_ids))
+        parents = parents or {}
+        done = self._checkpoint.load() if self._checkpoint else {}
+        result = CrawlResult()
+
+        # Rebuild the frontier of a previous crawl, if any
+        frontier = [CrawlUnit(c) for c in dict.fromkeys(
+            parents.get(c, c) for c in course_ids
+        )]
+        for unit, contents in done.items():
+            frontier.extend(_children_units(unit, contents))
+        seen = set(frontier) | set(done)
+
+        if done:
+            logger.info(f"Resuming crawl with {len(done)} units done")
+
+        with ProcessPoolExecutor(max_workers=self._processes,
+                                 initializer=_init_worker,
+                                 initargs=(self._factory,)) as executor:
+            futures: dict[Future[list[BBCourseContent]], CrawlUnit] = {
+                executor.submit(_crawl_unit, u): u
+                for u in frontier if u not in done
+            }
+
+            while futures:
+                completed, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in completed:
+                    unit = futures.pop(future)
+
+                    try:
+                        contents = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to crawl {unit}: {e!r}")
+                        result.failed.append(unit)
+                        continue
+
+                    done[unit] = contents
+                    if self._checkpoint is not None:
+                        self._checkpoint.append(unit, contents)
+
+                    for child in _children_units(unit, contents):
+                        if child not in seen:
+                            seen.add(child)
+                            futures[executor.submit(_crawl_unit, child)] \
+                                = child
+
+        for course_id in course_ids:
+            result.contents[course_id] = _merge(
+                parents.get(course_id, course_id), done
+            )
+
+        return result
@@ -0,0 +1,155 @@
+"""
+Blackboard Embedded Files
+
+finds files embedded in the HTML bodies of contents.
+
+Documents often link or inline files from the content collection
+without listing them as attachments.
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from html.parser import HTMLParser
+from dataclasses import dataclass, field
+from collections.abc import Iterable
+from urllib.parse import unquote, urljoin, urlsplit, urlunsplit
+
+from .blackboard import BBCourseContent, safe_filename
+
+#: Marker of every embedded file URL
+WEBDAV_MARKER = 'bbcswebdav'
+
+# Placeholder for the instance URL in bodies of the REST API
+_URL_STUB = '@X@EmbeddedFile.requestUrlStub@X@'
+
+# Attributes that may point at a file, by tag
+_URL_ATTRIBUTES = {
+    'a': ('href',),
+    'img': ('src',),
+    'source': ('src',),
+    'video': ('src', 'poster'),
+    'audio': ('src',),
+    'embed': ('src',),
+    'iframe': ('src',),
+    'object': ('data',),
+}
+
+
+@dataclass
+class EmbeddedFile:
+    """A file embedded in the body of one or more contents."""
+    url: str
+    #: Contents whose bodies embed the file, in order of appearance
+    content_ids: list[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        """A path safe name from the last segment of the URL."""
+        segment = unquote(urlsplit(self.url).path.rstrip('/')
+                          .rsplit('/', 1)[-1])
+        return safe_filename(segment) or 'file'
+
+
+def normalize_url(url: str, base_url: str) -> str | None:
+    """Make an embedded URL absolute and canonical.
+
+    Files are fetched with the credentials of the session, so only
+    URLs of the instance itself are kept, with its scheme.
+
+    :param url: The URL as found in a body
+    :param base_url: The URL of the Blackboard instance
+    :returns: `None` if it is not a content collection URL of the
+        instance
+    """
+    url = url.strip().replace(_URL_STUB, base_url.rstrip('/') + '/')
+    parts = urlsplit(urljoin(base_url, url))
+    base = urlsplit(base_url)
+
+    if parts.scheme not in ('http', 'https') or \
+            parts.netloc.lower() != base.netloc.lower() or \
+            f"/{WEBDAV_MARKER}/" not in parts.path:
+        return None
+
+    return urlunsplit((base.scheme.lower(), parts.netloc.lower(),
+                       parts.path, parts.query, ''))
+
+
+class _EmbeddedParser(HTMLParser):
+    """Collects candidate URLs of a body, reused between bodies."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.urls: list[str] = []
+
+    def handle_starttag(self, tag: str,
+                        attrs: list[tuple[str, str | None]]) -> None:
+        names = _URL_ATTRIBUTES.get(tag)
+        if names is None:
+            return
+
+        for name, value in attrs:
+            if name in names and value and WEBDAV_MARKER in value:
+                self.urls.append(value)
+
+    handle_startendtag = handle_starttag
+
+    def scan(self, body: str) -> list[str]:
+        self.reset()
+        self.urls = []
+        self.feed(body)
+        self.close()
+        return self.urls
+
+
+def extract_urls(body: str, base_url: str) -> list[str]:
+    """Find the normalized, unique URLs embedded in a body.
+
+    :param body: HTML body of a content
+    :param base_url: The URL of the Blackboard instance
+    """
+    return _extract(_EmbeddedParser(), body, base_url)
+
+
+def _extract(parser: _EmbeddedParser, body: str,
+             base_url: str) -> list[str]:
+    # Most bodies embed nothing, so skip parsing them
+    if WEBDAV_MARKER not in body:
+        return []
+
+    found = (normalize_url(u, base_url) for u in parser.scan(body))
+    return list(dict.fromkeys(u for u in found if u is not None))
+
+
+def find_embedded_files(contents: Iterable[BBCourseContent],
+                        base_url: str) -> list[EmbeddedFile]:
+    """Find the files embedded in the bodies of many contents.
+
+    :param contents: Contents of one or more crawled trees
+    :param base_url: The URL of the Blackboard instance
+    :returns: Unique files, in order of appearance
+    """
+    parser = _EmbeddedParser()
+    files: dict[str, EmbeddedFile] = {}
+
+    for content in contents:
+        for url in _extract(parser, content.body or '', base_url):
+            ids = files.setdefault(url, EmbeddedFile(url)).content_ids
+            if content.id not in ids:
+                ids.append(content.id)
+
+    return list(files.values())
@@ -19,6 +19,8 @@
 
 from typing import Any, NoReturn
 
+import requests
+
 
 class BBStatusError(Exception):
     pass
@@ -36,6 +38,38 @@ class BBForbiddenError(BBStatusError):
     pass
 
 
+class BBReplayError(Exception):
+    """No recorded interaction matches the request."""
+    pass
+
+
+class BBCircuitOpenError(requests.ConnectionError):
+    """Requests to an endpoint are failing, so they are not sent.
+
+    A subclass of `requests.ConnectionError`, so it is handled like
+    any other unreachable server.
+    """
+
+    def __init__(self, key: tuple[str, str], retry_after: float):
+        super().__init__(f"Circuit open for {key[0]}{key[1]}, "
+                         f"retry in {retry_after:.1f}s")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class BBDeadlineExceededError(requests.Timeout):
+    """The time budget of a deadline ran out."""
+    pass
+
+
+class BBTaskFailedError(Exception):
+    """A background task finished without completing."""
+
+    def __init__(self, task: Any):
+        super().__init__(f"Task {task.id} finished as {task.status}")
+        self.task = task
+
+
 def status_handler(client: Any, status_code: Any, response: Any) -> NoReturn:
     match status_code:
         case 400:
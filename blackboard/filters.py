@@ -19,21 +19,174 @@ Client-side result filters for the Blackboard API
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
 # MA  02110-1301, USA.
 
+import re
+from fnmatch import translate
+from datetime import datetime
+from functools import lru_cache
 from dataclasses import dataclass
-from collections.abc import Sequence, Iterable
+from typing import Any, TypeVar
+from collections.abc import Iterable, Callable
 
 from bwfilters import BWFilter
 
-from .blackboard import BBMembership, BBAttachment
+from .blackboard import (
+    BBMembership,
+    BBAttachment,
+    BBAvailability,
+    BBCourseContent
+)
+
+T = TypeVar('T')
+
+Predicate = Callable[[T], bool]
+
+
+@lru_cache(maxsize=512)
+def _glob_matcher(patterns: tuple[str, ...]
+                  ) -> Callable[[str], re.Match[str] | None]:
+    """Compile a set of wildcard patterns into a single regex."""
+    regex = '|'.join(f'(?:{translate(p)})' for p in patterns)
+    return re.compile(regex).match
+
+
+def _compile_bw(bw: BWFilter[Any] | None, key: Callable[[T], str | None], *,
+                wildcard: bool = False) -> Predicate[T] | None:
+    """Compile a blacklist/whitelist filter into a predicate.
+
+    As with `BWFilter`, the whitelist takes precedence.
+
+    :param bw: The filter to compile, if any
+    :param key: Extracts the value to match from each item
+    :param wildcard: Match using wildcard patterns instead of equality
+    """
+    if bw is None:
+        return None
+
+    if bw.whitelist is not None:
+        allow, patterns = True, bw.whitelist
+    elif bw.blacklist is not None:
+        allow, patterns = False, bw.blacklist
+    else:
+        return None
+
+    if not patterns:
+        # Nothing is whitelisted, or nothing is blacklisted
+        return lambda x: not allow
+
+    search: Callable[[str | None], bool]
+
+    if wildcard:
+        match = _glob_matcher(tuple(patterns))
+
+        def search(value: str | None) -> bool:
+            return value is not None and match(value) is not None
+    else:
+        search = frozenset(patterns).__contains__
+
+    if allow:
+        return lambda x: search(key(x))
+    return lambda x: not search(key(x))
+
+
+def _compile_dates(key: Callable[[T], datetime | None],
+                   after: datetime | None,
+                   before: datetime | None) -> Predicate[T] | None:
+    """Compile a date range into a predicate.
+
+    Items without a date are allowed through.
+    """
+    if after is None and before is None:
+        return None
+
+    def in_range(item: T) -> bool:
+        date = key(item)
+        if date is None:
+            return True
+        if after is not None and date < after:
+            return False
+        return before is None or date < before
+
+    return in_range
+
+
+def _compile_years(key: Callable[[T], datetime | None],
+                   min_year: int | None,
+                   max_year: int | None) -> Predicate[T] | None:
+    """Compile an inclusive year range into a predicate.
+
+    Items without a date are allowed through.
+    """
+    if min_year is None and max_year is None:
+        return None
+
+    low = datetime.min.year if min_year is None else min_year
+    high = datetime.max.year if max_year is None else max_year
+
+    def in_range(item: T) -> bool:
+        date = key(item)
+        return date is None or low <= date.year <= high
+
+    return in_range
+
+
+def _compile_regex(key: Callable[[T], str | None],
+                   pattern: str | None) -> Predicate[T] | None:
+    """Compile a regular expression search into a predicate."""
+    if pattern is None:
+        return None
+
+    search = re.compile(pattern).search
+    return lambda x: search(key(x) or '') is not None
+
+
+def _compile_available(available: bool | None
+                       ) -> Predicate[Any] | None:
+    """Compile an availability requirement into a predicate."""
+    if available is None:
+        return None
+
+    def check(item: Any) -> bool:
+        availability: BBAvailability | None = item.availability
+        return bool(availability) is available
+
+    return check
+
+
+def _all_of(*predicates: Predicate[T] | None) -> Predicate[T]:
+    """Combine predicates into one that requires all of them."""
+    active = tuple(p for p in predicates if p is not None)
+
+    if not active:
+        return lambda x: True
+    if len(active) == 1:
+        return active[0]
+
+    def combined(item: T) -> bool:
+        for p in active:
+            if not p(item):
+                return False
+        return True
+
+    return combined
 
 
 @dataclass
 class BBAttachmentFilter:
-    """Filters that the user may apply to attachments"""
+    """Filters that the user may apply to attachments
+
+    Entries of `mime_types` may contain wildcards, e.g. `video/*`.
+    """
     mime_types: BWFilter[BBAttachment]
 
-    def filter(self, items: Sequence[BBAttachment]) -> Iterable[BBAttachment]:
-        return self.mime_types.filter_wc(lambda x: x.mimeType, items)
+    def compile(self) -> Predicate[BBAttachment]:
+        """Return a predicate that accepts the allowed attachments."""
+        return _all_of(
+            _compile_bw(self.mime_types, lambda x: x.mimeType, wildcard=True)
+        )
+
+    def filter(self, items: Iterable[BBAttachment]
+               ) -> Iterable[BBAttachment]:
+        return filter(self.compile(), items)
 
 
 @dataclass
@@ -41,10 +194,53 @@ class BBMembershipFilter:
     """Filters that the user may apply to content"""
     data_sources: BWFilter[BBMembership]
     min_year: int | None = None
+    max_year: int | None = None
+    available: bool | None = None
 
-    def filter(self, items: Sequence[BBMembership]) -> Iterable[BBMembership]:
-        if self.min_year is not None:
+    def compile(self) -> Predicate[BBMembership]:
+        """Return a predicate that accepts the allowed memberships."""
+        return _all_of(
             # Allow items without a creation date to go through
-            items = [m for m in items if
-                     m.created is None or m.created.year >= self.min_year]
-        return self.data_sources.filter(lambda x: x.dataSourceId, items)
+            _compile_years(lambda x: x.created, self.min_year, self.max_year),
+            _compile_available(self.available),
+            _compile_bw(self.data_sources, lambda x: x.dataSourceId)
+        )
+
+    def filter(self, items: Iterable[BBMembership]
+               ) -> Iterable[BBMembership]:
+        return filter(self.compile(), items)
+
+
+def _resource_type(content: BBCourseContent) -> str | None:
+    handler = content.contentHandler
+    if handler is None or handler.id is None:
+        return None
+    return handler.id.value
+
+
+@dataclass
+class BBContentFilter:
+    """Filters that the user may apply to course contents
+
+    Entries of `resource_types` are the values of `BBResourceType`,
+    and `title` is a regular expression searched in content titles.
+    """
+    resource_types: BWFilter[BBCourseContent] | None = None
+    title: str | None = None
+    modified_after: datetime | None = None
+    modified_before: datetime | None = None
+    available: bool | None = None
+
+    def compile(self) -> Predicate[BBCourseContent]:
+        """Return a predicate that accepts the allowed contents."""
+        return _all_of(
+            _compile_bw(self.resource_types, _resource_type),
+            _compile_available(self.available),
+            _compile_dates(lambda x: x.modified,
+                           self.modified_after, self.modified_before),
+            _compile_regex(lambda x: x.title, self.title)
+        )
+
+    def filter(self, items: Iterable[BBCourseContent]
+               ) -> Iterable[BBCourseContent]:
+        return filter(self.compile(), items)
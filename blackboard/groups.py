@@ -0,0 +1,112 @@
+"""
+Blackboard Groups
+
+an index of the groups of a course and their members.
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from collections.abc import Iterable, Iterator
+
+from .blackboard import BBGroup, BBGroupMembership
+
+
+class BBGroupRoster:
+    """Groups, group sets and members of a course.
+
+    Groups map to their users, and users to their groups.
+    """
+
+    def __init__(self, course_id: str):
+        self.course_id = course_id
+        self._sets: dict[str, BBGroup] = {}
+        self._groups: dict[str, BBGroup] = {}
+        self._set_groups: dict[str, list[str]] = {}
+        self._users: dict[str, dict[str, BBGroupMembership]] = {}
+        self._user_groups: dict[str, list[str]] = {}
+
+    def add_set(self, group_set: BBGroup) -> None:
+        """Add a group set."""
+        self._sets[group_set.id] = group_set
+        self._set_groups.setdefault(group_set.id, [])
+
+    def add_group(self, group: BBGroup) -> None:
+        """Add a group, inside its set if it has one."""
+        if group.id in self._groups:
+            return
+
+        self._groups[group.id] = group
+        self._users.setdefault(group.id, {})
+        if group.groupSetId is not None:
+            self._set_groups.setdefault(group.groupSetId, []) \
+                .append(group.id)
+
+    def add_members(self, group_id: str,
+                    memberships: Iterable[BBGroupMembership]) -> None:
+        """Add the members of a group."""
+        users = self._users.setdefault(group_id, {})
+
+        for m in memberships:
+            if m.userId not in users:
+                users[m.userId] = m
+                self._user_groups.setdefault(m.userId, []).append(group_id)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __contains__(self, group_id: object) -> bool:
+        return group_id in self._groups
+
+    def __getitem__(self, group_id: str) -> BBGroup:
+        return self._groups[group_id]
+
+    def __iter__(self) -> Iterator[BBGroup]:
+        return iter(self._groups.values())
+
+    @property
+    def sets(self) -> list[BBGroup]:
+        """The group sets of the course."""
+        return list(self._sets.values())
+
+    @property
+    def users(self) -> list[str]:
+        """Ids of the users in any group."""
+        return list(self._user_groups)
+
+    def groups_in_set(self, set_id: str) -> list[BBGroup]:
+        """The groups of a group set."""
+        return [self._groups[i] for i in self._set_groups.get(set_id, [])]
+
+    def members(self, group_id: str) -> list[BBGroupMembership]:
+        """The memberships of a group."""
+        return list(self._users.get(group_id, {}).values())
+
+    def member_ids(self, group_id: str) -> list[str]:
+        """Ids of the users in a group."""
+        return list(self._users.get(group_id, {}))
+
+    def groups_of(self, user_id: str, *,
+                  set_id: str | None = None) -> list[BBGroup]:
+        """The groups of a user.
+
+        :param set_id: Only groups of this group set
+        """
+        groups = (self._groups[i] for i in self._user_groups.get(user_id, []))
+        if set_id is not None:
+            return [g for g in groups if g.groupSetId == set_id]
+        return list(groups)
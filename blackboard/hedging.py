@@ -0,0 +1,237 @@
+"""
+Blackboard Hedged Requests
+
+sends a second copy of slow GET requests to cut tail latency.
+
+Basic usage:
+    >>> hedging = HedgingTransport(max_ratio=0.05)
+    >>> session = BlackboardSession(url, cookies=..., transport=hedging)
+    >>> hedging.stats()
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from collections.abc import Mapping
+from concurrent.futures import Future, FIRST_COMPLETED, wait
+from urllib.parse import urlsplit
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from .transport import BBTransport, Timeout
+from .breaker import endpoint_template
+from .timeouts import ContextExecutor
+
+logger = logging.getLogger(__name__)
+
+EndpointKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Counters of a hedging transport."""
+    #: Requests that could have been hedged
+    requests: int = 0
+    #: Second copies sent
+    hedges: int = 0
+    #: Second copies that answered first
+    wins: int = 0
+
+
+class HedgingTransport(BBTransport):
+    """Races a second copy of GET requests that are slow to answer.
+
+    A copy is sent once a request has taken longer than a fixed delay
+    or, when there are enough samples, than the 95th percentile of
+    its endpoint, and the first answer is used. A token bucket caps
+    hedges to a fraction of all requests, so an overloaded server
+    does not get twice the load. Streamed requests are never hedged,
+    and neither are requests while every worker is busy, as a copy
+    would only wait for a worker too.
+    """
+
+    def __init__(self, inner: BaseAdapter | None = None, *,
+                 delay: float | None = None,
+                 default_delay: float = 1.0,
+                 min_delay: float = 0.05,
+                 max_ratio: float = 0.05,
+                 burst: float = 10.0,
+                 window: int = 200,
+                 min_samples: int = 20,
+                 max_workers: int = 32):
+        """
+        :param inner: The adapter that actually sends requests
+        :param delay: Fixed seconds before hedging, or `None` to use
+            the 95th percentile latency of each endpoint
+        :param default_delay: Seconds before hedging while an endpoint
+            has too few samples
+        :param min_delay: Shortest delay before hedging
+        :param max_ratio: Largest fraction of requests hedged over time
+        :param burst: Hedges that may be sent in a row
+        :param window: Latency samples kept for each endpoint
+        :param min_samples: Samples needed to use the percentile
+        :param max_workers: Maximum number of requests in flight
+        """
+        super().__init__(inner)
+        self.delay = delay
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self._window = window
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+        self._latencies: dict[EndpointKey, deque[float]] = {}
+        self._tokens = burst
+        self._stats = HedgeStats()
+        self._max_workers = max_workers
+        self._busy = 0
+        self._pool = ContextExecutor(max_workers=max_workers,
+                                     thread_name_prefix='bb-hedge')
+
+    @staticmethod
+    def key(url: str) -> EndpointKey:
+        """The endpoint of a URL, whose latencies are tracked."""
+        parts = urlsplit(url)
+        return parts.netloc.lower(), endpoint_template(parts.path)
+
+    def hedge_delay(self, key: EndpointKey) -> float:
+        """Seconds a request to an endpoint may take before hedging."""
+        if self.delay is not None:
+            return self.delay
+
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+
+        if len(samples) < self._min_samples:
+            return self.default_delay
+        return max(samples[int(0.95 * (len(samples) - 1))], self.min_delay)
+
+    def _record(self, key: EndpointKey, latency: float) -> None:
+        with self._lock:
+            self._latencies.setdefault(
+                key, deque(maxlen=self._window)).append(latency)
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1 or self._busy >= self._max_workers:
+                return False
+            self._tokens -= 1
+            self._stats = HedgeStats(self._stats.requests,
+                                     self._stats.hedges + 1,
+                                     self._stats.wins)
+            return True
+
+    def _send(self, key: EndpointKey, request: PreparedRequest,
+              kwargs: dict[str, Any],
+              started: threading.Event | None) -> Response:
+        """Send a request from the pool.
+
+        :param started: Set once a worker picks up the primary
+            request, `None` for a hedge
+        """
+        with self._lock:
+            self._busy += 1
+        try:
+            start = time.monotonic()
+            if started is not None:
+                started.set()
+            response = self.inner.send(request, **kwargs)
+            # The hedge is not timed, it would bias the percentile down
+            if started is not None:
+                self._record(key, time.monotonic() - start)
+            return response
+        finally:
+            with self._lock:
+                self._busy -= 1
+
+    @staticmethod
+    def _discard(future: 'Future[Response]') -> None:
+        """Release the connection of a losing request."""
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    def send(self, request: PreparedRequest, stream: bool = False,
+             timeout: Timeout = None, verify: bool | str = True,
+             cert: Any = None, proxies: Mapping[str, str] | None = None
+             ) -> Response:
+        if request.method != 'GET' or stream:
+            return super().send(request, stream=stream, timeout=timeout,
+                                verify=verify, cert=cert, proxies=proxies)
+
+        key = self.key(request.url or '')
+        kwargs: dict[str, Any] = dict(stream=stream, timeout=timeout,
+                                      verify=verify, cert=cert,
+                                      proxies=proxies)
+
+        with self._lock:
+            self._tokens = min(self._tokens + self.max_ratio, self.burst)
+            self._stats = HedgeStats(self._stats.requests + 1,
+                                     self._stats.hedges, self._stats.wins)
+
+        started = threading.Event()
+        primary = self._pool.submit(self._send, key, request, kwargs,
+                                    started)
+        primary.add_done_callback(lambda _: started.set())
+
+        # Time spent waiting for a worker is not latency of the server
+        started.wait()
+        done, _ = wait([primary], timeout=self.hedge_delay(key))
+
+        if done or not self._take_token():
+            return primary.result()
+
+        logger.debug(f"Hedging request to {request.url}")
+        hedge = self._pool.submit(self._send, key, request.copy(),
+                                  kwargs, None)
+        pending = {primary, hedge}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            answered = [f for f in done if f.exception() is None]
+            if not answered:
+                # Wait for the other one, or report the primary error
+                continue
+
+            winner = primary if primary in answered else hedge
+            loser = hedge if winner is primary else primary
+            loser.add_done_callback(self._discard)
+
+            if winner is hedge:
+                with self._lock:
+                    self._stats = HedgeStats(self._stats.requests,
+                                             self._stats.hedges,
+                                             self._stats.wins + 1)
+            return winner.result()
+
+        return primary.result()
+
+    def stats(self) -> HedgeStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return self._stats
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        super().close()
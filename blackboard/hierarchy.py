@@ -0,0 +1,180 @@
+"""
+Blackboard Institutional Hierarchy
+
+an indexed in-memory graph of hierarchy nodes and their courses.
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+import json
+from pathlib import Path
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from .blackboard import BBNode, BBNodeCourse
+
+#: Version of the on-disk format, bumped on incompatible changes
+CACHE_VERSION = 1
+
+
+class BBHierarchy:
+    """Institutional hierarchy nodes, indexed in every direction.
+
+    Nodes map to their children and courses, and courses to the
+    nodes they are associated to.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, BBNode] = {}
+        self._roots: list[str] = []
+        self._parents: dict[str, str] = {}
+        self._children: dict[str, list[str]] = {}
+        self._courses: dict[str, list[BBNodeCourse]] = {}
+        self._course_nodes: dict[str, list[str]] = {}
+
+    def add_node(self, node: BBNode, parent_id: str | None = None) -> None:
+        """Add a node, below a parent or as a top-level node."""
+        if node.id in self._nodes:
+            return
+
+        self._nodes[node.id] = node
+        self._children.setdefault(node.id, [])
+        parent_id = parent_id or node.parentId
+
+        if parent_id is None:
+            self._roots.append(node.id)
+        else:
+            self._parents[node.id] = parent_id
+            self._children.setdefault(parent_id, []).append(node.id)
+
+    def add_courses(self, associations: Iterable[BBNodeCourse]) -> None:
+        """Add node-course associations."""
+        for a in associations:
+            self._courses.setdefault(a.nodeId, []).append(a)
+            self._course_nodes.setdefault(a.courseId, []).append(a.nodeId)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._nodes
+
+    def __getitem__(self, node_id: str) -> BBNode:
+        return self._nodes[node_id]
+
+    def __iter__(self) -> Iterator[BBNode]:
+        return iter(self._nodes.values())
+
+    @property
+    def roots(self) -> list[BBNode]:
+        """The top-level nodes."""
+        return [self._nodes[i] for i in self._roots]
+
+    def children(self, node_id: str) -> list[BBNode]:
+        """The nodes directly below a node."""
+        return [self._nodes[i] for i in self._children.get(node_id, [])
+                if i in self._nodes]
+
+    def descendants(self, node_id: str) -> Iterator[BBNode]:
+        """Every node below a node, breadth-first."""
+        pending = deque(self._children.get(node_id, []))
+
+        while pending:
+            child = self._nodes.get(pending.popleft())
+            if child is not None:
+                yield child
+                pending.extend(self._children.get(child.id, []))
+
+    def ancestors(self, node_id: str) -> list[BBNode]:
+        """The nodes above a node, nearest first."""
+        ancestors = []
+        seen = {node_id}
+        parent = self._parents.get(node_id)
+
+        # The parent map comes from the server, so guard against cycles
+        while parent is not None and parent not in seen:
+            seen.add(parent)
+            if parent in self._nodes:
+                ancestors.append(self._nodes[parent])
+            parent = self._parents.get(parent)
+        return ancestors
+
+    def courses(self, node_id: str, *,
+                recursive: bool = False) -> list[str]:
+        """Ids of the courses associated to a node.
+
+        :param recursive: Include the courses of every descendant
+        """
+        node_ids = [node_id]
+        if recursive:
+            node_ids.extend(n.id for n in self.descendants(node_id))
+
+        courses = (a.courseId for i in node_ids
+                   for a in self._courses.get(i, []))
+        return list(dict.fromkeys(courses))
+
+    def nodes_of(self, course_id: str) -> list[BBNode]:
+        """The nodes a course is directly associated to."""
+        return [self._nodes[i] for i in self._course_nodes.get(course_id, [])
+                if i in self._nodes]
+
+    def primary_node(self, course_id: str) -> BBNode | None:
+        """The primary node of a course, if any."""
+        for node_id in self._course_nodes.get(course_id, []):
+            for a in self._courses.get(node_id, []):
+                if a.courseId == course_id and a.isPrimary:
+                    return self._nodes.get(node_id)
+        return None
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Save the hierarchy to a JSON file."""
+        path = Path(path)
+        data = {
+            'version': CACHE_VERSION,
+            'nodes': [
+                {'node': n.model_dump(mode='json'),
+                 'parent': self._parents.get(n.id)}
+                for n in self._nodes.values()
+            ],
+            'courses': [a.model_dump(mode='json')
+                        for c in self._courses.values() for a in c],
+        }
+
+        tmp = path.with_suffix('.tmp')
+        with tmp.open('w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> 'BBHierarchy':
+        """Load a hierarchy saved with `save`.
+
+        :raises ValueError: If the file has an unsupported version
+        """
+        with Path(path).open(encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('version') != CACHE_VERSION:
+            raise ValueError(f"Unsupported hierarchy cache {path}")
+
+        hierarchy = cls()
+        for entry in data['nodes']:
+            hierarchy.add_node(BBNode(**entry['node']), entry['parent'])
+        hierarchy.add_courses(BBNodeCourse(**a) for a in data['courses'])
+        return hierarchy
@@ -0,0 +1,209 @@
+"""
+Filesystem Layout Planner
+
+computes local paths for whole course trees at once.
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+from pathlib import Path
+from collections import deque, defaultdict
+from collections.abc import Iterable, Sequence
+
+from .blackboard import (
+    BBCourse,
+    BBAttachment,
+    BBCourseContent,
+    safe_filename
+)
+
+
+def _truncate(name: str, limit: int) -> str:
+    """Truncate a name to at most `limit` bytes when UTF-8 encoded."""
+    encoded = name.encode()
+    if len(encoded) <= limit:
+        return name
+    return encoded[:limit].decode(errors='ignore').rstrip(' .')
+
+
+def _fit(stem: str, ext: str, counter: str, limit: int) -> str | None:
+    """Truncate a name to `limit` bytes, keeping its counter.
+
+    The extension is kept too, unless it leaves no room for the stem.
+
+    :returns: `None` if not even the counter fits
+    """
+    for head, tail in ((stem, counter + ext), (stem + ext, counter)):
+        budget = limit - len(tail.encode())
+        if budget > 0 and (truncated := _truncate(head, budget)):
+            return truncated + tail
+    return None
+
+
+class LayoutPlanner:
+    """Plans where each item of a course tree is stored locally.
+
+    Sibling names that collide once sanitized receive a deterministic
+    numbered suffix, e.g. `Slides (2)`, assigned by content position.
+    Lengths are measured in bytes, as most filesystems do.
+    """
+
+    def __init__(self, root: str | os.PathLike[str] = '.', *,
+                 max_name_length: int = 255,
+                 max_path_length: int | None = None,
+                 case_sensitive: bool = False):
+        """
+        :param root: Directory where courses are placed
+        :param max_name_length: Maximum length of a path component
+        :param max_path_length: Maximum length of a full path, if any
+        :param case_sensitive: Whether names differing in case collide
+        """
+        self._root = Path(root)
+        self._max_name_length = max_name_length
+        self._max_path_length = max_path_length
+        self._case_sensitive = case_sensitive
+
+    @property
+    def root(self) -> Path:
+        """Directory where courses are placed."""
+        return self._root
+
+    def _name_limit(self, parent: Path) -> int:
+        limit = self._max_name_length
+
+        if self._max_path_length is not None:
+            # Account for the separator between parent and name
+            budget = self._max_path_length - len(os.fsencode(parent)) - 1
+            limit = min(limit, budget)
+
+        return limit
+
+    def _place(self, parent: Path, names: Iterable[tuple[str, str]], *,
+               keep_extension: bool = False) -> dict[str, Path]:
+        """Assign unique names to siblings under a common parent.
+
+        :param parent: Path of the parent directory
+        :param names: Pairs of key and sanitized name, in priority order
+        :param keep_extension: Insert suffixes before the file extension
+        """
+        limit = self._name_limit(parent)
+        taken: set[str] = set()
+        placed: dict[str, Path] = {}
+
+        for key, name in names:
+            stem, ext = (name, '')
+            if keep_extension:
+                stem, ext = os.path.splitext(name)
+            n = 1
+
+            while True:
+                candidate = _fit(stem, ext, f" ({n})" if n > 1 else '',
+                                 limit)
+                if candidate is None:
+                    raise ValueError(
+                        f"Path length limit exceeded under {parent}"
+                    )
+                folded = candidate if self._case_sensitive \
+                    else candidate.casefold()
+                if folded not in taken:
+                    break
+                n += 1
+
+            taken.add(folded)
+            placed[key] = parent / candidate
+
+        return placed
+
+    def place_courses(self, courses: Iterable[BBCourse]) -> dict[str, Path]:
+        """Return the directory of each course, keyed by course id."""
+        ordered = sorted(courses, key=lambda c: c.id)
+        return self._place(self._root, (
+            (c.id, c.title or safe_filename(c.courseId or c.id) or c.id)
+            for c in ordered
+        ))
+
+    def place_contents(self, parent: Path,
+                       siblings: Iterable[BBCourseContent]
+                       ) -> dict[str, Path]:
+        """Return the path of each content sharing the same parent.
+
+        This allows placing a tree incrementally as it is crawled,
+        since siblings are always fetched together.
+
+        :param parent: Path of the parent content
+        :param siblings: All the children of the parent content
+        """
+        ordered = sorted(siblings, key=lambda c: (c.position, c.id))
+        return self._place(parent, (
+            (c.id, c.title_path_safe) for c in ordered
+        ))
+
+    def place_attachments(self, parent: Path,
+                          attachments: Iterable[BBAttachment]
+                          ) -> dict[str, Path]:
+        """Return the path of each attachment of a content.
+
+        :param parent: Path of the content owning the attachments
+        :param attachments: All the attachments of the content
+        """
+        ordered = sorted(attachments, key=lambda a: a.id)
+        return self._place(parent, (
+            (a.id, safe_filename(a.fileName or a.id) or a.id)
+            for a in ordered
+        ), keep_extension=True)
+
+    def place_files(self, parent: Path,
+                    files: Iterable[tuple[str, str]]) -> dict[str, Path]:
+        """Return the path of each of a set of files.
+
+        :param parent: Directory of the files
+        :param files: Pairs of key and path safe name, in priority order
+        """
+        return self._place(parent, files, keep_extension=True)
+
+    def plan(self, contents: Iterable[BBCourseContent],
+             base: Path | None = None) -> dict[str, Path]:
+        """Compute the path of every content of a tree in one pass.
+
+        Contents whose parent is not part of the tree are placed
+        directly under `base`. The result is keyed by content id
+        and ordered breadth-first.
+
+        :param contents: Every content of a crawled tree
+        :param base: Directory for the top of the tree, default root
+        """
+        children: defaultdict[str | None, list[BBCourseContent]] = \
+            defaultdict(list)
+        items: Sequence[BBCourseContent] = list(contents)
+        ids = {c.id for c in items}
+
+        for c in items:
+            parent = c.parentId if c.parentId in ids else None
+            children[parent].append(c)
+
+        paths = self.place_contents(base or self._root, children[None])
+        queue = deque(paths.items())
+
+        while queue:
+            content_id, path = queue.popleft()
+            placed = self.place_contents(path, children[content_id])
+            paths.update(placed)
+            queue.extend(placed.items())
+
+        return paths
@@ -0,0 +1,381 @@
+"""
+Blackboard Download Pipeline
+
+crawls courses and downloads their attachments in overlapping stages.
+
+Basic usage:
+    >>> videos = BWFilter(blacklist=['video/*'])
+    >>> pipeline = DownloadPipeline(session, 'courses',
+    ...     attachment_filter=BBAttachmentFilter(mime_types=videos))
+    >>> report = pipeline.run(session.ex_fetch_courses())
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+import queue
+import logging
+import threading
+import contextvars
+from pathlib import Path
+from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import requests
+
+from .api_extended import BlackboardExtended
+from .blackboard import (
+    BBCourse,
+    BBAttachment,
+    BBResourceType,
+    BBCourseContent
+)
+from .filters import BBAttachmentFilter, BBContentFilter
+from .layout import LayoutPlanner
+from .sink import DownloadSink
+from .exceptions import (
+    BBStatusError,
+    BBForbiddenError,
+    BBUnauthorizedError
+)
+
+logger = logging.getLogger(__name__)
+
+# Tells the workers of a stage that no more items will come
+_DONE = object()
+
+
+class _Stopped(Exception):
+    pass
+
+
+@dataclass
+class PipelineReport:
+    """Outcome of a pipeline run."""
+    downloaded: list[Path] = field(default_factory=list)
+    #: Attachments left out by the filter
+    skipped: list[Path] = field(default_factory=list)
+    #: Errors, by the ID of a content or the path of a file
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    #: Bytes written
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class _Folder:
+    course_id: str
+    content_id: str | None
+    path: Path
+
+
+@dataclass(frozen=True)
+class _File:
+    course_id: str
+    content: BBCourseContent
+    path: Path
+
+
+@dataclass(frozen=True)
+class _Download:
+    course_id: str
+    content_id: str
+    attachment: BBAttachment
+    path: Path
+
+
+class DownloadPipeline:
+    """Downloads the attachments of whole courses as they are crawled.
+
+    Folders are listed, attachments resolved, filtered, downloaded
+    and written by separate pools of threads connected by bounded
+    queues. A stage that falls behind makes the previous one wait,
+    so memory stays bounded however large the courses are.
+
+    Each download hands its open response to a writer, so at most
+    ``download_workers + queue_size + write_workers`` connections
+    are held at once.
+    """
+
+    def __init__(self, session: BlackboardExtended,
+                 destination: str | os.PathLike[str], *,
+                 attachment_filter: BBAttachmentFilter | None = None,
+                 content_filter: BBContentFilter | None = None,
+                 planner: LayoutPlanner | None = None,
+                 sink: DownloadSink | None = None,
+                 discover_workers: int = 2,
+                 resolve_workers: int = 8,
+                 download_workers: int = 4,
+                 write_workers: int = 2,
+                 queue_size: int = 32):
+        """
+        :param session: The session used for every request
+        :param destination: The local directory
+        :param attachment_filter: Attachments to download, all if `None`
+        :param content_filter: Files whose attachments are resolved,
+            folders are always crawled
+        :param planner: Assigns unique local names, placed under the
+            destination by default
+        :param sink: Writes the downloaded files
+        :param discover_workers: Concurrent folder listings
+        :param resolve_workers: Concurrent attachment lookups
+        :param download_workers: Concurrent downloads
+        :param write_workers: Concurrent writes to disk
+        :param queue_size: Items waiting between two stages
+        """
+        self._session = session
+        self._destination = Path(destination)
+        self._planner = planner or LayoutPlanner(self._destination)
+        self._sink = sink or DownloadSink()
+        self._accept_attachment = attachment_filter.compile() \
+            if attachment_filter is not None else None
+        self._accept_content = content_filter.compile() \
+            if content_filter is not None else None
+        self._workers = (discover_workers, resolve_workers,
+                         download_workers, write_workers)
+        self._queue_size = queue_size
+
+    def run(self, courses: Iterable[BBCourse]) -> PipelineReport:
+        """Download the attachments of every course, blocking until
+        done.
+
+        :param courses: The courses to download
+        """
+        return _Run(self, list(courses)).run()
+
+
+class _Run:
+    """The state of a single pipeline run."""
+
+    def __init__(self, pipeline: DownloadPipeline, courses: list[BBCourse]):
+        self._p = pipeline
+        self._courses = courses
+        self._report = PipelineReport()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        # Discovery queues its own folders, so its queue is unbounded
+        self._folders: queue.Queue[Any] = queue.Queue()
+        self._files: queue.Queue[Any] = queue.Queue(pipeline._queue_size)
+        self._downloads: queue.Queue[Any] = \
+            queue.Queue(pipeline._queue_size)
+        self._writes: queue.Queue[Any] = queue.Queue(pipeline._queue_size)
+        self._outstanding = 0
+        self._error: BaseException | None = None
+
+    def _put(self, q: 'queue.Queue[Any]', item: Any) -> None:
+        """Wait for room in a queue, unless the run is stopped."""
+        while True:
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                if self._stop.is_set():
+                    raise _Stopped()
+
+    def _fail(self, key: str, error: BaseException) -> None:
+        logger.warning(f"Could not download {key}: {error!r}")
+        with self._lock:
+            self._report.failed[key] = error
+
+    def _add_folder(self, folder: _Folder) -> None:
+        with self._lock:
+            self._outstanding += 1
+        self._folders.put(folder)
+
+    def _discover(self, folder: _Folder) -> None:
+        try:
+            contents = self._p._session._list_contents(folder.course_id,
+                                                       folder.content_id)
+        except BBForbiddenError:
+            logger.warning(f"Contents of {folder.content_id} "
+                           "are not available")
+            contents = []
+        except BBUnauthorizedError:
+            raise
+        except (BBStatusError, requests.RequestException) as e:
+            self._fail(folder.content_id or folder.course_id, e)
+            contents = []
+
+        paths = self._p._planner.place_contents(folder.path, contents)
+        accept = self._p._accept_content
+
+        for c in contents:
+            if c.hasChildren:
+                self._add_folder(_Folder(folder.course_id, c.id, paths[c.id]))
+            elif c.contentHandler == BBResourceType.File and \
+                    (accept is None or accept(c)):
+                self._put(self._files, _File(folder.course_id, c,
+                                             paths[c.id]))
+
+    def _resolve(self, file: _File) -> None:
+        try:
+            attachments = self._p._session._fetch_attachments(
+                file.course_id, file.content
+            )
+        except BBUnauthorizedError:
+            raise
+        except (BBStatusError, requests.RequestException) as e:
+            self._fail(file.content.id, e)
+            return
+
+        paths = self._p._planner.place_attachments(file.path, attachments)
+        accept = self._p._accept_attachment
+
+        for a in attachments:
+            if accept is not None and not accept(a):
+                with self._lock:
+                    self._report.skipped.append(paths[a.id])
+                continue
+            self._put(self._downloads, _Download(
+                file.course_id, file.content.id, a, paths[a.id]
+            ))
+
+    def _download(self, item: _Download) -> None:
+        try:
+            response = self._p._session.download(
+                course_id=item.course_id, content_id=item.content_id,
+                attachment_id=item.attachment.id
+            )
+        except requests.RequestException as e:
+            self._fail(str(item.path), e)
+            return
+
+        try:
+            self._put(self._writes, (response, item.path))
+        except _Stopped:
+            response.close()
+            raise
+
+    def _write(self, item: tuple[requests.Response, Path]) -> None:
+        response, path = item
+        if self._stop.is_set():
+            response.close()
+            return
+
+        try:
+            written = self._p._sink.write(response, path).size
+        except (requests.RequestException, OSError) as e:
+            self._fail(str(path), e)
+            return
+
+        with self._lock:
+            self._report.downloaded.append(path)
+            self._report.size += written
+
+    def _discover_folder(self, folder: _Folder) -> None:
+        try:
+            self._discover(folder)
+        finally:
+            with self._lock:
+                self._outstanding -= 1
+                finished = self._outstanding == 0
+            if finished:
+                for _ in range(self._p._workers[0]):
+                    self._folders.put(_DONE)
+
+    def _worker(self, inbox: 'queue.Queue[Any]',
+                handle: Callable[[Any], None]) -> None:
+        while True:
+            try:
+                item = inbox.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            if item is _DONE:
+                return
+            handle(item)
+
+    def _stage(self, name: str, workers: int,
+               target: Callable[[], None],
+               downstream: tuple['queue.Queue[Any]', int] | None
+               ) -> threading.Thread:
+        """Start the workers of a stage, and a thread that tells the
+        next stage once they are all done."""
+        def guarded() -> None:
+            try:
+                target()
+            except _Stopped:
+                pass
+            except BaseException as e:
+                with self._lock:
+                    self._error = self._error or e
+                self._stop.set()
+
+        threads = [
+            threading.Thread(target=contextvars.copy_context().run,
+                             args=(guarded,), daemon=True,
+                             name=f"bb-pipeline-{name}-{i}")
+            for i in range(workers)
+        ]
+        for t in threads:
+            t.start()
+
+        def finish() -> None:
+            for t in threads:
+                t.join()
+            if downstream is not None:
+                inbox, n = downstream
+                for _ in range(n):
+                    try:
+                        self._put(inbox, _DONE)
+                    except _Stopped:
+                        return
+
+        closer = threading.Thread(target=finish, daemon=True,
+                                  name=f"bb-pipeline-{name}")
+        closer.start()
+        return closer
+
+    def run(self) -> PipelineReport:
+        discover, resolve, download, write = self._p._workers
+        course_paths = self._p._planner.place_courses(self._courses)
+
+        for course in self._courses:
+            self._add_folder(_Folder(course.id, None, course_paths[course.id]))
+        if not self._courses:
+            for _ in range(discover):
+                self._folders.put(_DONE)
+
+        stages = [
+            self._stage('discover', discover,
+                        lambda: self._worker(self._folders,
+                                             self._discover_folder),
+                        (self._files, resolve)),
+            self._stage('resolve', resolve,
+                        lambda: self._worker(self._files, self._resolve),
+                        (self._downloads, download)),
+            self._stage('download', download,
+                        lambda: self._worker(self._downloads,
+                                             self._download),
+                        (self._writes, write)),
+            self._stage('write', write,
+                        lambda: self._worker(self._writes, self._write),
+                        None),
+        ]
+
+        try:
+            for stage in stages:
+                stage.join()
+        finally:
+            self._stop.set()
+
+        if self._error is not None:
+            raise self._error
+        return self._report
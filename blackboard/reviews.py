@@ -0,0 +1,88 @@
+"""
+Blackboard Review Progress
+
+an index of which users have reviewed which content items.
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from collections.abc import Iterable, Iterator
+
+from .blackboard import BBReviewStatus
+
+
+class BBReviewIndex:
+    """Review statuses of a course, by content and by user.
+
+    Only reviewed items are indexed, so anything missing has not
+    been reviewed, or is not reviewable.
+    """
+
+    def __init__(self, course_id: str):
+        self.course_id = course_id
+        self._statuses: dict[tuple[str, str], BBReviewStatus] = {}
+        self._content_users: dict[str, list[str]] = {}
+        self._user_contents: dict[str, list[str]] = {}
+
+    def add(self, status: BBReviewStatus) -> None:
+        """Add a review status, ignoring those not reviewed."""
+        key = (status.contentId, status.userId)
+
+        if not status.isReviewed or key in self._statuses:
+            return
+
+        self._statuses[key] = status
+        self._content_users.setdefault(status.contentId, []) \
+            .append(status.userId)
+        self._user_contents.setdefault(status.userId, []) \
+            .append(status.contentId)
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._statuses
+
+    def __getitem__(self, key: tuple[str, str]) -> BBReviewStatus:
+        """The status of a pair of content and user ID."""
+        return self._statuses[key]
+
+    def __iter__(self) -> Iterator[BBReviewStatus]:
+        return iter(self._statuses.values())
+
+    def is_reviewed(self, content_id: str, user_id: str) -> bool:
+        return (content_id, user_id) in self._statuses
+
+    def reviewed_users(self, content_id: str) -> list[str]:
+        """Ids of the users who reviewed a content item."""
+        return list(self._content_users.get(content_id, []))
+
+    def reviewed_contents(self, user_id: str) -> list[str]:
+        """Ids of the content items a user reviewed."""
+        return list(self._user_contents.get(user_id, []))
+
+    def progress(self, user_id: str, content_ids: Iterable[str]) -> float:
+        """Fraction of some content items a user reviewed.
+
+        :param content_ids: The reviewable content items
+        """
+        ids = set(content_ids)
+        if not ids:
+            return 0.0
+        reviewed = ids.intersection(self._user_contents.get(user_id, []))
+        return len(reviewed) / len(ids)
@@ -0,0 +1,236 @@
+"""
+Blackboard Download Sink
+
+writes response bodies to disk with as little copying as possible.
+
+Basic usage:
+    >>> sink = DownloadSink(checksum='sha256')
+    >>> result = sink.write(session.download(...), Path('lecture.mp4'))
+    >>> result.digest
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+import hashlib
+import http.client
+import tempfile
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from collections.abc import Callable
+
+import requests
+
+# Reads into a buffer, returning the number of bytes read
+ReadInto = Callable[[memoryview], int]
+
+
+@dataclass(frozen=True)
+class SinkResult:
+    """A file written by a `DownloadSink`."""
+    path: Path
+    #: Bytes written
+    size: int
+    #: Hex digest of the body, if a checksum was requested
+    digest: str | None = None
+
+
+def _content_length(response: requests.Response) -> int | None:
+    try:
+        length = int(response.headers.get('Content-Length', ''))
+    except ValueError:
+        return None
+    return length if length >= 0 else None
+
+
+def _is_encoded(response: requests.Response) -> bool:
+    return response.headers.get('Content-Encoding',
+                                'identity') != 'identity'
+
+
+def _reader(response: requests.Response) -> ReadInto | None:
+    """Find a way to read the body straight into a buffer.
+
+    Encoded bodies must be decoded by `requests`, so they have none.
+    """
+    if _is_encoded(response):
+        return None
+
+    raw = response.raw
+    # The socket file under urllib3 fills buffers without a copy
+    fp = getattr(raw, '_fp', None)
+    if fp is not None and hasattr(fp, 'readinto'):
+        readinto: ReadInto = fp.readinto
+        return readinto
+    if hasattr(raw, 'readinto'):
+        readinto = raw.readinto
+        return readinto
+    return None
+
+
+def _release(response: requests.Response) -> None:
+    """Return the connection to the pool if the body was fully read."""
+    fp = getattr(response.raw, '_fp', None)
+    is_closed = getattr(fp, 'isclosed', None)
+    release = getattr(response.raw, 'release_conn', None)
+
+    if is_closed is not None and is_closed() and release is not None:
+        release()
+    response.close()
+
+
+class DownloadSink:
+    """Writes response bodies into files, replacing them atomically.
+
+    Bodies are read into a buffer that each thread allocates once
+    and written from views of it, so large files are not copied
+    chunk by chunk in Python. Files are preallocated from
+    `Content-Length` where the filesystem supports it, and the
+    checksum, if any, is computed in the same pass.
+
+    A sink may be shared by any number of threads.
+    """
+
+    def __init__(self, *, buffer_size: int = 1024 * 1024,
+                 checksum: str | None = None,
+                 preallocate: bool = True,
+                 fsync: bool = False,
+                 sync_every: int = 64 * 1024 * 1024):
+        """
+        :param buffer_size: Size of the buffer of each thread
+        :param checksum: A `hashlib` algorithm, e.g. ``sha256``
+        :param preallocate: Reserve the size of each file up front
+        :param fsync: Flush each file to disk before it replaces the
+            old one
+        :param sync_every: With `fsync`, also flush every time this
+            many bytes have been written, so writeback is spread out
+            rather than left for the end
+        """
+        if checksum is not None:
+            hashlib.new(checksum)
+        self.buffer_size = buffer_size
+        self.checksum = checksum
+        self.preallocate = preallocate
+        self.fsync = fsync
+        self.sync_every = sync_every
+        self._local = threading.local()
+
+    def _buffer(self) -> memoryview:
+        """The buffer of the current thread."""
+        view: memoryview | None = getattr(self._local, 'view', None)
+
+        if view is None or len(view) != self.buffer_size:
+            view = memoryview(bytearray(self.buffer_size))
+            self._local.view = view
+        return view
+
+    def _reserve(self, fd: int, length: int | None) -> None:
+        if not self.preallocate or not length or \
+                not hasattr(os, 'posix_fallocate'):
+            return
+        try:
+            os.posix_fallocate(fd, 0, length)
+        except OSError:
+            # Not supported by every filesystem
+            pass
+
+    def _copy(self, response: requests.Response, fd: int,
+              update: Callable[[memoryview], object] | None) -> int:
+        """Copy a body into a file descriptor."""
+        readinto = _reader(response)
+        written = 0
+        unsynced = 0
+
+        def put(chunk: memoryview) -> None:
+            nonlocal written, unsynced
+            if update is not None:
+                update(chunk)
+            while chunk:
+                n = os.write(fd, chunk)
+                chunk = chunk[n:]
+                written += n
+                unsynced += n
+            if self.fsync and unsynced >= self.sync_every:
+                os.fsync(fd)
+                unsynced = 0
+
+        if readinto is None:
+            for data in response.iter_content(self.buffer_size):
+                put(memoryview(data))
+            return written
+
+        buffer = self._buffer()
+        try:
+            while n := readinto(buffer):
+                put(buffer[:n])
+        except http.client.HTTPException as e:
+            # Reported like requests does for a broken body
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+        except TimeoutError as e:
+            raise requests.ReadTimeout(e) from e
+        return written
+
+    def write(self, response: requests.Response,
+              path: Path) -> SinkResult:
+        """Write the body of a streamed response into a file.
+
+        :param response: The response, closed once written
+        :param path: The file, replaced only once fully written
+        :raises requests.HTTPError: If the response is an error
+        :raises requests.exceptions.ChunkedEncodingError: If the body
+            is shorter than its Content-Length
+        """
+        try:
+            response.raise_for_status()
+        except BaseException:
+            response.close()
+            raise
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        digest = hashlib.new(self.checksum) \
+            if self.checksum is not None else None
+        length = _content_length(response)
+
+        try:
+            try:
+                self._reserve(fd, length)
+                written = self._copy(response, fd,
+                                     digest.update if digest else None)
+
+                if length is not None and written < length:
+                    if not _is_encoded(response):
+                        raise requests.exceptions.ChunkedEncodingError(
+                            f"Body ended after {written} of {length} bytes"
+                        )
+                    # A decoded body may be shorter than the encoded one
+                    os.ftruncate(fd, written)
+                if self.fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            response.close()
+            raise
+
+        _release(response)
+        return SinkResult(path, written,
+                          digest.hexdigest() if digest else None)
@@ -0,0 +1,267 @@
+"""
+Blackboard Snapshots
+
+a compact binary file of crawled data, for a fast warm start.
+
+Records are stored as msgpack and read from a memory map, models
+are only built when accessed. Requires the `snapshot` extra.
+
+Basic usage:
+    >>> write_snapshot('bb.snap', courses=courses, contents=contents)
+    >>> with Snapshot('bb.snap') as snapshot:
+    ...     snapshot.contents(course_id)
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+import mmap
+import struct
+import tempfile
+from array import array
+from pathlib import Path
+from types import TracebackType
+from datetime import datetime, timezone
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, BinaryIO, TypeVar, overload
+
+from .blackboard import (
+    BBCourse,
+    BBAttachment,
+    BBMembership,
+    ImmutableModel,
+    BBCourseContent
+)
+
+try:
+    import msgpack
+except ImportError as e:  # pragma: no cover
+    raise ImportError("Snapshots require msgpack, "
+                      "install bblearn[snapshot]") from e
+
+M = TypeVar('M', bound=ImmutableModel)
+
+#: Version of the snapshot format, bumped on incompatible changes
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b'BBSNAP\r\n'
+# Magic, format version, index offset and index length
+_HEADER = struct.Struct('<8sHQQ')
+
+
+class _SectionWriter:
+    """Records of one model, optionally grouped by key."""
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self.offsets = array('Q', [f.tell()])
+        self.groups: dict[str, tuple[int, int]] = {}
+
+    def add(self, models: Iterable[ImmutableModel],
+            key: str | None = None) -> None:
+        start = len(self.offsets) - 1
+
+        for model in models:
+            self._f.write(msgpack.packb(model.model_dump(mode='json',
+                                                         exclude_unset=True)))
+            self.offsets.append(self._f.tell())
+
+        if key is not None:
+            self.groups[key] = (start, len(self.offsets) - 1)
+
+    def index(self) -> dict[str, Any]:
+        return {'offsets': self.offsets.tobytes(), 'groups': self.groups}
+
+
+def write_snapshot(path: str | os.PathLike[str], *,
+                   courses: Iterable[BBCourse] = (),
+                   memberships: Iterable[BBMembership] = (),
+                   contents: Mapping[str, Iterable[BBCourseContent]] = {},
+                   attachments: Mapping[str, Iterable[BBAttachment]] = {}
+                   ) -> None:
+    """Write crawled data to a snapshot file, replacing it atomically.
+
+    :param courses: Courses, looked up by id
+    :param memberships: Memberships of the user
+    :param contents: Content trees by course id, e.g. from a crawl
+    :param attachments: Attachments by content id
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, 0, 0))
+            lists: dict[str, Iterable[ImmutableModel]] = {
+                'courses': courses, 'memberships': memberships
+            }
+            grouped: dict[str, Mapping[str, Iterable[ImmutableModel]]] = {
+                'contents': contents, 'attachments': attachments
+            }
+            sections = {}
+
+            for name, models in lists.items():
+                sections[name] = _SectionWriter(f)
+                sections[name].add(models)
+
+            for name, groups in grouped.items():
+                sections[name] = _SectionWriter(f)
+                for key, models in groups.items():
+                    sections[name].add(models, key)
+
+            index = msgpack.packb({
+                'created': datetime.now(timezone.utc).isoformat(),
+                'sections': {k: s.index() for k, s in sections.items()},
+            })
+            index_offset = f.tell()
+            f.write(index)
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION,
+                                 index_offset, len(index)))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class SnapshotSection(Sequence[M]):
+    """Records of a snapshot, built into models on first access."""
+
+    def __init__(self, view: memoryview, model: type[M],
+                 offsets: 'array[int]', start: int = 0,
+                 stop: int | None = None,
+                 models: dict[int, M] | None = None):
+        """
+        :param models: Models already built, by record, which may be
+            shared with other slices of the same records
+        """
+        self._view = view
+        self._model = model
+        self._offsets = offsets
+        self._start = start
+        self._stop = len(offsets) - 1 if stop is None else stop
+        self._models: dict[int, M] = {} if models is None else models
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def _load(self, i: int) -> M:
+        model = self._models.get(i)
+        if model is None:
+            record = self._view[self._offsets[i]:self._offsets[i + 1]]
+            model = self._model.model_validate(msgpack.unpackb(record))
+            self._models[i] = model
+        return model
+
+    @overload
+    def __getitem__(self, i: int) -> M: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[M]: ...
+
+    def __getitem__(self, i: int | slice) -> M | list[M]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._load(self._start + i)
+
+
+class Snapshot:
+    """A snapshot file, mapped into memory.
+
+    Only the index is read when opened. Records are read and built
+    into models when they are first accessed.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """
+        :raises ValueError: If the file is not a snapshot of a
+            supported version
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._view = memoryview(self._mmap)
+
+        try:
+            magic, version, offset, length = \
+                _HEADER.unpack_from(self._view)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a snapshot")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version {version}")
+            index = msgpack.unpackb(self._view[offset:offset + length])
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+        self.created = datetime.fromisoformat(index['created'])
+        self._sections = index['sections']
+        self._offsets = {k: array('Q', s['offsets'])
+                         for k, s in self._sections.items()}
+        # Models built from each section, shared by all its groups
+        self._models: dict[str, dict[int, Any]] = \
+            {k: {} for k in self._sections}
+
+        self.courses = SnapshotSection(self._view, BBCourse,
+                                       self._offsets['courses'])
+        self.memberships = SnapshotSection(self._view, BBMembership,
+                                           self._offsets['memberships'])
+        self._course_ids: dict[str, int] | None = None
+
+    def course(self, course_id: str) -> BBCourse | None:
+        """Look up a course by id."""
+        if self._course_ids is None:
+            self._course_ids = {c.id: i for i, c in enumerate(self.courses)}
+        i = self._course_ids.get(course_id)
+        return None if i is None else self.courses[i]
+
+    def _group(self, section: str, key: str,
+               model: type[M]) -> SnapshotSection[M]:
+        start, stop = self._sections[section]['groups'].get(key, (0, 0))
+        return SnapshotSection(self._view, model, self._offsets[section],
+                               start, stop, self._models[section])
+
+    @property
+    def course_ids(self) -> list[str]:
+        """Ids of the courses with a content tree."""
+        return list(self._sections['contents']['groups'])
+
+    def contents(self, course_id: str) -> SnapshotSection[BBCourseContent]:
+        """The content tree of a course, empty if unknown."""
+        return self._group('contents', course_id, BBCourseContent)
+
+    def attachments(self, content_id: str) -> SnapshotSection[BBAttachment]:
+        """The attachments of a content, empty if unknown."""
+        return self._group('attachments', content_id, BBAttachment)
+
+    def close(self) -> None:
+        """Unmap the file, models already built remain usable."""
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'Snapshot':
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
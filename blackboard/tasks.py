@@ -0,0 +1,288 @@
+"""
+Blackboard Tasks
+
+waits for many background tasks at once.
+
+Basic usage:
+    >>> with TaskWaiter(session) as waiter:
+    ...     futures = [waiter.wait_course_task(c, t) for c, t in tasks]
+    ...     results = [f.result() for f in futures]
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+import heapq
+import random
+import logging
+import itertools
+import threading
+from types import TracebackType
+from dataclasses import dataclass, field
+from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any
+
+import requests
+
+from .api import BlackboardSession
+from .blackboard import BBTask, BBTaskStatus
+from .exceptions import BBStatusError, BBTaskFailedError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _Pending:
+    """A task being waited for."""
+    poll: Callable[[], Any]
+    future: 'Future[Any]'
+    interval: float
+    started: float
+    deadline: float | None
+    errors: int = 0
+    progress: float = 0.0
+    name: str = field(default='')
+
+    def resolve(self, result: Any = None,
+                exception: BaseException | None = None) -> None:
+        try:
+            if exception is not None:
+                self.future.set_exception(exception)
+            else:
+                self.future.set_result(result)
+        except InvalidStateError:
+            # Cancelled by the caller meanwhile
+            pass
+
+
+class TaskWaiter:
+    """Waits for background tasks to finish.
+
+    A single scheduler thread decides when each task is polled next,
+    and polls are sent from a small pool of threads. Intervals grow
+    while a task runs and shrink when its progress suggests it is
+    about to finish, with jitter so tasks started together do not
+    poll together.
+    """
+
+    def __init__(self, session: BlackboardSession, *,
+                 initial_interval: float = 1.0,
+                 max_interval: float = 30.0,
+                 backoff: float = 1.5,
+                 jitter: float = 0.2,
+                 max_errors: int = 3,
+                 max_workers: int = 4):
+        """
+        :param session: The session used to poll tasks
+        :param initial_interval: Seconds between the first polls,
+            the first one is sent straight away
+        :param max_interval: Maximum seconds between polls
+        :param backoff: Interval growth after each poll
+        :param jitter: Random fraction added to or removed from
+            each interval
+        :param max_errors: Consecutive connection errors before a
+            task is failed
+        :param max_workers: Maximum number of concurrent polls
+        """
+        self._session = session
+        self._initial = initial_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._jitter = jitter
+        self._max_errors = max_errors
+        self._polls = ThreadPoolExecutor(max_workers=max_workers,
+                                         thread_name_prefix='bb-task-poll')
+        self._heap: list[tuple[float, int, _Pending]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='bb-task-scheduler')
+        self._thread.start()
+
+    def _schedule(self, pending: _Pending, delay: float) -> None:
+        delay *= 1 + random.uniform(-self._jitter, self._jitter)
+        due = time.monotonic() + max(delay, 0.0)
+
+        if pending.deadline is not None:
+            due = min(due, pending.deadline)
+
+        with self._condition:
+            if self._closed:
+                pending.future.cancel()
+                return
+            heapq.heappush(self._heap, (due, next(self._counter), pending))
+            self._condition.notify()
+
+    def _wait(self, poll: Callable[[], Any], name: str,
+              timeout: float | None,
+              callback: Callable[['Future[Any]'], Any] | None
+              ) -> 'Future[Any]':
+        if self._closed:
+            raise RuntimeError("TaskWaiter is closed")
+
+        now = time.monotonic()
+        future: Future[Any] = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        pending = _Pending(poll, future, self._initial, now,
+                           None if timeout is None else now + timeout,
+                           name=name)
+        self._schedule(pending, 0)
+        return future
+
+    def wait_course_task(self, course_id: str, task_id: str, *,
+                         timeout: float | None = None,
+                         callback: Callable[['Future[Any]'], Any] | None
+                         = None) -> 'Future[Any]':
+        """Wait for a course task, such as a copy.
+
+        :param course_id: The course or organization ID.
+        :param task_id: The task ID.
+        :param timeout: Seconds before the future fails with
+            `TimeoutError`
+        :param callback: Called with the future once done
+        :returns: A future of the resource the task created, or the
+            task itself if there is none
+        """
+        return self._wait(
+            lambda: self._session.fetch_task(course_id=course_id,
+                                             task_id=task_id),
+            f"{course_id}/{task_id}", timeout, callback
+        )
+
+    def wait_system_task(self, task_id: str, *,
+                         timeout: float | None = None,
+                         callback: Callable[['Future[Any]'], Any] | None
+                         = None) -> 'Future[Any]':
+        """Wait for a system task.
+
+        :param task_id: The task ID.
+        :param timeout: Seconds before the future fails with
+            `TimeoutError`
+        :param callback: Called with the future once done
+        :returns: A future of the completed task
+        """
+        return self._wait(
+            lambda: self._session.fetch_system_task(task_id=task_id),
+            task_id, timeout, callback
+        )
+
+    def _next_interval(self, pending: _Pending, task: BBTask) -> float:
+        interval = pending.interval
+        progress = task.percentComplete or 0.0
+
+        # Estimate the time left from the progress so far
+        if 0 < progress < 100 and progress > pending.progress:
+            elapsed = time.monotonic() - pending.started
+            remaining = elapsed * (100 - progress) / progress
+            interval = max(min(interval, remaining), self._initial)
+
+        pending.progress = max(pending.progress, progress)
+        pending.interval = min(interval * self._backoff, self._max_interval)
+        return interval
+
+    def _poll(self, pending: _Pending) -> None:
+        """Poll a task once, in a pool thread."""
+        try:
+            result = pending.poll()
+        except BBStatusError as e:
+            task_data = e.args[0] if e.args else None
+            if not isinstance(task_data, dict):
+                pending.resolve(exception=e)
+                return
+
+            # Task bodies have a status key, reported as an error
+            task = BBTask(**task_data)
+            if task.status is None or task.status == BBTaskStatus.Other:
+                pending.resolve(exception=e)
+            elif task.status == BBTaskStatus.Complete:
+                pending.resolve(task)
+            elif task.status.pending:
+                pending.errors = 0
+                self._schedule(pending, self._next_interval(pending, task))
+            else:
+                pending.resolve(exception=BBTaskFailedError(task))
+        except requests.RequestException as e:
+            pending.errors += 1
+            if pending.errors >= self._max_errors:
+                pending.resolve(exception=e)
+            else:
+                logger.warning(f"Polling task {pending.name} failed: {e!r}")
+                self._schedule(pending, self._next_interval(pending,
+                                                            BBTask()))
+        except Exception as e:
+            pending.resolve(exception=e)
+        else:
+            # Finished tasks redirect to the resource they created
+            pending.resolve(result)
+
+    def _run(self) -> None:
+        """Hand due tasks over to the poll threads."""
+        while True:
+            with self._condition:
+                while not self._closed and (
+                        not self._heap or
+                        self._heap[0][0] > time.monotonic()):
+                    timeout = self._heap[0][0] - time.monotonic() \
+                        if self._heap else None
+                    self._condition.wait(timeout)
+
+                if self._closed:
+                    return
+                _, _, pending = heapq.heappop(self._heap)
+
+            if pending.future.done():
+                continue
+            if pending.deadline is not None and \
+                    time.monotonic() >= pending.deadline:
+                pending.resolve(exception=TimeoutError(
+                    f"Task {pending.name} did not finish"
+                ))
+                continue
+
+            self._polls.submit(self._poll, pending)
+
+    def __len__(self) -> int:
+        """Number of tasks waiting for their next poll."""
+        with self._condition:
+            return sum(not p.future.done() for _, _, p in self._heap)
+
+    def close(self) -> None:
+        """Stop polling, cancelling the futures of unfinished tasks."""
+        with self._condition:
+            self._closed = True
+            pending = [p for _, _, p in self._heap]
+            self._heap.clear()
+            self._condition.notify()
+
+        self._thread.join()
+        self._polls.shutdown(wait=True)
+
+        for p in pending:
+            p.future.cancel()
+
+    def __enter__(self) -> 'TaskWaiter':
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
@@ -0,0 +1,114 @@
+"""
+Blackboard Terms
+
+looks up the terms of courses once, however many courses share them.
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+import logging
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future
+
+from .api import BlackboardSession
+from .blackboard import BBTerm
+from .timeouts import ContextExecutor
+from .exceptions import BBStatusError, BBUnauthorizedError
+
+logger = logging.getLogger(__name__)
+
+
+class TermResolver:
+    """Looks up terms by ID, keeping them in memory for a while.
+
+    Each term is fetched once per TTL, whichever course or session
+    asks for it, and concurrent lookups of a term wait for a single
+    request. It is safe to share between threads and sessions.
+    """
+
+    def __init__(self, session: BlackboardSession, *,
+                 ttl: float = 86400,
+                 max_workers: int = 8):
+        """
+        :param session: The session used to fetch terms
+        :param ttl: Seconds before a term is fetched again
+        :param max_workers: Maximum number of concurrent requests
+        """
+        self._session = session
+        self._ttl = ttl
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._terms: dict[str, tuple[float, Future[BBTerm | None]]] = {}
+
+    def _fetch(self, term_id: str) -> BBTerm | None:
+        try:
+            return BBTerm(**self._session.fetch_terms(term_id=term_id))
+        except BBUnauthorizedError:
+            raise
+        except BBStatusError:
+            logger.warning(f"Term {term_id} is not available")
+            return None
+
+    def get(self, term_id: str) -> BBTerm | None:
+        """Look up a term.
+
+        :returns: `None` if the term cannot be fetched
+        """
+        with self._lock:
+            entry = self._terms.get(term_id)
+
+            if entry is not None and \
+                    time.monotonic() - entry[0] < self._ttl:
+                owner, future = False, entry[1]
+            else:
+                owner, future = True, Future()
+                self._terms[term_id] = (time.monotonic(), future)
+
+        if not owner:
+            return future.result()
+
+        try:
+            future.set_result(self._fetch(term_id))
+        except BaseException as e:
+            # Let the next lookup try again
+            with self._lock:
+                entry = self._terms.get(term_id)
+                if entry is not None and entry[1] is future:
+                    del self._terms[term_id]
+            future.set_exception(e)
+            raise
+        return future.result()
+
+    def resolve(self, term_ids: Iterable[str | None]) -> dict[str, BBTerm]:
+        """Look up many terms concurrently.
+
+        :param term_ids: Term IDs, repeated or `None` ones are ignored
+        :returns: The terms that could be fetched, by ID
+        """
+        ids = list(dict.fromkeys(i for i in term_ids if i is not None))
+
+        with ContextExecutor(max_workers=self._max_workers) as executor:
+            terms = executor.map(self.get, ids)
+            return {i: t for i, t in zip(ids, terms) if t is not None}
+
+    def invalidate(self) -> None:
+        """Fetch every term again on next use."""
+        with self._lock:
+            self._terms.clear()
@@ -0,0 +1,193 @@
+"""
+Load Test Harness
+
+drives concurrent Blackboard sessions and reports latency percentiles.
+
+Basic usage:
+    >>> report = run_load(server.url, sessions=8, iterations=20)
+    >>> print(report.summary())
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+import logging
+import argparse
+import statistics
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.cookies import RequestsCookieJar
+
+from ..api_extended import BlackboardExtended
+from ..blackboard import BBResourceType
+from .server import MockConfig, MockBlackboardServer
+
+logger = logging.getLogger(__name__)
+
+Scenario = Callable[[BlackboardExtended, int], object]
+SessionFactory = Callable[[str], BlackboardExtended]
+
+
+def crawl_course(session: BlackboardExtended, iteration: int) -> None:
+    """Walk the content tree and attachments of one of the courses.
+
+    Courses are taken in turns, so each iteration visits another one.
+    """
+    courses = session.ex_fetch_courses(user_id=session.user_id)
+    if not courses:
+        return
+
+    course_id = courses[iteration % len(courses)].id
+    folders = session.fetch_contents(course_id=course_id)
+
+    while folders:
+        content = folders.pop()
+
+        if content.hasChildren:
+            folders.extend(session.fetch_content_children(
+                course_id=course_id, content_id=content.id
+            ))
+        elif content.contentHandler == BBResourceType.File:
+            session.fetch_file_attachments(
+                course_id=course_id, content_id=content.id
+            )
+
+
+@dataclass
+class LoadReport:
+    """Results of a load test."""
+    sessions: int
+    duration: float
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def operations(self) -> int:
+        """Number of successful operations."""
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Successful operations per second."""
+        return self.operations / self.duration if self.duration else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Latency in seconds below which `p` percent of operations
+        completed."""
+        if not self.latencies:
+            return 0.0
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+
+        cuts = statistics.quantiles(self.latencies, n=1000,
+                                    method='inclusive')
+        index = min(max(round(p * 10) - 1, 0), len(cuts) - 1)
+        return cuts[index]
+
+    def summary(self) -> str:
+        """Human readable summary of the results."""
+        return (
+            f"{self.operations} ops, {self.errors} errors "
+            f"in {self.duration:.2f}s with {self.sessions} sessions: "
+            f"{self.throughput:.1f} ops/s, "
+            + ', '.join(f"p{p}={self.percentile(p) * 1000:.1f}ms"
+                        for p in (50, 90, 95, 99))
+        )
+
+
+def _new_session(url: str) -> BlackboardExtended:
+    return BlackboardExtended(url, cookies=RequestsCookieJar())
+
+
+def run_load(url: str, *, sessions: int = 8, iterations: int = 10,
+             scenario: Scenario = crawl_course,
+             session_factory: SessionFactory = _new_session) -> LoadReport:
+    """Run a scenario repeatedly from many concurrent sessions.
+
+    :param url: URL of the Blackboard instance
+    :param sessions: Number of concurrent sessions
+    :param iterations: Times each session runs the scenario
+    :param scenario: Operation to measure, taking a session and the
+        iteration number
+    :param session_factory: Creates a session for the given URL
+    """
+
+    def worker() -> tuple[list[float], int]:
+        session = session_factory(url)
+        latencies: list[float] = []
+        errors = 0
+
+        for i in range(iterations):
+            start = time.perf_counter()
+            try:
+                scenario(session, i)
+            except Exception as e:
+                logger.debug(f"Operation failed: {e!r}")
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+
+        return latencies, errors
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        futures = [executor.submit(worker) for _ in range(sessions)]
+        results = [f.result() for f in futures]
+
+    report = LoadReport(sessions, time.perf_counter() - start)
+
+    for latencies, errors in results:
+        report.latencies.extend(latencies)
+        report.errors += errors
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Blackboard load test")
+    parser.add_argument('url', nargs='?',
+                        help="Instance URL, default a local mock server")
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--iterations', type=int, default=10)
+    parser.add_argument('--courses', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=None)
+    args = parser.parse_args()
+
+    if args.url is not None:
+        report = run_load(args.url, sessions=args.sessions,
+                          iterations=args.iterations)
+    else:
+        config = MockConfig(courses=args.courses, latency=args.latency,
+                            jitter=args.jitter, rate_limit=args.rate_limit)
+
+        with MockBlackboardServer(config) as server:
+            report = run_load(server.url, sessions=args.sessions,
+                              iterations=args.iterations)
+            print(f"Server handled {server.request_count} requests, "
+                  f"throttled {server.throttled_count}")
+
+    print(report.summary())
+
+
+if __name__ == '__main__':
+    main()
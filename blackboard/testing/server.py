@@ -0,0 +1,437 @@
+"""
+Mock Blackboard Server
+
+a local stand-in for the Blackboard REST API with synthetic data.
+
+Basic usage:
+    >>> with MockBlackboardServer(MockConfig(courses=5)) as server:
+    ...     session = BlackboardSession(server.url, cookies=...)
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import re
+import json
+import time
+import random
+import hashlib
+import logging
+import argparse
+import threading
+from types import TracebackType
+from dataclasses import dataclass
+from urllib.parse import urlsplit, parse_qs
+from collections.abc import Callable
+from typing import Any
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+_USER_ID = '_1_1'
+
+
+@dataclass
+class MockConfig:
+    """Shape and behaviour of the mock Blackboard instance."""
+    #: Number of courses the user is enrolled in
+    courses: int = 10
+    #: Levels of folders in each course
+    depth: int = 2
+    #: Items in each folder
+    breadth: int = 5
+    #: Attachments of each file item
+    attachments: int = 1
+    #: Size in bytes of each attachment
+    attachment_size: int = 64 * 1024
+    #: Maximum number of results in each page
+    page_size: int = 100
+    #: Seconds added to every response
+    latency: float = 0.0
+    #: Random extra seconds added to every response
+    jitter: float = 0.0
+    #: Requests per second allowed before responding 429
+    rate_limit: float | None = None
+    #: Send ETags and honour If-None-Match
+    etags: bool = True
+    #: Seed of the synthetic data
+    seed: int = 0
+
+
+def _timestamp(rng: random.Random) -> str:
+    seconds = rng.randrange(1_600_000_000, 1_800_000_000)
+    return time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(seconds))
+
+
+class MockData:
+    """Synthetic courses, memberships, contents and attachments."""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.user = {'id': _USER_ID, 'userName': 'student',
+                     'name': {'given': 'Mock', 'family': 'Student'}}
+        self.courses: dict[str, dict[str, Any]] = {}
+        self.memberships: list[dict[str, Any]] = []
+        self.contents: dict[str, dict[str, Any]] = {}
+        self.top_level: dict[str, list[str]] = {}
+        self.children: dict[str, list[str]] = {}
+        self.attachments: dict[str, list[dict[str, Any]]] = {}
+        self._next_id = 1
+        rng = random.Random(config.seed)
+
+        for i in range(1, config.courses + 1):
+            course_id = f"_{i}_1"
+            code = f"CO{1000 + i}"
+            created = _timestamp(rng)
+            self.courses[course_id] = {
+                'id': course_id, 'courseId': code,
+                'name': f"{code} : Mock Course {i}, 2026",
+                'created': created, 'modified': created,
+                'availability': {'available': 'Yes'},
+            }
+            self.memberships.append({
+                'id': f"_{i}_1", 'userId': _USER_ID, 'courseId': course_id,
+                'dataSourceId': '_2_1', 'created': created,
+                'availability': {'available': 'Yes'},
+                'courseRoleId': 'Student',
+            })
+            self.top_level[course_id] = self._folder(rng, None, config.depth)
+
+        self.blob = bytes(rng.getrandbits(8) for _ in range(256))
+
+    def _id(self) -> str:
+        self._next_id += 1
+        return f"_{self._next_id}_1"
+
+    def _folder(self, rng: random.Random, parent_id: str | None,
+                depth: int) -> list[str]:
+        """Create the items of a folder, recursing into subfolders."""
+        ids = []
+
+        for position in range(self.config.breadth):
+            content_id = self._id()
+            folder = depth > 0 and position % 2 == 0
+            handler = 'x-bb-folder' if folder else (
+                'x-bb-file' if position % 3 else 'x-bb-document'
+            )
+            modified = _timestamp(rng)
+            self.contents[content_id] = {
+                'id': content_id, 'parentId': parent_id,
+                'title': f"Item {position + 1}", 'position': position,
+                'body': f"<p>Content {content_id}</p>",
+                'created': modified, 'modified': modified,
+                'hasChildren': folder,
+                'availability': {'available': 'Yes'},
+                'contentHandler': {'id': f"resource/{handler}"},
+            }
+
+            if folder:
+                self.children[content_id] = self._folder(
+                    rng, content_id, depth - 1
+                )
+            elif handler == 'x-bb-file':
+                self.attachments[content_id] = [{
+                    'id': f"{content_id}_{n}",
+                    'fileName': f"file_{content_id}_{n}.pdf",
+                    'mimeType': 'application/pdf',
+                } for n in range(self.config.attachments)]
+            ids.append(content_id)
+
+        return ids
+
+    def download(self, attachment_id: str) -> bytes:
+        """Deterministic contents of an attachment."""
+        size = self.config.attachment_size
+        repeats = size // len(self.blob) + 1
+        return (attachment_id.encode() + self.blob * repeats)[:size]
+
+
+class _TokenBucket:
+    """Rate limiter for throttling with 429 responses."""
+
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._rate, self._tokens +
+                               (now - self._updated) * self._rate)
+            self._updated = now
+
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+Response = tuple[int, Any]
+Route = Callable[[re.Match[str]], Response]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server: 'MockBlackboardServer'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format, *args)
+
+    def do_GET(self) -> None:
+        self.server.respond(self)
+
+
+class MockBlackboardServer(ThreadingHTTPServer):
+    """A local server imitating a Blackboard REST API instance.
+
+    Besides synthetic data, it can inject latency, throttle clients
+    with 429 responses, page results and answer conditional requests.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, config: MockConfig | None = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        """
+        :param config: Shape and behaviour of the instance
+        :param host: Address to bind to
+        :param port: Port to bind to, default any free port
+        """
+        super().__init__((host, port), _Handler)
+        self.config = config or MockConfig()
+        self.data = MockData(self.config)
+        self.request_count = 0
+        self.throttled_count = 0
+        self._bucket = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+        if self.config.rate_limit is not None:
+            self._bucket = _TokenBucket(self.config.rate_limit)
+
+        api = r'/learn/api/public/v\d+'
+        course = api + r'/courses/(?P<course>[^/]+)'
+        content = course + r'/contents/(?P<content>[^/]+)'
+        routes: list[tuple[str, Route]] = [
+            (api + r'/system/version', self._version),
+            (api + r'/users/(?P<user>[^/]+)', self._user),
+            (api + r'/users/(?P<user>[^/]+)/courses', self._memberships),
+            (api + r'/courses', self._courses),
+            (course, self._course),
+            (course + r'/contents', self._top_level),
+            (content, self._content),
+            (content + r'/children', self._children),
+            (content + r'/attachments', self._attachments),
+            (content + r'/attachments/(?P<attachment>[^/]+)',
+             self._attachment),
+            (content + r'/attachments/(?P<attachment>[^/]+)/download',
+             self._download),
+        ]
+        self._routes = [(re.compile(p), f) for p, f in routes]
+
+    @property
+    def url(self) -> str:
+        """URL of the instance, as given to `BlackboardSession`."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> None:
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.stop()
+
+    # Routes
+
+    def _not_found(self) -> Response:
+        return 404, {'status': 404, 'message': 'Not Found'}
+
+    def _version(self, m: re.Match[str]) -> Response:
+        return 200, {'learn': {'major': 3900, 'minor': 0, 'patch': 0}}
+
+    def _user(self, m: re.Match[str]) -> Response:
+        if m['user'] not in ('me', _USER_ID):
+            return self._not_found()
+        return 200, self.data.user
+
+    def _memberships(self, m: re.Match[str]) -> Response:
+        if m['user'] not in ('me', _USER_ID):
+            return self._not_found()
+        return 200, self.data.memberships
+
+    def _courses(self, m: re.Match[str]) -> Response:
+        return 200, list(self.data.courses.values())
+
+    def _course(self, m: re.Match[str]) -> Response:
+        course = self.data.courses.get(m['course'])
+        return (200, course) if course else self._not_found()
+
+    def _top_level(self, m: re.Match[str]) -> Response:
+        ids = self.data.top_level.get(m['course'])
+        if ids is None:
+            return self._not_found()
+        return 200, [self.data.contents[i] for i in ids]
+
+    def _content(self, m: re.Match[str]) -> Response:
+        content = self.data.contents.get(m['content'])
+        return (200, content) if content else self._not_found()
+
+    def _children(self, m: re.Match[str]) -> Response:
+        if m['content'] not in self.data.contents:
+            return self._not_found()
+        ids = self.data.children.get(m['content'], [])
+        return 200, [self.data.contents[i] for i in ids]
+
+    def _attachments(self, m: re.Match[str]) -> Response:
+        if m['content'] not in self.data.contents:
+            return self._not_found()
+        return 200, self.data.attachments.get(m['content'], [])
+
+    def _attachment(self, m: re.Match[str]) -> Response:
+        for a in self.data.attachments.get(m['content'], []):
+            if a['id'] == m['attachment']:
+                return 200, a
+        return self._not_found()
+
+    def _download(self, m: re.Match[str]) -> Response:
+        status, attachment = self._attachment(m)
+        if status != 200:
+            return status, attachment
+        return 200, self.data.download(m['attachment'])
+
+    # Request handling
+
+    def _page(self, path: str, query: dict[str, list[str]],
+              results: list[Any]) -> dict[str, Any]:
+        """Slice a list of results into a page."""
+        offset = int(query.get('offset', ['0'])[0])
+        limit = int(query.get('limit', [str(self.config.page_size)])[0])
+        limit = min(limit, self.config.page_size)
+        body: dict[str, Any] = {'results': results[offset:offset + limit]}
+
+        if offset + limit < len(results):
+            body['paging'] = {
+                'nextPage': f"{path}?offset={offset + limit}&limit={limit}"
+            }
+        return body
+
+    def _route(self, path: str, query: dict[str, list[str]]
+               ) -> tuple[int, bytes, str]:
+        for pattern, route in self._routes:
+            if (m := pattern.fullmatch(path)):
+                status, body = route(m)
+                break
+        else:
+            status, body = self._not_found()
+
+        if isinstance(body, bytes):
+            return status, body, 'application/octet-stream'
+        if isinstance(body, list):
+            body = self._page(path, query, body)
+        return status, json.dumps(body).encode(), 'application/json'
+
+    def respond(self, handler: BaseHTTPRequestHandler) -> None:
+        """Answer a single request."""
+        config = self.config
+
+        with self._lock:
+            self.request_count += 1
+
+        if config.latency or config.jitter:
+            time.sleep(config.latency + random.uniform(0, config.jitter))
+
+        headers: dict[str, str] = {}
+
+        if self._bucket is not None and not self._bucket.take():
+            with self._lock:
+                self.throttled_count += 1
+            status, content_type = 429, 'application/json'
+            body = json.dumps({'status': 429,
+                               'message': 'Too Many Requests'}).encode()
+            headers['Retry-After'] = '1'
+        else:
+            url = urlsplit(handler.path)
+            status, body, content_type = self._route(
+                url.path.rstrip('/'), parse_qs(url.query)
+            )
+
+        if config.etags and status == 200:
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            headers['ETag'] = etag
+
+            if handler.headers.get('If-None-Match') == etag:
+                status, body = 304, b''
+
+        handler.send_response(status)
+        if body:
+            handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock Blackboard server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--courses', type=int, default=10)
+    parser.add_argument('--depth', type=int, default=2)
+    parser.add_argument('--breadth', type=int, default=5)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=None)
+    args = parser.parse_args()
+
+    config = MockConfig(courses=args.courses, depth=args.depth,
+                        breadth=args.breadth, page_size=args.page_size,
+                        latency=args.latency, jitter=args.jitter,
+                        rate_limit=args.rate_limit)
+    server = MockBlackboardServer(config, args.host, args.port)
+    print(f"Serving mock Blackboard at {server.url}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+"""
+Blackboard Timeouts
+
+per-endpoint timeouts and deadlines shared by nested calls.
+
+Basic usage:
+    >>> with deadline(5):
+    ...     courses = session.ex_fetch_courses(user_id=session.user_id)
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import re
+import time
+import contextvars
+from types import TracebackType
+from dataclasses import dataclass
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from typing import Any, TypeVar
+from typing_extensions import ParamSpec
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from .transport import BBTransport, Timeout
+from .exceptions import BBDeadlineExceededError
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+#: Connect and read timeouts, by regular expression of the URL path.
+#: The first matching expression is used, other requests keep the
+#: timeout of the client.
+DEFAULT_TIMEOUTS: dict[str, Timeout] = {
+    r'.*/bbcswebdav/.*': (6.05, 120),
+    r'.*/attachments/[^/]+/download': (6.05, 120),
+    r'.*/v\d+/users/[^/]+/avatar': (6.05, 30),
+}
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """A point in time by which work must be done."""
+    #: Monotonic time of the deadline
+    expires_at: float
+
+    def remaining(self) -> float:
+        """Seconds left, zero once expired."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """Raise if the deadline has expired.
+
+        :raises BBDeadlineExceededError:
+        """
+        if self.expired:
+            raise BBDeadlineExceededError("Deadline exceeded")
+
+
+_deadline: contextvars.ContextVar[Deadline | None] = \
+    contextvars.ContextVar('bblearn_deadline', default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """The innermost deadline of the current context, if any."""
+    return _deadline.get()
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """Give the calls inside a time budget.
+
+    Nested deadlines can only shorten the budget. Every request
+    sent meanwhile has its timeouts capped by the time left, and
+    fails with `BBDeadlineExceededError` once none is left. Work
+    submitted to a `ContextExecutor` shares the same budget.
+
+    :param seconds: The budget
+    """
+    new = Deadline(time.monotonic() + seconds)
+    outer = _deadline.get()
+
+    if outer is not None and outer.expires_at < new.expires_at:
+        new = outer
+
+    token = _deadline.set(new)
+    try:
+        yield new
+    finally:
+        _deadline.reset(token)
+
+
+def _cap(timeout: Timeout, limit: float) -> Timeout:
+    """Cap the connect and read parts of a timeout."""
+    if timeout is None:
+        return limit
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return (min(connect, limit),
+                limit if read is None else min(read, limit))
+    return min(timeout, limit)
+
+
+class TimeoutTransport(BBTransport):
+    """Applies per-endpoint timeouts and the current deadline."""
+
+    def __init__(self, inner: BaseAdapter | None = None, *,
+                 timeouts: Mapping[str, Timeout] | None = None):
+        """
+        :param inner: The adapter that actually sends requests
+        :param timeouts: Timeouts by regular expression of the URL
+            path, either seconds or a pair of connect and read
+            seconds, `DEFAULT_TIMEOUTS` if `None`
+        """
+        super().__init__(inner)
+        self._timeouts = [
+            (re.compile(p), t) for p, t in
+            (DEFAULT_TIMEOUTS if timeouts is None else timeouts).items()
+        ]
+
+    def timeout(self, url: str, default: Timeout = None) -> Timeout:
+        """The timeout of a request to a URL, ignoring deadlines."""
+        path = urlsplit(url).path
+        for pattern, timeout in self._timeouts:
+            if pattern.fullmatch(path):
+                return timeout
+        return default
+
+    def send(self, request: PreparedRequest, stream: bool = False,
+             timeout: Timeout = None, verify: bool | str = True,
+             cert: Any = None, proxies: Mapping[str, str] | None = None
+             ) -> Response:
+        timeout = self.timeout(request.url or '', timeout)
+        current = _deadline.get()
+
+        if current is not None:
+            current.check()
+            timeout = _cap(timeout, current.remaining())
+
+        return super().send(request, stream=stream, timeout=timeout,
+                            verify=verify, cert=cert, proxies=proxies)
+
+
+class ContextExecutor(ThreadPoolExecutor):
+    """A thread pool that runs work in the context it was submitted
+    from, so deadlines apply to it.
+
+    Work that starts after the deadline fails straight away, and
+    pending work is cancelled if the pool is left with an error.
+    """
+
+    def submit(self, fn: Callable[P, T], /,
+               *args: P.args, **kwargs: P.kwargs) -> 'Future[T]':
+        context = contextvars.copy_context()
+
+        def run() -> T:
+            current = context.get(_deadline)
+            if current is not None:
+                current.check()
+            return context.run(fn, *args, **kwargs)
+
+        return super().submit(run)
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> Any:
+        self.shutdown(wait=True, cancel_futures=exc_type is not None)
+        return False
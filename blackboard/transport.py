@@ -0,0 +1,321 @@
+"""
+Blackboard Transport
+
+`requests` adapters that sit beneath `BlackboardSession`.
+
+Basic usage:
+    >>> cassette = Cassette()
+    >>> session = BlackboardSession(url, cookies=...,
+    ...                             transport=RecordingTransport(cassette))
+    >>> cassette.save('crawl.cassette')
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import io
+import os
+import gzip
+import json
+import time
+import base64
+import logging
+import threading
+from datetime import timedelta
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .exceptions import BBReplayError
+
+logger = logging.getLogger(__name__)
+
+Timeout = float | tuple[float, float] | tuple[float, None] | None
+
+CASSETTE_VERSION = 1
+
+# Never written to a cassette
+_SENSITIVE_HEADERS = frozenset({
+    'authorization', 'cookie', 'set-cookie', 'x-blackboard-xsrf'
+})
+
+# No longer true once the body has been read and decoded
+_ENCODING_HEADERS = frozenset({
+    'content-encoding', 'transfer-encoding', 'content-length'
+})
+
+
+class BBTransport(BaseAdapter):
+    """An adapter that wraps another one, by default `HTTPAdapter`.
+
+    Transports can be stacked, each one adding behaviour before
+    passing requests on to the next.
+    """
+
+    def __init__(self, inner: BaseAdapter | None = None):
+        """
+        :param inner: The adapter that actually sends requests
+        """
+        super().__init__()
+        self.inner = inner or HTTPAdapter()
+
+    def send(self, request: PreparedRequest, stream: bool = False,
+             timeout: Timeout = None, verify: bool | str = True,
+             cert: Any = None, proxies: Mapping[str, str] | None = None
+             ) -> Response:
+        return self.inner.send(request, stream=stream, timeout=timeout,
+                               verify=verify, cert=cert, proxies=proxies)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def _filter_headers(headers: Mapping[str, str],
+                    exclude: frozenset[str]) -> dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in exclude}
+
+
+def _encode_body(body: bytes | None) -> dict[str, str]:
+    """Store a body as text when possible, which compresses better."""
+    if not body:
+        return {}
+    try:
+        return {'text': body.decode()}
+    except UnicodeDecodeError:
+        return {'data': base64.b64encode(body).decode()}
+
+
+def _decode_body(stored: Mapping[str, str]) -> bytes:
+    if 'text' in stored:
+        return stored['text'].encode()
+    if 'data' in stored:
+        return base64.b64decode(stored['data'])
+    return b''
+
+
+@dataclass
+class Interaction:
+    """A recorded request and its response."""
+    method: str
+    url: str
+    status: int
+    reason: str = ''
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b''
+    request_headers: dict[str, str] = field(default_factory=dict)
+    request_body: bytes = b''
+    #: Seconds until the response body was read
+    elapsed: float = 0.0
+    #: Seconds since the recording started
+    offset: float = 0.0
+
+    def to_json(self) -> dict[str, Any]:
+        data = asdict(self)
+        data['body'] = _encode_body(self.body)
+        data['request_body'] = _encode_body(self.request_body)
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> 'Interaction':
+        data = dict(data)
+        data['body'] = _decode_body(data.get('body', {}))
+        data['request_body'] = _decode_body(data.get('request_body', {}))
+        return cls(**data)
+
+
+class Cassette:
+    """A sequence of recorded interactions.
+
+    Cassettes are stored as gzip compressed JSON lines.
+    """
+
+    def __init__(self, interactions: list[Interaction] | None = None):
+        self._interactions = interactions or []
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def append(self, interaction: Interaction) -> None:
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def offset(self) -> float:
+        """Seconds since the cassette was created."""
+        return time.monotonic() - self._started
+
+    def __iter__(self) -> Iterator[Interaction]:
+        return iter(list(self._interactions))
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the cassette to a file."""
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps({'version': CASSETTE_VERSION}) + '\n')
+            for interaction in self:
+                f.write(json.dumps(interaction.to_json(),
+                                   separators=(',', ':')) + '\n')
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> 'Cassette':
+        """Read a cassette from a file."""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline() or '{}')
+
+            if header.get('version') != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version in {path}")
+
+            return cls([Interaction.from_json(json.loads(line))
+                        for line in f if line.strip()])
+
+
+class _Body(io.BytesIO):
+    """An in-memory response body `requests` can read cookies from."""
+    _original_response: Any = None
+
+
+def _build_response(request: PreparedRequest,
+                    interaction: Interaction,
+                    original: Any = None) -> Response:
+    """Create a response object out of a recorded interaction."""
+    response = Response()
+    response.status_code = interaction.status
+    response.reason = interaction.reason
+    response.headers = CaseInsensitiveDict(interaction.headers)
+    response.headers['Content-Length'] = str(len(interaction.body))
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url or interaction.url
+    response.request = request
+    response.elapsed = timedelta(seconds=interaction.elapsed)
+
+    body = _Body(interaction.body)
+    body._original_response = original
+    response.raw = body
+    return response
+
+
+class RecordingTransport(BBTransport):
+    """Records every interaction into a cassette.
+
+    Response bodies are read in full before being returned, and
+    credentials are never recorded.
+    """
+
+    def __init__(self, cassette: Cassette,
+                 inner: BaseAdapter | None = None):
+        """
+        :param cassette: Where interactions are recorded
+        :param inner: The adapter that actually sends requests
+        """
+        super().__init__(inner)
+        self.cassette = cassette
+
+    def send(self, request: PreparedRequest, stream: bool = False,
+             timeout: Timeout = None, verify: bool | str = True,
+             cert: Any = None, proxies: Mapping[str, str] | None = None
+             ) -> Response:
+        offset = self.cassette.offset()
+        start = time.perf_counter()
+        response = super().send(request, stream=stream, timeout=timeout,
+                                verify=verify, cert=cert, proxies=proxies)
+        body = response.content
+        request_body = request.body or b''
+
+        if isinstance(request_body, str):
+            request_body = request_body.encode()
+
+        interaction = Interaction(
+            method=request.method or 'GET',
+            url=request.url or '',
+            status=response.status_code,
+            reason=response.reason or '',
+            headers=_filter_headers(
+                response.headers, _SENSITIVE_HEADERS | _ENCODING_HEADERS
+            ),
+            body=body,
+            request_headers=_filter_headers(
+                request.headers, _SENSITIVE_HEADERS
+            ),
+            request_body=request_body,
+            elapsed=time.perf_counter() - start,
+            offset=offset
+        )
+        self.cassette.append(interaction)
+
+        original = getattr(response.raw, '_original_response', None)
+        return _build_response(request, interaction, original)
+
+
+class ReplayTransport(BaseAdapter):
+    """Answers requests from a cassette without any network access.
+
+    Requests are matched by method and URL, and repeated requests are
+    answered in the order they were recorded.
+    """
+
+    def __init__(self, cassette: Cassette, *,
+                 speed: float | None = None, repeat: bool = False):
+        """
+        :param cassette: Recorded interactions to replay
+        :param speed: Replay timings scaled by this factor, e.g. 1 for
+            the original timings, or as fast as possible if `None`
+        :param repeat: Keep answering with the last matching
+            interaction once all of them have been replayed
+        """
+        super().__init__()
+        self._speed = speed
+        self._repeat = repeat
+        self._lock = threading.Lock()
+        self._queues: dict[tuple[str, str], deque[Interaction]] = {}
+        self._last: dict[tuple[str, str], Interaction] = {}
+
+        for i in cassette:
+            self._queues.setdefault((i.method, i.url), deque()).append(i)
+
+    def _next(self, method: str, url: str) -> Interaction:
+        key = (method, url)
+
+        with self._lock:
+            queue = self._queues.get(key)
+
+            if queue:
+                self._last[key] = queue.popleft()
+                return self._last[key]
+            if self._repeat and key in self._last:
+                return self._last[key]
+
+        raise BBReplayError(f"No recorded interaction for {method} {url}")
+
+    def send(self, request: PreparedRequest, stream: bool = False,
+             timeout: Timeout = None, verify: bool | str = True,
+             cert: Any = None, proxies: Mapping[str, str] | None = None
+             ) -> Response:
+        interaction = self._next(request.method or 'GET', request.url or '')
+
+        if self._speed:
+            time.sleep(interaction.elapsed / self._speed)
+
+        return _build_response(request, interaction)
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,175 @@
+"""
+Blackboard WebDAV
+
+helpers to list and mirror the Blackboard content collection.
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Any
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass, field
+from urllib.parse import unquote, urlsplit
+from xml.etree.ElementTree import Element
+
+import requests
+
+from .blackboard import BBWebDAVEntry, safe_filename
+from .sink import DownloadSink
+
+logger = logging.getLogger(__name__)
+
+_DAV = '{DAV:}'
+
+MANIFEST_NAME = '.bbwebdav.json'
+
+
+def _text(prop: Element, name: str) -> str | None:
+    node = prop.find(f"{_DAV}{name}")
+    if node is None or node.text is None:
+        return None
+    return node.text.strip()
+
+
+def _date(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_multistatus(root: Element) -> list[BBWebDAVEntry]:
+    """Parse the entries of a PROPFIND multi-status response.
+
+    :param root: The parsed XML of the response
+    """
+    entries = []
+
+    for response in root.iter(f"{_DAV}response"):
+        href = response.findtext(f"{_DAV}href")
+        if href is None:
+            continue
+
+        props: dict[str, Any] = {'href': href.strip()}
+
+        for propstat in response.iter(f"{_DAV}propstat"):
+            status = propstat.findtext(f"{_DAV}status") or ''
+            prop = propstat.find(f"{_DAV}prop")
+            if prop is None or ' 200 ' not in f"{status} ":
+                continue
+
+            resource_type = prop.find(f"{_DAV}resourcetype")
+            length = _text(prop, 'getcontentlength')
+            props.update(
+                displayName=_text(prop, 'displayname'),
+                isCollection=resource_type is not None and
+                resource_type.find(f"{_DAV}collection") is not None,
+                contentLength=int(length) if length else None,
+                contentType=_text(prop, 'getcontenttype'),
+                etag=_text(prop, 'getetag'),
+                lastModified=_date(_text(prop, 'getlastmodified'))
+            )
+
+        entries.append(BBWebDAVEntry(**props))
+
+    return entries
+
+
+def relative_path(root_url: str, href: str) -> Path | None:
+    """Return the safe local path of a WebDAV entry below a root.
+
+    :param root_url: The URL of the mirrored folder
+    :param href: The href of the entry
+    :returns: `None` if the entry is not below the root
+    """
+    root = unquote(urlsplit(root_url).path).rstrip('/') + '/'
+    path = unquote(urlsplit(href).path)
+
+    if not path.startswith(root) or path.rstrip('/') + '/' == root:
+        return None
+
+    parts = [safe_filename(p) for p in
+             path[len(root):].strip('/').split('/')]
+    # Never allow escaping the destination directory
+    return Path(*(p if p not in ('', '.', '..') else '_' for p in parts))
+
+
+def save_response(response: requests.Response, path: Path,
+                  chunk_size: int = 1024 * 1024) -> int:
+    """Stream a response body into a file, replacing it atomically.
+
+    :returns: The number of bytes written
+    """
+    return DownloadSink(buffer_size=chunk_size).write(response, path).size
+
+
+class WebDAVManifest:
+    """Remote metadata of the files in a local mirror."""
+
+    def __init__(self, directory: Path):
+        self._path = directory / MANIFEST_NAME
+        self._entries: dict[str, dict[str, Any]] = {}
+
+        if self._path.exists():
+            with self._path.open(encoding='utf-8') as f:
+                self._entries = json.load(f)
+
+    def is_current(self, local: Path, relative: Path,
+                   entry: BBWebDAVEntry) -> bool:
+        """Whether a local file matches its remote entry."""
+        known = self._entries.get(relative.as_posix())
+
+        if known is None or not local.is_file():
+            return False
+        if entry.contentLength is not None and \
+                local.stat().st_size != entry.contentLength:
+            return False
+        return known == self._state(entry)
+
+    @staticmethod
+    def _state(entry: BBWebDAVEntry) -> dict[str, Any]:
+        modified = entry.lastModified
+        return {
+            'etag': entry.etag,
+            'size': entry.contentLength,
+            'lastModified': modified.isoformat() if modified else None,
+        }
+
+    def update(self, relative: Path, entry: BBWebDAVEntry) -> None:
+        self._entries[relative.as_posix()] = self._state(entry)
+
+    def save(self) -> None:
+        tmp = self._path.with_suffix('.tmp')
+        with tmp.open('w', encoding='utf-8') as f:
+            json.dump(self._entries, f, indent=1, sort_keys=True)
+        os.replace(tmp, self._path)
+
+
+@dataclass
+class MirrorReport:
+    """Outcome of mirroring a WebDAV folder."""
+    downloaded: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    failed: dict[Path, BaseException] = field(default_factory=dict)
@@ -0,0 +1,112 @@
+"""
+Test the merged announcement feed
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.exceptions import BBForbiddenError
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+ANNOUNCEMENTS = {
+    'c1': [
+        {'id': 'a1', 'title': 'Welcome', 'created': '2026-09-01T09:00:00Z'},
+        {'id': 'a2', 'title': 'Exam', 'created': '2026-09-03T09:00:00Z',
+         'modified': '2026-09-10T12:00:00Z'},
+    ],
+    'c2': [
+        {'id': 'b1', 'title': 'Lab', 'created': '2026-09-05T09:00:00Z',
+         'availability': {'duration': {'type': 'Permanent'}}},
+        {'id': 'b2', 'title': 'Undated'},
+    ],
+}
+
+
+def _announcements(course_id):
+    if course_id == 'c3':
+        raise BBForbiddenError({'status': 403})
+    return ANNOUNCEMENTS[course_id]
+
+
+@pytest.fixture
+def session():
+    s = BlackboardExtended(API_URL, cookies=None)
+    with mock.patch.object(s, 'fetch_course_announcements',
+                           side_effect=_announcements):
+        yield s
+
+
+def test_ex_fetch_announcements(session):
+    feed = session.ex_fetch_announcements(['c1', 'c2', 'c3', 'c1'])
+
+    assert [a.id for a in feed] == ['a2', 'b1', 'a1', 'b2']
+    assert [a.courseId for a in feed] == ['c1', 'c2', 'c1', 'c2']
+    assert feed[0].posted == datetime(2026, 9, 10, 12, tzinfo=timezone.utc)
+    assert session.fetch_course_announcements.call_count == 3
+
+    assert [a.id for a in session.ex_fetch_announcements(
+        ['c1', 'c2'], limit=2)] == ['a2', 'b1']
+
+    since = datetime(2026, 9, 4, tzinfo=timezone.utc)
+    assert [a.id for a in session.ex_fetch_announcements(
+        ['c1', 'c2'], since=since)] == ['a2', 'b1']
+
+
+def test_ex_fetch_announcements_new_only(session):
+    assert len(session.ex_fetch_announcements(['c1', 'c2'],
+                                              new_only=True)) == 4
+    assert session.ex_fetch_announcements(['c1', 'c2'], new_only=True) == []
+
+    ANNOUNCEMENTS['c2'].append({'id': 'b3', 'title': 'New',
+                                'created': '2026-09-20T09:00:00Z'})
+    try:
+        feed = session.ex_fetch_announcements(['c1', 'c2'], new_only=True)
+    finally:
+        ANNOUNCEMENTS['c2'].pop()
+
+    assert [a.id for a in feed] == ['b3']
+    # Marks do not affect plain calls
+    assert len(session.ex_fetch_announcements(['c1', 'c2'])) == 4
+
+
+def test_ex_fetch_announcements_new_only_limit(session, monkeypatch):
+    monkeypatch.setitem(ANNOUNCEMENTS, 'c4', [
+        {'id': f"a{i}", 'created': f"2026-09-0{i}T09:00:00Z"}
+        for i in range(1, 6)
+    ])
+
+    def fetch():
+        return [a.id for a in session.ex_fetch_announcements(
+            ['c4'], new_only=True, limit=2)]
+
+    # Each call continues where the last one stopped
+    assert fetch() == ['a5', 'a4']
+    assert fetch() == ['a3', 'a2']
+
+    ANNOUNCEMENTS['c4'].append({'id': 'a6',
+                                'created': '2026-09-06T09:00:00Z'})
+    assert fetch() == ['a6', 'a1']
+    assert fetch() == []
+    assert session._announcement_marks['c4'].seen == set()
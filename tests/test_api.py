@@ -23,6 +23,7 @@ from hypothesis import given, strategies as st
 
 from blackboard.api import BlackboardSession
 from blackboard.blackboard import (BBCourse, BBCourseContent, BBAttachment)
+from blackboard.transport import Cassette, Interaction, ReplayTransport
 
 
 API_URL = "http://blackboard.example.org/api/v{version}"
@@ -82,3 +83,22 @@ def test_fetch_file_attachments_list(bbattachment):
         assert s.fetch_file_attachments(
             course_id='...', content_id='...', attachment_id='...'
         ) == bbattachment
+
+
+def test_session_transport():
+    # The decorators are patched in tests, except for PROPFIND, which
+    # goes through tiny-api-client and the session's own HTTP session
+    url = "http://blackboard.invalid/bbcswebdav/courses/CO1"
+    body = (b'<D:multistatus xmlns:D="DAV:"><D:response>'
+            b'<D:href>/bbcswebdav/courses/CO1/a.pdf</D:href>'
+            b'</D:response></D:multistatus>')
+    cassette = Cassette([Interaction('PROPFIND', url, 207, body=body)])
+    s = BlackboardSession("http://blackboard.invalid", cookies=None,
+                          transport=ReplayTransport(cassette))
+
+    with mock.patch.object(s._http_session, 'request',
+                           wraps=s._http_session.request) as request:
+        entries = s.list_webdav(webdav_url=url)
+
+    assert [e.href for e in entries] == ['/bbcswebdav/courses/CO1/a.pdf']
+    assert request.call_count == 1
@@ -0,0 +1,147 @@
+"""
+Test the attendance matrix and bulk attendance export
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import io
+from unittest import mock
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.attendance import BBAttendanceMatrix, parse_attendance_csv
+from blackboard.blackboard import BBAttendanceStatus as Status
+from blackboard.exceptions import BBForbiddenError
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+RECORDS = {
+    1: [{'meetingId': 1, 'userId': 'alice', 'status': 'Present'},
+        {'meetingId': 1, 'userId': 'bob', 'status': 'Late'}],
+    2: [{'meetingId': 2, 'userId': 'bob', 'status': 'Absent'}],
+}
+
+
+def _pages(items, cap=None):
+    """Serve a listing by offset and limit, capped like some servers."""
+    def fetch(params, **route):
+        limit = min(params['limit'], cap or params['limit'])
+        return items(route)[params['offset']:params['offset'] + limit]
+    return fetch
+
+
+def test_matrix():
+    matrix = BBAttendanceMatrix([1, 2, 3])
+    matrix.add(1, 'alice', Status.Present)
+    matrix.add(2, 'bob', Status.Excused)
+    matrix.add(2, 'alice', Status.Late)
+    matrix.add(3, 'bob', Status('Unknown'))
+
+    assert matrix.meetings == ['1', '2', '3']
+    assert matrix.users == ['alice', 'bob']
+    assert matrix.get(1, 'alice') == Status.Present
+    assert matrix.get('2', 'bob') == Status.Excused
+    assert matrix.get(1, 'bob') is None
+    assert matrix.get(4, 'alice') is None
+    assert matrix.get(3, 'bob') == Status.Other
+    assert len(matrix) == 4
+    assert matrix.counts(2) == {Status.Excused: 1, Status.Late: 1}
+
+    fp = io.StringIO(newline='')
+    matrix.write_csv(fp)
+    assert fp.getvalue().splitlines() == [
+        'userId,1,2,3',
+        'alice,Present,Late,',
+        'bob,,Excused,',
+    ]
+
+
+def test_parse_attendance_csv():
+    lines = ['MeetingId,UserId,Status', '1,alice,Present', '2,bob,Late']
+    records = parse_attendance_csv(lines)
+    assert records is not None
+    assert [(r.meetingId, r.userId, r.status) for r in records] == [
+        ('1', 'alice', Status.Present), ('2', 'bob', Status.Late)
+    ]
+
+
+def test_parse_attendance_csv_unknown_format():
+    assert parse_attendance_csv(['Name,Week 1', 'Alice,P']) is None
+
+
+def test_ex_fetch_attendance_fan_out():
+    s = BlackboardExtended(API_URL, cookies=None)
+
+    with (mock.patch.object(s, 'fetch_course_meetings',
+                            side_effect=_pages(lambda r: [{'id': 1},
+                                                          {'id': 2}])),
+          mock.patch.object(s, 'fetch_attendance_data_download_url',
+                            side_effect=BBForbiddenError()),
+          mock.patch.object(s, 'fetch_attendance_records_by_meeting_id',
+                            side_effect=_pages(lambda r: RECORDS[
+                                int(r['meeting_id'])
+                            ])) as by_meeting):
+        matrix = s.ex_fetch_attendance('_1_1')
+
+    # A page each, and an empty one as the server may cap pages
+    assert by_meeting.call_count == 4
+    assert matrix.get(1, 'alice') == Status.Present
+    assert matrix.get(1, 'bob') == Status.Late
+    assert matrix.get(2, 'bob') == Status.Absent
+    assert matrix.get(2, 'alice') is None
+
+
+def test_ex_fetch_attendance_download():
+    s = BlackboardExtended(API_URL, cookies=None)
+    response = mock.MagicMock(encoding=None)
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = ['meetingId,userId,status',
+                                        '1,alice,Excused']
+
+    with (mock.patch.object(s, 'fetch_course_meetings',
+                            side_effect=_pages(lambda r: [{'id': 1}])),
+          mock.patch.object(s, 'fetch_attendance_data_download_url',
+                            return_value={'downloadUrl': '/download'}),
+          mock.patch.object(s, 'download_webdav',
+                            return_value=response) as download,
+          mock.patch.object(s, 'fetch_attendance_records_by_meeting_id'
+                            ) as by_meeting):
+        matrix = s.ex_fetch_attendance('_1_1')
+
+    download.assert_called_once_with(
+        webdav_url='http://blackboard.example.org/download'
+    )
+    by_meeting.assert_not_called()
+    assert matrix.get(1, 'alice') == Status.Excused
+
+
+def test_ex_fetch_attendance_pages():
+    s = BlackboardExtended(API_URL, cookies=None)
+    users = [{'meetingId': 1, 'userId': f"u{i}", 'status': 'Present'}
+             for i in range(250)]
+
+    with (mock.patch.object(s, 'fetch_course_meetings',
+                            side_effect=_pages(lambda r: [{'id': 1}])),
+          mock.patch.object(s, 'fetch_attendance_records_by_meeting_id',
+                            side_effect=_pages(lambda r: users, cap=50))
+          as by_meeting):
+        matrix = s.ex_fetch_attendance('_1_1', use_download=False)
+
+    assert by_meeting.call_count == 6
+    assert len(matrix) == 250
+    assert matrix.counts(1) == {Status.Present: 250}
@@ -0,0 +1,117 @@
+"""
+Test the avatar cache
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import io
+from unittest import mock
+
+import pytest
+import requests
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.avatars import AvatarCache
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+# user -> (etag, image), users without one have no avatar
+AVATARS = {
+    'u1': ('"v1"', b'\x89PNG one'),
+    'u2': ('"v1"', b'\x89PNG two'),
+    'down': ('"v1"', b''),
+}
+
+
+def _avatar(user_id, headers=None):
+    if user_id == 'down':
+        raise requests.ConnectionError()
+
+    response = requests.Response()
+    response.raw = io.BytesIO()
+
+    if user_id not in AVATARS:
+        response.status_code = 404
+        return response
+
+    etag, image = AVATARS[user_id]
+    response.headers['ETag'] = etag
+    if headers and headers.get('If-None-Match') == etag:
+        response.status_code = 304
+        return response
+
+    response.status_code = 200
+    response.headers['Content-Type'] = 'image/png'
+    response.raw = io.BytesIO(image)
+    return response
+
+
+@pytest.fixture
+def session():
+    s = BlackboardExtended(API_URL, cookies=None)
+    with mock.patch.object(s, 'fetch_avatar', side_effect=_avatar):
+        yield s
+
+
+def test_ex_fetch_avatars(session, tmp_path):
+    cache = AvatarCache(tmp_path)
+    paths = session.ex_fetch_avatars(['u1', 'u2', 'u3', 'down', 'u1'], cache)
+
+    assert list(paths) == ['u1', 'u2', 'u3', 'down']
+    assert paths['u1'].read_bytes() == b'\x89PNG one'
+    assert paths['u1'].suffix == '.png'
+    assert paths['u3'] is None and paths['down'] is None
+    assert session.fetch_avatar.call_count == 4
+
+    # Fresh avatars are used without asking
+    assert session.ex_fetch_avatars(['u1', 'u2'], tmp_path) \
+        == {'u1': paths['u1'], 'u2': paths['u2']}
+    assert session.fetch_avatar.call_count == 4
+
+
+def test_ex_fetch_avatars_revalidate(session, tmp_path, monkeypatch):
+    cache = AvatarCache(tmp_path)
+    first = session.ex_fetch_avatars(['u1', 'u2'], cache)
+    session.fetch_avatar.reset_mock()
+
+    # Unchanged avatars are revalidated, changed ones replaced
+    monkeypatch.setitem(AVATARS, 'u2', ('"v2"', b'\x89PNG new'))
+    second = session.ex_fetch_avatars(['u1', 'u2'], cache, max_age=0)
+
+    assert session.fetch_avatar.call_args_list == [
+        mock.call(user_id='u1', headers={'If-None-Match': '"v1"'}),
+        mock.call(user_id='u2', headers={'If-None-Match': '"v1"'}),
+    ]
+    assert second['u1'] == first['u1']
+    assert second['u2'].read_bytes() == b'\x89PNG new'
+    assert not first['u2'].exists()
+    assert cache.lookup('u2').etag == '"v2"'
+
+    # Unreachable avatars are kept, removed ones forgotten
+    session.fetch_avatar.side_effect = requests.ConnectionError()
+    assert session.ex_fetch_avatars(['u1'], cache, max_age=0) \
+        == {'u1': first['u1']}
+
+    session.fetch_avatar.side_effect = _avatar
+    monkeypatch.delitem(AVATARS, 'u2')
+    assert session.ex_fetch_avatars(['u2'], cache, max_age=0) \
+        == {'u2': None}
+    assert cache.lookup('u2') is None
+    assert sorted(p.suffix for p in tmp_path.iterdir()) \
+        == ['.json', '.png']
@@ -0,0 +1,155 @@
+"""
+Test the circuit breaker transport
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import threading
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from blackboard.breaker import (
+    CircuitStatus,
+    CircuitBreakerTransport,
+    endpoint_template
+)
+from blackboard.exceptions import BBCircuitOpenError
+
+
+HOST = "http://blackboard.example.org"
+
+
+class FakeAdapter(BaseAdapter):
+    """Fails while `down` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.down = False
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        if self.down == 'timeout':
+            raise requests.ReadTimeout()
+        response = requests.Response()
+        response.status_code = 503 if self.down else 200
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def breaker():
+    adapter = FakeAdapter()
+    changes = []
+    transport = CircuitBreakerTransport(
+        adapter, failure_threshold=3, recovery_time=0,
+        on_change=lambda key, state: changes.append(state.status)
+    )
+    s = requests.Session()
+    s.mount('http://', transport)
+    return s, adapter, transport, changes
+
+
+@pytest.mark.parametrize("path,expected", [
+    ('/learn/api/public/v1/courses/_12_1/contents/_3_1/children',
+     '/learn/api/public/v1/courses/{id}/contents/{id}/children'),
+    ('/learn/api/public/v1/users/uuid:abc/courses/',
+     '/learn/api/public/v1/users/{id}/courses'),
+    ('/learn/api/public/v1/courses/courseId:CS101',
+     '/learn/api/public/v1/courses/{id}'),
+    ('/bbcswebdav/courses/CS101/notes.pdf', '/bbcswebdav/*'),
+])
+def test_endpoint_template(path, expected):
+    assert endpoint_template(path) == expected
+
+
+def test_circuit_opens_and_recovers(breaker):
+    s, adapter, transport, changes = breaker
+    transport.recovery_time = 60
+    adapter.down = True
+
+    for i in range(3):
+        assert s.get(f"{HOST}/learn/api/public/v1/courses/_{i}_1"
+                     ).status_code == 503
+
+    with pytest.raises(BBCircuitOpenError) as e:
+        s.get(f"{HOST}/learn/api/public/v1/courses/_9_1")
+    assert e.value.retry_after > 50
+    assert isinstance(e.value, requests.ConnectionError)
+    assert adapter.sent == 3
+
+    # Other endpoints are unaffected
+    assert s.get(f"{HOST}/learn/api/public/v1/users/me").status_code == 503
+
+    key = (HOST[7:], '/learn/api/public/v1/courses/{id}')
+    state = transport.states()[key]
+    assert (state.status, state.trips, state.rejected) \
+        == (CircuitStatus.Open, 1, 1)
+
+    # A failed probe opens the circuit again, a good one closes it
+    transport.recovery_time = 0
+    adapter.down = 'timeout'
+    with pytest.raises(requests.ReadTimeout):
+        s.get(f"{HOST}/learn/api/public/v1/courses/_1_1")
+    adapter.down = False
+    assert s.get(f"{HOST}/learn/api/public/v1/courses/_1_1").ok
+
+    assert transport.states()[key].status == CircuitStatus.Closed
+    assert changes == [CircuitStatus.Open, CircuitStatus.HalfOpen,
+                       CircuitStatus.Open, CircuitStatus.HalfOpen,
+                       CircuitStatus.Closed]
+
+
+def test_failures_must_be_consecutive(breaker):
+    s, adapter, transport, _ = breaker
+
+    for down in (True, True, False, True, True):
+        adapter.down = down
+        s.get(f"{HOST}/learn/api/public/v1/users/me")
+
+    assert transport.states()[(HOST[7:], '/learn/api/public/v1/users/me')
+                              ].status == CircuitStatus.Closed
+
+
+def test_on_change_reentrant():
+    adapter = FakeAdapter()
+    adapter.down = True
+    seen = []
+
+    # Callbacks may look at the transport, e.g. to export metrics
+    transport = CircuitBreakerTransport(
+        adapter, failure_threshold=1,
+        on_change=lambda key, state: seen.append(transport.states()[key])
+    )
+    s = requests.Session()
+    s.mount('http://', transport)
+
+    thread = threading.Thread(
+        target=s.get, args=(f"{HOST}/learn/api/public/v1/users/me",),
+        daemon=True
+    )
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert [state.status for state in seen] == [CircuitStatus.Open]
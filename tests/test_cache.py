@@ -0,0 +1,90 @@
+"""
+Test the shared response cache
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import pytest
+import requests
+
+from blackboard.blackboard import BBCourse
+from blackboard.cache import CacheStats, CachingTransport, ResponseCache
+from blackboard.transport import Interaction
+from blackboard.testing.server import MockConfig, MockBlackboardServer
+
+
+API = '/learn/api/public/v1'
+
+
+@pytest.fixture
+def server():
+    with MockBlackboardServer(MockConfig(courses=2, depth=1)) as s:
+        yield s
+
+
+def _session(cache):
+    s = requests.Session()
+    s.mount('http://', CachingTransport(cache))
+    return s
+
+
+def test_caching_transport(server, tmp_path):
+    cache = ResponseCache(tmp_path / 'cache.sqlite')
+    course = f"{server.url}/learn/api/public/v3/courses/_1_1"
+
+    for s in (_session(cache), _session(cache)):
+        assert BBCourse(**s.get(course).json()).code == 'CO1001'
+    assert server.request_count == 1
+
+    # Contents do not match any rule
+    for _ in range(2):
+        _session(cache).get(f"{server.url}{API}/courses/_1_1/contents")
+    assert server.request_count == 3
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_cache_credentials(server, tmp_path):
+    cache = ResponseCache(tmp_path / 'cache.sqlite')
+    course = f"{server.url}/learn/api/public/v3/courses/_1_1"
+
+    for user in ('a', 'b', 'a'):
+        _session(cache).get(course, cookies={'s_session_id': user})
+    assert server.request_count == 2
+
+
+def test_cache_eviction_and_expiry(tmp_path):
+    interaction = Interaction('GET', 'http://bb', 200, body=b'x' * 300)
+    cache = ResponseCache(tmp_path / 'cache.sqlite', max_size=1500)
+
+    for key in 'abcd':
+        cache.put(key, interaction, ttl=60)
+        cache.get('a')
+
+    # The least recently used entry goes first
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.stats().evictions == 1
+
+    cache.put('e', interaction, ttl=-1)
+    assert cache.get('e') is None
+
+    cache.clear()
+    assert cache.stats() == CacheStats()
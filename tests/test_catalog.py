@@ -0,0 +1,106 @@
+"""
+Test the course catalog index
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.catalog import CatalogCache
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+# type -> parent -> children, None is the top level
+CATEGORIES = {
+    'Course': {None: ['eng'], 'eng': ['civ', 'mec'], 'civ': ['geo']},
+    'Organization': {None: ['clubs']},
+}
+
+COURSES = {
+    ('Course', 'eng'): ['_1_1'],
+    ('Course', 'civ'): ['_2_1', '_1_1'],
+    ('Course', 'geo'): ['_3_1'],
+    ('Organization', 'clubs'): ['_9_1'],
+}
+
+
+def _category(category_type, category_id=None):
+    return [{'id': i, 'title': i.title()}
+            for i in CATEGORIES[category_type][category_id]]
+
+
+def _children(category_type, parent_id):
+    return [{'id': i, 'parentId': parent_id}
+            for i in CATEGORIES[category_type].get(parent_id, [])]
+
+
+def _memberships(category_type, category_id):
+    return [{'categoryId': category_id, 'courseId': c}
+            for c in COURSES.get((category_type, category_id), [])]
+
+
+def _session():
+    s = BlackboardExtended(API_URL, cookies=None)
+    for name, f in (('fetch_category', _category),
+                    ('fetch_child_categories', _children),
+                    ('fetch_memberships', _memberships)):
+        setattr(s, name, mock.MagicMock(side_effect=f))
+    return s
+
+
+def test_ex_fetch_catalog():
+    catalogs = _session().ex_fetch_catalog(max_workers=2)
+    course = catalogs['Course']
+
+    assert len(course) == 4
+    assert [c.id for c in course.roots] == ['eng']
+    assert sorted(c.id for c in course.children('eng')) == ['civ', 'mec']
+    assert sorted(c.id for c in course.descendants('eng')) \
+        == ['civ', 'geo', 'mec']
+    assert course.courses('civ') == ('_2_1', '_1_1')
+    assert sorted(course.courses('eng', recursive=True)) \
+        == ['_1_1', '_2_1', '_3_1']
+    assert sorted(c.id for c in course.categories_of('_1_1')) \
+        == ['civ', 'eng']
+    assert catalogs['Organization'].courses('clubs') == ('_9_1',)
+
+
+def test_catalog_cache():
+    s = _session()
+    cache = CatalogCache(s, ttl=3600, category_types=['Course'])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: cache.get(), range(8)))
+
+    assert all(r is results[0] for r in results)
+    s.fetch_category.assert_called_once()
+
+    cache.invalidate()
+    assert cache.get() is not results[0]
+    assert s.fetch_category.call_count == 2
+
+
+def test_catalog_cache_expiry():
+    s = _session()
+    cache = CatalogCache(s, ttl=0, category_types=['Organization'])
+    cache.get()
+    cache.get()
+    assert s.fetch_category.call_count == 2
@@ -0,0 +1,100 @@
+"""
+Test joined content and attachment fetching
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from unittest import mock
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.blackboard import BBAttachment, BBCourseContent
+from blackboard.exceptions import BBForbiddenError
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+FOLDER = {'id': 'resource/x-bb-folder'}
+FILE = {'id': 'resource/x-bb-file'}
+
+# parent -> children, None is the top level
+TREE = {
+    None: [('1', FOLDER), ('2', FILE)],
+    '1': [('3', FILE), ('4', FOLDER), ('5', FILE)],
+    '4': [],
+}
+
+
+def _list(course_id, content_id=None):
+    return [BBCourseContent(id=i, contentHandler=h, hasChildren=i in TREE)
+            for i, h in TREE[content_id]]
+
+
+def _attachments(course_id, content_id):
+    if content_id == '5':
+        raise BBForbiddenError({'status': 403})
+    return [BBAttachment(id=f"a{content_id}", fileName=f"{content_id}.pdf")]
+
+
+def _session():
+    s = BlackboardExtended(API_URL, cookies=None)
+    patches = [
+        mock.patch.object(s, 'fetch_contents', side_effect=_list),
+        mock.patch.object(s, 'fetch_content_children', side_effect=_list),
+        mock.patch.object(s, 'fetch_file_attachments',
+                          side_effect=_attachments),
+    ]
+    for p in patches:
+        p.start()
+    return s, patches
+
+
+def test_ex_fetch_children_attachments():
+    s, patches = _session()
+    try:
+        entries = s.ex_fetch_children_attachments('c1', '1', max_workers=2)
+        assert [e.content.id for e in entries] == ['3', '4', '5']
+        assert [[a.id for a in e.attachments] for e in entries] \
+            == [['a3'], [], []]
+        # Folders are never looked up
+        assert s.fetch_file_attachments.call_count == 2
+    finally:
+        for p in patches:
+            p.stop()
+
+
+def test_ex_walk_content_attachments():
+    s, patches = _session()
+    try:
+        walk = list(s.ex_walk_content_attachments('c1', prefetch=1))
+        assert [folder for folder, _ in walk] == [None, '1', '4']
+        assert walk[0][1][1].attachments[0].fileName == '2.pdf'
+    finally:
+        for p in patches:
+            p.stop()
+
+
+def test_ex_walk_content_attachments_close():
+    s, patches = _session()
+    try:
+        walk = s.ex_walk_content_attachments('c1', prefetch=0)
+        folder, _ = next(walk)
+        assert folder is None
+        walk.close()
+    finally:
+        for p in patches:
+            p.stop()
@@ -0,0 +1,105 @@
+"""
+Test the multi-process crawler
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import json
+
+from blackboard.blackboard import BBCourseContent
+from blackboard.crawler import Crawler, CrawlUnit
+
+
+# course -> parent -> children, None is the top level
+TREE = {
+    'c1': {None: ['1', '2'], '1': ['3', '4'], '4': ['5']},
+    'c2': {None: ['6']},
+}
+
+
+class FakeSession:
+    """Picklable stand-in for a session in worker processes."""
+
+    def __init__(self, fail: frozenset[str] = frozenset()):
+        self.fail = fail
+
+    def _list(self, course_id, content_id):
+        if content_id in self.fail:
+            raise ConnectionError(content_id)
+        children = TREE[course_id]
+        return [BBCourseContent(id=i, parentId=content_id, position=p,
+                                hasChildren=i in children)
+                for p, i in enumerate(children.get(content_id, []))]
+
+    def fetch_contents(self, course_id):
+        return self._list(course_id, None)
+
+    def fetch_content_children(self, course_id, content_id):
+        return self._list(course_id, content_id)
+
+
+class FakeFactory:
+    def __init__(self, fail=frozenset()):
+        self.fail = fail
+
+    def __call__(self):
+        return FakeSession(self.fail)
+
+
+def _ids(result):
+    return {k: [c.id for c in v] for k, v in result.contents.items()}
+
+
+def test_crawl():
+    result = Crawler(FakeFactory(), processes=2).crawl(['c1', 'c2'])
+    assert _ids(result) == {'c1': ['1', '2', '3', '4', '5'], 'c2': ['6']}
+    assert result.failed == []
+
+
+def test_crawl_resume(tmp_path):
+    checkpoint = tmp_path / 'crawl.jsonl'
+
+    crawler = Crawler(FakeFactory(fail=frozenset({'4'})), processes=2,
+                      checkpoint=checkpoint)
+    result = crawler.crawl(['c1'])
+    assert result.failed == [CrawlUnit('c1', '4')]
+    assert _ids(result) == {'c1': ['1', '2', '3', '4']}
+
+    lines = checkpoint.read_text().splitlines()
+    assert len(lines) == 2
+
+    # Simulate an interrupted write
+    with checkpoint.open('a') as f:
+        f.write('{"course_id": "c1", "con')
+
+    result = Crawler(FakeFactory(), processes=2,
+                     checkpoint=checkpoint).crawl(['c1'])
+    assert result.failed == []
+    assert _ids(result) == {'c1': ['1', '2', '3', '4', '5']}
+
+    entries = [json.loads(line) for line in
+               checkpoint.read_text().splitlines()[len(lines):]]
+    assert [e['content_id'] for e in entries] == ['4']
+
+
+def test_crawl_cross_listed():
+    result = Crawler(FakeFactory(), processes=1).crawl(
+        ['c2', 'c3', 'c4'], parents={'c3': 'c2', 'c4': 'c2'}
+    )
+    assert _ids(result) == {'c2': ['6'], 'c3': ['6'], 'c4': ['6']}
+    assert result.contents['c3'] is not result.contents['c2']
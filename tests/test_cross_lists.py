@@ -0,0 +1,61 @@
+"""
+Test cross-list resolution
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from unittest import mock
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.blackboard import BBMembership
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+SETS = {
+    'p1': [{'id': 'c1', 'parentId': 'p1'}, {'id': 'c2', 'parentId': 'p1'}],
+    'c2': [{'id': 'c1', 'parentId': 'p1'}, {'id': 'c2', 'parentId': 'p1'}],
+    'c3': [],
+    'c4': [{'id': 'c4', 'parentId': 'p2'}],
+}
+
+
+def test_ex_group_cross_lists():
+    s = BlackboardExtended(API_URL, cookies=None)
+    memberships = [
+        BBMembership(courseId='p1', childCourseId='c1'),
+        BBMembership(courseId='p1'),
+        BBMembership(courseId='c3'),
+        BBMembership(courseId='c4'),
+    ]
+
+    with mock.patch.object(s, 'fetch_cross_list_set',
+                           side_effect=lambda course_id: SETS[course_id]
+                           ) as cross_list_set:
+        groups = s.ex_group_cross_lists([*memberships, 'c2'],
+                                        max_workers=2)
+        assert groups == {'p1': ['c1', 'p1', 'c2'], 'c3': ['c3'],
+                          'p2': ['c4']}
+        # Child memberships already tell their parent
+        assert sorted(c.kwargs['course_id']
+                      for c in cross_list_set.call_args_list) \
+            == ['c2', 'c3', 'c4']
+
+        assert s.ex_resolve_cross_lists(['c1', 'c4']) \
+            == {'c1': 'p1', 'c4': 'p2'}
+        assert cross_list_set.call_count == 3
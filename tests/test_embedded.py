@@ -0,0 +1,114 @@
+"""
+Test embedded file extraction
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from unittest import mock
+
+import pytest
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.blackboard import BBCourseContent
+from blackboard.embedded import (
+    extract_urls,
+    normalize_url,
+    find_embedded_files
+)
+
+
+BASE = "https://Blackboard.example.org"
+
+BODY = """
+<p>Read <a href="@X@EmbeddedFile.requestUrlStub@X@bbcswebdav/xid-1_1">this
+</a> and <a href='/bbcswebdav/courses/CO1/Week%201.pdf#page=2'>that</a>.</p>
+<img src="https://blackboard.example.org/bbcswebdav/xid-2_1"/>
+<a href="https://example.com/bbcswebdav.html">elsewhere</a>
+<img src="https://evil.example/bbcswebdav/xid-4_1"/>
+<video src="/bbcswebdav/xid-3_1?x=1&amp;y=2" poster=/bbcswebdav/xid-1_1>
+"""
+
+
+@pytest.mark.parametrize("url,expected", [
+    ('/bbcswebdav/xid-1_1',
+     'https://blackboard.example.org/bbcswebdav/xid-1_1'),
+    ('HTTPS://BLACKBOARD.example.org/bbcswebdav/a#b',
+     'https://blackboard.example.org/bbcswebdav/a'),
+    ('mailto:bbcswebdav@example.org', None),
+    ('/webapps/bbcswebdav', None),
+    ('http://blackboard.example.org/bbcswebdav/a',
+     'https://blackboard.example.org/bbcswebdav/a'),
+    # Credentials are never sent to other hosts
+    ('https://evil.example/bbcswebdav/x', None),
+    ('//evil.example/bbcswebdav/x', None),
+    ('https://blackboard.example.org@evil.example/bbcswebdav/x', None),
+    ('https://blackboard.example.org.evil.example/bbcswebdav/x', None),
+])
+def test_normalize_url(url, expected):
+    assert normalize_url(url, BASE) == expected
+
+
+def test_extract_urls():
+    assert extract_urls(BODY, BASE) == [
+        'https://blackboard.example.org/bbcswebdav/xid-1_1',
+        'https://blackboard.example.org/bbcswebdav/courses/CO1/Week%201.pdf',
+        'https://blackboard.example.org/bbcswebdav/xid-2_1',
+        'https://blackboard.example.org/bbcswebdav/xid-3_1?x=1&y=2',
+    ]
+    assert extract_urls('<p>Nothing here</p>', BASE) == []
+
+
+def test_find_embedded_files():
+    contents = [
+        BBCourseContent(id='1', body=BODY),
+        BBCourseContent(id='2'),
+        BBCourseContent(id='3', body='<img src="/bbcswebdav/xid-2_1">'),
+    ]
+    files = find_embedded_files(contents, BASE)
+    assert len(files) == 4
+    assert files[2].content_ids == ['1', '3']
+    assert files[1].name == 'Week 1.pdf'
+
+
+def test_ex_download_embedded(tmp_path):
+    s = BlackboardExtended(BASE, cookies=None)
+    contents = [
+        BBCourseContent(id='1', body='<a href="/bbcswebdav/a/x.pdf"></a>'),
+        BBCourseContent(id='2', body='<a href="/bbcswebdav/b/x.pdf"></a>'
+                                     '<a href="/bbcswebdav/a/x.pdf"></a>'),
+        BBCourseContent(id='3', body='<a href="/bbcswebdav/gone"></a>'),
+    ]
+
+    def download(webdav_url):
+        response = mock.MagicMock(status_code=200)
+        if webdav_url.endswith('gone'):
+            response.raise_for_status.side_effect = OSError(404)
+        response.iter_content.return_value = [webdav_url[-8:].encode()]
+        return response
+
+    with mock.patch.object(s, 'download_webdav',
+                           side_effect=download) as download_webdav:
+        files, report = s.ex_download_embedded(contents, tmp_path,
+                                               max_workers=2)
+
+    assert download_webdav.call_count == 3
+    assert len(files) == 3
+    assert sorted(p.name for p in report.downloaded) \
+        == ['x (2).pdf', 'x.pdf']
+    assert (tmp_path / 'x.pdf').read_text() == '/a/x.pdf'
+    assert list(report.failed) == [tmp_path / 'gone']
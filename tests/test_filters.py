@@ -0,0 +1,128 @@
+"""
+Test the client-side result filters
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from datetime import datetime, timezone
+
+import pytest
+from bwfilters import BWFilter
+from hypothesis import given, strategies as st
+
+from blackboard.blackboard import (
+    BBAttachment,
+    BBMembership,
+    BBAvailability,
+    BBCourseContent,
+    BBContentHandler,
+    BBResourceType
+)
+from blackboard.filters import (
+    BBAttachmentFilter,
+    BBMembershipFilter,
+    BBContentFilter
+)
+
+
+def _date(year: int) -> datetime:
+    return datetime(year, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("mime_types,expected", [
+    (BWFilter(whitelist=['video/*']), ['a', 'b']),
+    (BWFilter(blacklist=['video/*']), ['c', 'd']),
+    (BWFilter(whitelist=['application/pdf', 'video/mp4']), ['a', 'c']),
+    (BWFilter(), ['a', 'b', 'c', 'd']),
+])
+def test_attachment_filter_mime_types(mime_types, expected):
+    items = [
+        BBAttachment(id='a', mimeType='video/mp4'),
+        BBAttachment(id='b', mimeType='video/webm'),
+        BBAttachment(id='c', mimeType='application/pdf'),
+        BBAttachment(id='d'),
+    ]
+    f = BBAttachmentFilter(mime_types)
+    assert [x.id for x in f.filter(items)] == expected
+
+
+@pytest.mark.parametrize("mime_types", [
+    BWFilter(whitelist=[]),
+    BWFilter(blacklist=[]),
+])
+def test_attachment_filter_empty_lists(mime_types):
+    items = [BBAttachment(id='a', mimeType='video/mp4'), BBAttachment(id='b')]
+    f = BBAttachmentFilter(mime_types)
+    assert list(f.filter(items)) == list(
+        mime_types.filter_wc(lambda x: x.mimeType, items)
+    )
+
+
+@given(st.lists(st.from_type(BBMembership)),
+       st.lists(st.text(max_size=3), max_size=3))
+def test_membership_filter_matches_bwfilter(items, sources):
+    bw = BWFilter(blacklist=sources)
+    f = BBMembershipFilter(bw)
+    assert list(f.filter(items)) == list(
+        bw.filter(lambda x: x.dataSourceId, items)
+    )
+
+
+def test_membership_filter_years():
+    items = [
+        BBMembership(courseId='old', created=_date(2019)),
+        BBMembership(courseId='new', created=_date(2023)),
+        BBMembership(courseId='future', created=_date(2026)),
+        BBMembership(courseId='unknown'),
+    ]
+    f = BBMembershipFilter(BWFilter(), min_year=2020, max_year=2025)
+    assert [m.courseId for m in f.filter(items)] == ['new', 'unknown']
+
+
+def test_membership_filter_available():
+    items = [
+        BBMembership(courseId='yes',
+                     availability=BBAvailability(available='Yes')),
+        BBMembership(courseId='no',
+                     availability=BBAvailability(available='No')),
+        BBMembership(courseId='none'),
+    ]
+    f = BBMembershipFilter(BWFilter(), available=True)
+    assert [m.courseId for m in f.filter(items)] == ['yes']
+
+
+def test_content_filter():
+    def content(id: str, title: str, res_type: BBResourceType,
+                year: int) -> BBCourseContent:
+        return BBCourseContent(
+            id=id, title=title, modified=_date(year),
+            contentHandler=BBContentHandler(id=res_type)
+        )
+
+    items = [
+        content('1', 'Week 1 Slides', BBResourceType.File, 2024),
+        content('2', 'Week 2 Slides', BBResourceType.Folder, 2024),
+        content('3', 'Week 3 Slides', BBResourceType.File, 2021),
+        content('4', 'Syllabus', BBResourceType.File, 2024),
+    ]
+    f = BBContentFilter(
+        resource_types=BWFilter(whitelist=[BBResourceType.File.value]),
+        title=r'^Week \d+',
+        modified_after=_date(2023)
+    )
+    assert [c.id for c in f.filter(items)] == ['1']
@@ -0,0 +1,71 @@
+"""
+Test the group roster
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from unittest import mock
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.exceptions import BBForbiddenError
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+SETS = [{'id': 's1', 'name': 'Labs'}]
+
+GROUPS = {
+    None: [{'id': 's1', 'name': 'Labs'}, {'id': 'g0', 'name': 'Staff'}],
+    's1': [{'id': 'g1', 'groupSetId': 's1', 'name': 'Lab A'},
+           {'id': 'g2', 'groupSetId': 's1', 'name': 'Lab B'}],
+}
+
+MEMBERS = {
+    'g0': ['u9'],
+    'g1': ['u1', 'u2'],
+    'g2': ['u3', 'u1'],
+}
+
+
+def _members(course_id, group_id):
+    if group_id not in MEMBERS:
+        raise BBForbiddenError({'status': 403})
+    return [{'userId': u} for u in MEMBERS[group_id]]
+
+
+def test_ex_fetch_groups():
+    s = BlackboardExtended(API_URL, cookies=None)
+
+    with (mock.patch.object(s, 'fetch_group_sets', return_value=SETS),
+          mock.patch.object(s, 'fetch_groups',
+                            return_value=GROUPS[None]),
+          mock.patch.object(s, 'fetch_group_set_children',
+                            side_effect=lambda course_id, group_id:
+                            GROUPS[group_id]),
+          mock.patch.object(s, 'fetch_group_memberships',
+                            side_effect=_members)):
+        roster = s.ex_fetch_groups('c1', max_workers=2)
+
+    assert sorted(g.id for g in roster) == ['g0', 'g1', 'g2']
+    assert [g.id for g in roster.sets] == ['s1']
+    assert [g.id for g in roster.groups_in_set('s1')] == ['g1', 'g2']
+    assert roster.member_ids('g1') == ['u1', 'u2']
+    assert roster.members('g2')[0].groupId == 'g2'
+    assert sorted(g.id for g in roster.groups_of('u1')) == ['g1', 'g2']
+    assert roster.groups_of('u9', set_id='s1') == []
+    assert sorted(roster.users) == ['u1', 'u2', 'u3', 'u9']
@@ -0,0 +1,162 @@
+"""
+Test the hedging transport
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+import threading
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from blackboard.hedging import HedgeStats, HedgingTransport
+
+
+API = "http://blackboard.example.org/learn/api/public/v1"
+
+
+class FakeAdapter(BaseAdapter):
+    """Answers after the delays given, in order, then straight away."""
+
+    def __init__(self, delays=()):
+        super().__init__()
+        self.delays = list(delays)
+        self.sent = []
+        self.closed = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            n = len(self.sent)
+            self.sent.append(request.method)
+            delay = self.delays[n] if n < len(self.delays) else 0
+
+        if delay is None:
+            raise requests.ConnectTimeout()
+        time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response.reason = str(n)
+        response.close = lambda: self.closed.append(n)
+        return response
+
+    def close(self):
+        pass
+
+
+def mount(adapter, **kwargs):
+    transport = HedgingTransport(adapter, **kwargs)
+    s = requests.Session()
+    s.mount('http://', transport)
+    return s, transport
+
+
+def test_fast_requests_are_not_hedged():
+    adapter = FakeAdapter()
+    s, transport = mount(adapter, delay=0.5)
+
+    for _ in range(5):
+        assert s.get(f"{API}/courses/_1_1").ok
+
+    assert len(adapter.sent) == 5
+    assert transport.stats() == HedgeStats(requests=5)
+
+
+def test_slow_request_is_hedged():
+    adapter = FakeAdapter([1.0])
+    s, transport = mount(adapter, delay=0.05)
+
+    start = time.monotonic()
+    response = s.get(f"{API}/courses/_1_1/contents")
+    assert time.monotonic() - start < 0.5
+
+    # The hedge answered and the primary is released once done
+    assert response.reason == '1'
+    assert transport.stats() == HedgeStats(requests=1, hedges=1, wins=1)
+    time.sleep(1.1)
+    assert adapter.closed == [0]
+
+
+def test_failed_hedge_falls_back():
+    adapter = FakeAdapter([0.2, None])
+    s, transport = mount(adapter, delay=0.05)
+    assert s.get(f"{API}/courses").reason == '0'
+
+    adapter = FakeAdapter([None, None])
+    s, transport = mount(adapter, delay=0)
+    with pytest.raises(requests.ConnectTimeout):
+        s.get(f"{API}/courses")
+
+
+def test_hedges_are_capped():
+    adapter = FakeAdapter([0.1] * 20)
+    s, transport = mount(adapter, delay=0.01, max_ratio=0.1, burst=2)
+
+    for _ in range(8):
+        s.get(f"{API}/courses/_1_1/contents")
+
+    # Only the burst and the tokens earned meanwhile are spent
+    assert transport.stats().hedges == 2
+
+
+def test_only_plain_gets_are_hedged():
+    adapter = FakeAdapter([0.1, 0.1])
+    s, transport = mount(adapter, delay=0)
+
+    s.post(f"{API}/courses")
+    s.get(f"{API}/courses/_1_1/contents/_2_1/attachments/_3_1/download",
+          stream=True)
+
+    assert adapter.sent == ['POST', 'GET']
+    assert transport.stats() == HedgeStats()
+
+
+def test_delay_follows_percentile():
+    adapter = FakeAdapter()
+    transport = HedgingTransport(adapter, min_samples=20, default_delay=2,
+                                 min_delay=0.01)
+    key = transport.key(f"{API}/courses/_1_1/contents")
+    assert key == ('blackboard.example.org',
+                   '/learn/api/public/v1/courses/{id}/contents')
+    assert transport.hedge_delay(key) == 2
+
+    for i in range(100):
+        transport._record(key, i / 100)
+
+    assert transport.hedge_delay(key) == pytest.approx(0.94)
+
+
+def test_queued_requests_are_not_hedged():
+    # Many callers share few workers, each request is fast
+    adapter = FakeAdapter([0.03] * 12)
+    s, transport = mount(adapter, delay=0.1, max_workers=2)
+
+    threads = [threading.Thread(target=s.get, args=(f"{API}/users/me",))
+               for _ in range(12)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Queueing took longer than the delay, but is not counted
+    assert transport.stats() == HedgeStats(requests=12, hedges=0, wins=0)
+    assert len(adapter.sent) == 12
@@ -0,0 +1,104 @@
+"""
+Test the institutional hierarchy graph
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from unittest import mock
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.blackboard import BBNode
+from blackboard.hierarchy import BBHierarchy
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+CHILDREN = {
+    'uni': ['sci', 'art'],
+    'sci': ['cs', 'maths'],
+    'art': [],
+    'cs': [],
+    'maths': [],
+}
+
+COURSES = {
+    'cs': [('_1_1', True), ('_2_1', True)],
+    'maths': [('_2_1', False), ('_3_1', True)],
+    'art': [('_4_1', True)],
+}
+
+
+def _children(node_id):
+    return [{'id': c, 'title': c.upper(), 'parentId': node_id}
+            for c in CHILDREN[node_id]]
+
+
+def _courses(node_id):
+    return [{'nodeId': node_id, 'courseId': c, 'isPrimary': p}
+            for c, p in COURSES.get(node_id, [])]
+
+
+def _fetch(s, **kwargs):
+    with (mock.patch.object(s, 'fetch_nodes',
+                            return_value=[{'id': 'uni'}]) as nodes,
+          mock.patch.object(s, 'fetch_node_children',
+                            side_effect=_children),
+          mock.patch.object(s, 'fetch_node_course_associations',
+                            side_effect=_courses)):
+        return s.ex_fetch_hierarchy(max_workers=3, **kwargs), nodes
+
+
+def test_ex_fetch_hierarchy():
+    s = BlackboardExtended(API_URL, cookies=None)
+    hierarchy, _ = _fetch(s)
+
+    assert len(hierarchy) == 5
+    assert [n.id for n in hierarchy.roots] == ['uni']
+    assert sorted(n.id for n in hierarchy.children('sci')) == ['cs', 'maths']
+    assert [n.id for n in hierarchy.ancestors('cs')] == ['sci', 'uni']
+    assert hierarchy.courses('cs') == ['_1_1', '_2_1']
+    assert sorted(hierarchy.courses('sci', recursive=True)) \
+        == ['_1_1', '_2_1', '_3_1']
+    assert sorted(n.id for n in hierarchy.nodes_of('_2_1')) \
+        == ['cs', 'maths']
+    assert hierarchy.primary_node('_2_1').id == 'cs'
+    assert hierarchy.primary_node('_9_1') is None
+
+
+def test_hierarchy_cache(tmp_path):
+    cache = tmp_path / 'hierarchy.json'
+    s = BlackboardExtended(API_URL, cookies=None)
+
+    built, _ = _fetch(s, cache=cache)
+    assert cache.exists()
+
+    loaded, nodes = _fetch(s, cache=cache)
+    nodes.assert_not_called()
+    assert [n.id for n in loaded.ancestors('maths')] == ['sci', 'uni']
+    assert sorted(loaded.courses('uni', recursive=True)) \
+        == sorted(built.courses('uni', recursive=True))
+
+    _, nodes = _fetch(s, cache=cache, max_age=0)
+    nodes.assert_called_once()
+
+
+def test_hierarchy_cycle():
+    hierarchy = BBHierarchy()
+    hierarchy.add_node(BBNode(id='a', parentId='b'))
+    hierarchy.add_node(BBNode(id='b', parentId='a'))
+    assert [n.id for n in hierarchy.ancestors('a')] == ['b']
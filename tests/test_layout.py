@@ -0,0 +1,134 @@
+"""
+Test the filesystem layout planner
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import random
+from pathlib import Path
+
+import pytest
+from hypothesis import given, strategies as st
+
+from blackboard.layout import LayoutPlanner
+from blackboard.blackboard import BBAttachment, BBCourseContent
+
+
+ROOT = Path('course')
+
+
+def _tree() -> list[BBCourseContent]:
+    return [
+        BBCourseContent(id='1', title='Week 1', position=0),
+        BBCourseContent(id='2', title='Week<1', position=1),
+        BBCourseContent(id='3', title='week 1', position=2),
+        BBCourseContent(id='4', title='Slides', parentId='1'),
+        BBCourseContent(id='5', title='Slides', parentId='2'),
+    ]
+
+
+def test_plan_tree():
+    paths = LayoutPlanner(ROOT).plan(_tree())
+    assert paths == {
+        '1': ROOT / 'Week 1',
+        '2': ROOT / 'Week_1',
+        '3': ROOT / 'week 1 (2)',
+        '4': ROOT / 'Week 1' / 'Slides',
+        '5': ROOT / 'Week_1' / 'Slides',
+    }
+
+
+def test_plan_case_sensitive():
+    paths = LayoutPlanner(ROOT, case_sensitive=True).plan(_tree())
+    assert paths['3'] == ROOT / 'week 1'
+
+
+def test_plan_is_stable():
+    tree = _tree()
+    expected = LayoutPlanner(ROOT).plan(tree)
+    random.shuffle(tree)
+    assert LayoutPlanner(ROOT).plan(tree) == expected
+
+
+@given(st.lists(st.text(), min_size=1))
+def test_plan_unique(titles):
+    contents = [BBCourseContent(id=str(i), title=t)
+                for i, t in enumerate(titles)]
+    paths = LayoutPlanner(ROOT, max_name_length=16).plan(contents)
+    names = [p.name.casefold() for p in paths.values()]
+    assert len(paths) == len(contents)
+    assert len(set(names)) == len(names)
+    assert all(len(n.encode()) <= 16 for n in names)
+
+
+def test_place_attachments_keeps_extension():
+    attachments = [BBAttachment(id='a', fileName='notes.pdf'),
+                   BBAttachment(id='b', fileName='notes.pdf')]
+    paths = LayoutPlanner(ROOT).place_attachments(ROOT, attachments)
+    assert paths == {'a': ROOT / 'notes.pdf', 'b': ROOT / 'notes (2).pdf'}
+
+
+def test_place_attachments_name_length():
+    attachments = [BBAttachment(id=i, fileName='longname.pdf')
+                   for i in ('a', 'b')]
+
+    planner = LayoutPlanner(ROOT, max_name_length=11)
+    assert planner.place_attachments(ROOT, attachments) == {
+        'a': ROOT / 'longnam.pdf', 'b': ROOT / 'lon (2).pdf'
+    }
+
+    # The extension is dropped rather than the whole stem
+    planner = LayoutPlanner(ROOT, max_name_length=8)
+    assert planner.place_attachments(ROOT, attachments) == {
+        'a': ROOT / 'long.pdf', 'b': ROOT / 'long (2)'
+    }
+
+
+@given(st.lists(st.text(min_size=1), min_size=1, max_size=12),
+       st.integers(min_value=1, max_value=24))
+def test_place_attachments_within_limits(names, room):
+    parent = ROOT / 'abc'
+    max_path = len('course/abc/') + room
+    attachments = [BBAttachment(id=str(i), fileName=n)
+                   for i, n in enumerate(names)]
+    planner = LayoutPlanner(ROOT, max_name_length=10,
+                            max_path_length=max_path)
+
+    try:
+        paths = planner.place_attachments(parent, attachments)
+    except ValueError:
+        # Only when not even a counter and a character fit
+        assert room < len(f" ({len(names)})") + 4
+        return
+
+    names = [p.name.casefold() for p in paths.values()]
+    assert len(set(names)) == len(attachments)
+    assert all(len(n.encode()) <= 10 for n in names)
+    assert all(len(str(p).encode()) <= max_path for p in paths.values())
+
+
+def test_plan_path_length():
+    planner = LayoutPlanner(ROOT, max_path_length=len('course/') + 4)
+    paths = planner.plan([BBCourseContent(id='1', title='Lecture')])
+    assert paths == {'1': ROOT / 'Lect'}
+
+    with pytest.raises(ValueError):
+        planner.plan([
+            BBCourseContent(id='1', title='Lecture'),
+            BBCourseContent(id='2', title='Slides', parentId='1'),
+        ])
@@ -0,0 +1,101 @@
+"""
+Test the mock Blackboard server and load test harness
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import pytest
+import requests
+
+from blackboard.blackboard import BBCourse, BBCourseContent
+from blackboard.testing.loadtest import LoadReport, run_load
+from blackboard.testing.server import MockConfig, MockBlackboardServer
+
+
+API = '/learn/api/public/v1'
+
+
+@pytest.fixture
+def server():
+    config = MockConfig(courses=3, depth=1, breadth=4, page_size=2,
+                        attachment_size=1000)
+    with MockBlackboardServer(config) as s:
+        yield s
+
+
+def test_courses(server):
+    r = requests.get(f"{server.url}/learn/api/public/v3/courses/_1_1")
+    assert BBCourse(**r.json()).code == 'CO1001'
+
+
+def test_paging(server):
+    url = f"{server.url}{API}/courses/_1_1/contents"
+    contents = []
+
+    while url:
+        body = requests.get(url).json()
+        contents.extend(BBCourseContent(**c) for c in body['results'])
+        next_page = body.get('paging', {}).get('nextPage')
+        url = next_page and f"{server.url}{next_page}"
+
+    assert [c.position for c in contents] == [0, 1, 2, 3]
+
+
+def test_not_found(server):
+    r = requests.get(f"{server.url}{API}/courses/_9_9/contents")
+    assert r.status_code == 404
+    assert r.json()['status'] == 404
+
+
+def test_etag(server):
+    url = f"{server.url}{API}/users/me"
+    etag = requests.get(url).headers['ETag']
+    r = requests.get(url, headers={'If-None-Match': etag})
+    assert r.status_code == 304
+
+
+def test_download(server):
+    content_id, attachments = next(iter(server.data.attachments.items()))
+    url = (f"{server.url}{API}/courses/_1_1/contents/{content_id}"
+           f"/attachments/{attachments[0]['id']}/download")
+    assert len(requests.get(url).content) == 1000
+
+
+def test_throttling():
+    with MockBlackboardServer(MockConfig(courses=1, rate_limit=2)) as s:
+        codes = [requests.get(f"{s.url}{API}/system/version").status_code
+                 for _ in range(5)]
+        assert 429 in codes
+        assert s.throttled_count == codes.count(429)
+
+
+def test_run_load():
+    calls = []
+    report = run_load('http://mock', sessions=3, iterations=4,
+                      scenario=lambda s, i: calls.append(i),
+                      session_factory=lambda url: None)
+    assert len(calls) == 12
+    assert report.operations == 12
+    assert report.errors == 0
+
+
+def test_load_report_percentiles():
+    report = LoadReport(1, 10.0, [i / 100 for i in range(1, 101)])
+    assert report.throughput == 10.0
+    assert report.percentile(50) == pytest.approx(0.505)
+    assert report.percentile(99) == pytest.approx(0.991, abs=0.001)
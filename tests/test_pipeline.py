@@ -0,0 +1,207 @@
+"""
+Test the download pipeline
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import io
+import time
+import threading
+from unittest import mock
+
+import pytest
+import requests
+from bwfilters import BWFilter
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.blackboard import BBAttachment, BBCourse, BBCourseContent
+from blackboard.exceptions import BBStatusError, BBUnauthorizedError
+from blackboard.filters import BBAttachmentFilter
+from blackboard.pipeline import DownloadPipeline
+from blackboard.sink import DownloadSink, SinkResult
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+FOLDER = {'id': 'resource/x-bb-folder'}
+FILE = {'id': 'resource/x-bb-file'}
+
+# parent -> children, None is the top level
+TREE = {
+    None: [('1', 'Week 1', FOLDER), ('2', 'Syllabus', FILE)],
+    '1': [('3', 'Slides', FILE), ('4', 'Empty', FOLDER),
+          ('5', 'Lecture', FILE)],
+    '4': [],
+}
+
+ATTACHMENTS = {
+    '2': [BBAttachment(id='a2', fileName='syllabus.pdf',
+                       mimeType='application/pdf')],
+    '3': [BBAttachment(id='a3', fileName='slides.pdf',
+                       mimeType='application/pdf'),
+          BBAttachment(id='b3', fileName='slides.pdf',
+                       mimeType='application/pdf')],
+    '5': [BBAttachment(id='a5', fileName='lecture.mp4',
+                       mimeType='video/mp4')],
+}
+
+
+def _list(course_id, content_id=None):
+    return [BBCourseContent(id=i, title=t, contentHandler=h,
+                            hasChildren=i in TREE)
+            for i, t, h in TREE[content_id]]
+
+
+def _attachments(course_id, content_id):
+    return ATTACHMENTS[content_id]
+
+
+def _response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.fixture
+def session():
+    s = BlackboardExtended(API_URL, cookies=None)
+    download = mock.Mock(side_effect=lambda course_id, content_id,
+                         attachment_id: _response(attachment_id.encode()))
+    with mock.patch.object(s, 'fetch_contents', side_effect=_list), \
+            mock.patch.object(s, 'fetch_content_children',
+                              side_effect=_list), \
+            mock.patch.object(s, 'fetch_file_attachments',
+                              side_effect=_attachments), \
+            mock.patch.object(s, 'download', download):
+        yield s
+
+
+def test_pipeline(session, tmp_path):
+    videos = BBAttachmentFilter(mime_types=BWFilter(blacklist=['video/*']))
+    pipeline = DownloadPipeline(session, tmp_path, attachment_filter=videos)
+    report = pipeline.run([BBCourse(id='_1_1', name='Maths')])
+
+    course = tmp_path / 'Maths'
+    assert sorted(report.downloaded) == [
+        course / 'Syllabus' / 'syllabus.pdf',
+        course / 'Week 1' / 'Slides' / 'slides (2).pdf',
+        course / 'Week 1' / 'Slides' / 'slides.pdf',
+    ]
+    assert (course / 'Week 1' / 'Slides' / 'slides (2).pdf').read_bytes() \
+        == b'b3'
+    assert report.skipped == [course / 'Week 1' / 'Lecture' / 'lecture.mp4']
+    assert report.size == 6
+    assert not report.failed
+
+
+def test_pipeline_failures(session, tmp_path):
+    def download(course_id, content_id, attachment_id):
+        if attachment_id == 'a2':
+            raise requests.ConnectionError()
+        return _response(b'x')
+
+    session.download.side_effect = download
+    session.fetch_content_children.side_effect = requests.ReadTimeout()
+
+    report = DownloadPipeline(session, tmp_path).run(
+        [BBCourse(id='_1_1', name='Maths')]
+    )
+
+    assert report.downloaded == []
+    assert set(report.failed) == {'1', str(tmp_path / 'Maths' / 'Syllabus'
+                                           / 'syllabus.pdf')}
+
+
+def test_pipeline_status_errors(session, tmp_path):
+    def children(course_id, content_id):
+        if content_id == '1':
+            raise BBStatusError({'status': 404})
+        return _list(course_id, content_id)
+
+    def attachments(course_id, content_id):
+        if content_id == '2':
+            raise BBStatusError({'status': 500})
+        return _attachments(course_id, content_id)
+
+    session.fetch_content_children.side_effect = children
+    session.fetch_file_attachments.side_effect = attachments
+    course = BBCourse(id='_1_1', name='Maths')
+
+    report = DownloadPipeline(session, tmp_path).run([course])
+    assert report.downloaded == []
+    assert set(report.failed) == {'1', '2'}
+
+    # Only the missing folder is lost
+    session.fetch_file_attachments.side_effect = _attachments
+    report = DownloadPipeline(session, tmp_path).run([course])
+    assert report.downloaded == [tmp_path / 'Maths' / 'Syllabus'
+                                 / 'syllabus.pdf']
+    assert set(report.failed) == {'1'}
+
+    # An expired session stops the run
+    session.fetch_contents.side_effect = BBUnauthorizedError({'status': 401})
+    with pytest.raises(BBUnauthorizedError):
+        DownloadPipeline(session, tmp_path).run([course])
+
+
+def test_pipeline_backpressure(session, tmp_path):
+    # Many files, slowly written
+    TREE_BIG = {None: [(str(i), f"File {i}", FILE) for i in range(40)]}
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class SlowResponse(requests.Response):
+        def close(self):
+            nonlocal in_flight
+            with lock:
+                in_flight -= 1
+
+    def download(course_id, content_id, attachment_id):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        response = SlowResponse()
+        response.status_code = 200
+        response.raw = io.BytesIO(b'data')
+        return response
+
+    class SlowSink(DownloadSink):
+        def write(self, response, path):
+            time.sleep(0.01)
+            response.close()
+            return SinkResult(path, 4)
+
+    session.fetch_contents.side_effect = \
+        lambda course_id: [BBCourseContent(id=i, title=t, contentHandler=h)
+                           for i, t, h in TREE_BIG[None]]
+    session.fetch_file_attachments.side_effect = \
+        lambda course_id, content_id: [BBAttachment(id=f"a{content_id}",
+                                                    fileName='f.txt')]
+    session.download.side_effect = download
+
+    report = DownloadPipeline(
+        session, tmp_path, sink=SlowSink(), download_workers=2,
+        write_workers=1, queue_size=2
+    ).run([BBCourse(id='_1_1', name='Maths')])
+
+    assert len(report.downloaded) == 40
+    # Downloads wait for the writer, so few responses are open at once
+    assert peak <= 2 + 2 + 1
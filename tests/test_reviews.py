@@ -0,0 +1,125 @@
+"""
+Test review progress
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from unittest import mock
+
+import pytest
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.exceptions import (
+    BBStatusError,
+    BBForbiddenError,
+    BBUnauthorizedError
+)
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+# content -> users who reviewed it
+REVIEWED = {
+    'c1': ['u1', 'u2', 'u3'],
+    'c2': ['u1'],
+    'c3': [],
+}
+
+STATUSES = [
+    {'contentId': c, 'userId': u, 'isReviewed': u in REVIEWED[c],
+     'reviewDate': '2026-09-01T09:00:00Z' if u in REVIEWED[c] else None}
+    for c in REVIEWED for u in ('u1', 'u2', 'u3')
+]
+
+
+def _course(course_id, params):
+    offset, limit = params['offset'], params['limit']
+    return STATUSES[offset:offset + limit]
+
+
+def _item(course_id, content_id, user_id):
+    if content_id == 'c9':
+        raise BBStatusError({'status': 404})
+    return {'isReviewed': user_id in REVIEWED[content_id]}
+
+
+@pytest.fixture
+def session():
+    s = BlackboardExtended(API_URL, cookies=None)
+    s._user_id = 'u1'
+    with mock.patch.object(s, 'fetch_performance_review_status',
+                           side_effect=_course), \
+            mock.patch.object(s, 'fetch_review_status', side_effect=_item):
+        yield s
+
+
+def test_review_progress(session):
+    index = session.ex_fetch_review_progress('course', page_size=4)
+
+    # Pages of 4 until a short one
+    assert session.fetch_performance_review_status.call_count == 3
+    assert session.fetch_review_status.call_count == 0
+
+    assert len(index) == 4
+    assert index.reviewed_users('c1') == ['u1', 'u2', 'u3']
+    assert index.reviewed_contents('u1') == ['c1', 'c2']
+    assert index.is_reviewed('c2', 'u1')
+    assert not index.is_reviewed('c3', 'u1')
+    assert index['c1', 'u2'].reviewDate is not None
+    assert index.progress('u1', ['c1', 'c2', 'c3']) == pytest.approx(2 / 3)
+
+    index = session.ex_fetch_review_progress('course', ['c2', 'c3'],
+                                             user_ids=['u2'])
+    assert len(index) == 0
+    assert index.progress('u2', []) == 0.0
+
+
+def test_review_progress_capped_pages(session):
+    def capped(course_id, params):
+        return _course(course_id, {**params, 'limit': min(params['limit'], 2)})
+
+    session.fetch_performance_review_status.side_effect = capped
+    index = session.ex_fetch_review_progress('course', page_size=4)
+
+    # Pages of 2 until a shorter one
+    assert session.fetch_performance_review_status.call_count == 5
+    assert len(index) == 4
+    assert index.reviewed_users('c1') == ['u1', 'u2', 'u3']
+
+
+def test_review_progress_fallback(session):
+    session.fetch_performance_review_status.side_effect = \
+        BBForbiddenError({'status': 403})
+
+    with pytest.raises(BBForbiddenError):
+        session.ex_fetch_review_progress('course')
+
+    # Checks the current user by default
+    index = session.ex_fetch_review_progress('course', ['c1', 'c2', 'c9'])
+    assert session.fetch_review_status.call_count == 3
+    assert index.reviewed_contents('u1') == ['c1', 'c2']
+
+    index = session.ex_fetch_review_progress('course', ['c1', 'c2'],
+                                             user_ids=['u1', 'u2'])
+    assert index.reviewed_users('c1') == ['u1', 'u2']
+    assert index.reviewed_users('c2') == ['u1']
+
+    session.fetch_performance_review_status.side_effect = \
+        BBUnauthorizedError({'status': 401})
+    with pytest.raises(BBUnauthorizedError):
+        session.ex_fetch_review_progress('course', ['c1'])
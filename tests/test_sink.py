@@ -0,0 +1,124 @@
+"""
+Test the download sink
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import io
+import gzip
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from blackboard.sink import DownloadSink
+
+
+BODY = bytes(range(256)) * 12289
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body, headers = BODY, {}
+        if self.path == '/gzip':
+            body, headers = gzip.compress(BODY), {'Content-Encoding': 'gzip'}
+        elif self.path == '/missing':
+            body = b'Not found'
+        elif self.path == '/short':
+            # The connection drops before the promised length
+            self.close_connection = True
+            headers = {'Content-Length': '100'}
+            body = BODY[:40]
+
+        self.send_response(404 if self.path == '/missing' else 200)
+        headers.setdefault('Content-Length', str(len(body)))
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.mark.parametrize("route", ['/file', '/gzip'])
+def test_sink_write(server, tmp_path, route):
+    sink = DownloadSink(buffer_size=64 * 1024, checksum='sha256', fsync=True,
+                        sync_every=1024 * 1024)
+
+    with requests.Session() as s:
+        for i in range(2):
+            path = tmp_path / 'out' / f"{i}.bin"
+            result = sink.write(s.get(server + route, stream=True), path)
+
+            assert result.size == len(BODY)
+            assert result.digest == hashlib.sha256(BODY).hexdigest()
+            assert path.read_bytes() == BODY
+
+    assert sorted(p.name for p in (tmp_path / 'out').iterdir()) \
+        == ['0.bin', '1.bin']
+
+
+def test_sink_http_error(server, tmp_path):
+    path = tmp_path / 'missing.bin'
+
+    with pytest.raises(requests.HTTPError):
+        DownloadSink().write(requests.get(server + '/missing', stream=True),
+                             path)
+    assert not path.exists()
+
+
+def test_sink_short_body(server, tmp_path):
+    # A body cut short is an error, not a smaller file
+    path = tmp_path / 'short.bin'
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        DownloadSink().write(requests.get(server + '/short', stream=True),
+                             path)
+    assert list(tmp_path.iterdir()) == []
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Length'] = '1000000'
+    response.raw = io.BytesIO(b'abc')
+
+    sink = DownloadSink(buffer_size=2)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        sink.write(response, path)
+    assert not path.exists()
+
+    # Each thread reuses its buffer
+    assert sink._buffer() is sink._buffer()
+
+
+def test_sink_checksum_algorithm():
+    with pytest.raises(ValueError):
+        DownloadSink(checksum='nope')
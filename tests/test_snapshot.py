@@ -0,0 +1,105 @@
+"""
+Test binary snapshots
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import pytest
+
+from blackboard import snapshot
+from blackboard.blackboard import (
+    BBCourse,
+    BBAttachment,
+    BBMembership,
+    BBResourceType,
+    BBCourseContent
+)
+
+
+def _contents(n):
+    return [BBCourseContent(id=f"_{i}_1", title=f"Week {i}", position=i,
+                            modified='2026-01-12T09:25:56Z',
+                            contentHandler={'id': 'resource/x-bb-file'})
+            for i in range(n)]
+
+
+@pytest.fixture
+def snap(tmp_path):
+    path = tmp_path / 'bb.snap'
+    snapshot.write_snapshot(
+        path,
+        courses=[BBCourse(id='c1', name='CS101 : Intro'), BBCourse(id='c2')],
+        memberships=[BBMembership(courseId='c1', childCourseId='c0')],
+        contents={'c1': _contents(3), 'c2': []},
+        attachments={'_1_1': [BBAttachment(id='a1', fileName='w1.pdf')]}
+    )
+    return path
+
+
+def test_snapshot(snap):
+    with snapshot.Snapshot(snap) as s:
+        assert len(s.courses) == 2
+        assert s.course('c1').title == 'Intro'
+        assert s.course('c9') is None
+        assert s.memberships[0].childCourseId == 'c0'
+        assert s.course_ids == ['c1', 'c2']
+
+        contents = s.contents('c1')
+        assert len(contents) == 3
+        assert contents[-1].title == 'Week 2'
+        assert contents[0].contentHandler == BBResourceType.File
+        assert contents[1].modified.year == 2026
+        assert contents[1] is contents[1]
+        assert [c.id for c in contents[1:]] == ['_1_1', '_2_1']
+
+        assert len(s.contents('c2')) == 0
+        assert len(s.contents('c9')) == 0
+        assert s.attachments('_1_1')[0].fileName == 'w1.pdf'
+        assert list(s.attachments('_0_1')) == []
+
+        with pytest.raises(IndexError):
+            contents[3]
+
+
+def test_snapshot_lazy(snap, mocker):
+    validate = mocker.spy(BBCourseContent, 'model_validate')
+
+    with snapshot.Snapshot(snap) as s:
+        contents = s.contents('c1')
+        validate.assert_not_called()
+        contents[2]
+        contents[2]
+        assert validate.call_count == 1
+
+        # Models are kept between lookups
+        assert s.contents('c1')[2] is contents[2]
+        assert s.attachments('_1_1')[0] is s.attachments('_1_1')[0]
+        assert validate.call_count == 1
+
+
+def test_snapshot_version(snap):
+    data = bytearray(snap.read_bytes())
+    data[8] = 99
+    snap.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        snapshot.Snapshot(snap)
+
+    snap.write_bytes(b'not a snapshot at all, not even close')
+    with pytest.raises(ValueError):
+        snapshot.Snapshot(snap)
@@ -0,0 +1,99 @@
+"""
+Test the background task waiter
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from blackboard.blackboard import BBTaskStatus
+from blackboard.exceptions import BBStatusError, BBTaskFailedError
+from blackboard.tasks import TaskWaiter
+
+
+class FakeSession:
+    """Tasks that finish after a number of polls."""
+
+    def __init__(self, polls):
+        self.polls = dict(polls)
+        self.calls = {k: 0 for k in polls}
+        self.lock = threading.Lock()
+
+    def _poll(self, task_id, done):
+        with self.lock:
+            self.calls[task_id] += 1
+            remaining = self.polls[task_id] - self.calls[task_id]
+
+        if remaining > 0:
+            raise BBStatusError({'id': task_id, 'status': 'Running',
+                                 'percentComplete': 50})
+        return done(task_id)
+
+    def fetch_task(self, course_id, task_id):
+        return self._poll(task_id, lambda t: {'id': course_id})
+
+    def fetch_system_task(self, task_id):
+        def done(task_id):
+            status = 'Failed' if task_id == 'bad' else 'Complete'
+            raise BBStatusError({'id': task_id, 'status': status})
+        return self._poll(task_id, done)
+
+
+def test_task_waiter():
+    session = FakeSession({f"t{i}": i % 4 + 1 for i in range(20)} |
+                          {'s1': 2, 'bad': 1})
+    done = []
+
+    with TaskWaiter(session, initial_interval=0.01, jitter=0.5) as waiter:
+        futures = [waiter.wait_course_task(f"c{i}", f"t{i}",
+                                           callback=done.append)
+                   for i in range(20)]
+        system = waiter.wait_system_task('s1')
+        bad = waiter.wait_system_task('bad')
+
+        assert [f.result(timeout=5) for f in futures] \
+            == [{'id': f"c{i}"} for i in range(20)]
+        assert system.result(timeout=5).status == BBTaskStatus.Complete
+
+        with pytest.raises(BBTaskFailedError):
+            bad.result(timeout=5)
+
+    assert len(done) == 20
+    assert session.calls['t3'] == 4
+
+
+def test_task_waiter_timeout_and_close():
+    session = FakeSession({'slow': 1000, 'forever': 1000})
+
+    with TaskWaiter(session, initial_interval=0.01) as waiter:
+        slow = waiter.wait_course_task('c', 'slow', timeout=0.1)
+        forever = waiter.wait_course_task('c', 'forever')
+
+        with pytest.raises(TimeoutError):
+            slow.result(timeout=5)
+        assert len(waiter) == 1
+
+    assert forever.cancelled()
+    with pytest.raises(CancelledError):
+        forever.result()
+
+    with pytest.raises(RuntimeError):
+        waiter.wait_system_task('late')
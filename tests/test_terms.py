@@ -0,0 +1,139 @@
+"""
+Test term lookups and grouping
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+import requests
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.blackboard import BBCourse, BBMembership, BBTerm
+from blackboard.exceptions import BBForbiddenError
+from blackboard.terms import TermResolver
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+
+NOW = datetime.now(timezone.utc).year
+
+TERMS = {
+    'past': {'id': 'past', 'name': 'Autumn', 'availability': {
+        'duration': {'type': 'DateRange',
+                     'start': f"{NOW - 1}-09-01T00:00:00Z",
+                     'end': f"{NOW - 1}-12-31T00:00:00Z"}}},
+    'now': {'id': 'now', 'name': 'Current', 'availability': {
+        'duration': {'type': 'DateRange',
+                     'start': f"{NOW - 1}-12-31T00:00:00Z",
+                     'end': f"{NOW + 1}-01-01T00:00:00Z"}}},
+    'always': {'id': 'always', 'availability': {
+        'duration': {'type': 'Continuous'}}},
+}
+
+COURSES = {
+    'c1': 'now', 'c2': 'past', 'c3': 'now', 'c4': None, 'c5': 'always',
+    'c6': 'hidden',
+}
+
+
+def _term(term_id):
+    time.sleep(0.01)
+    if term_id == 'hidden':
+        raise BBForbiddenError({'status': 403})
+    return TERMS[term_id]
+
+
+@pytest.fixture
+def session():
+    s = BlackboardExtended(API_URL, cookies=None)
+    memberships = [BBMembership(courseId=c, availability={'available': 'Yes'})
+                   for c in COURSES]
+    with mock.patch.object(s, 'fetch_terms', side_effect=_term), \
+            mock.patch.object(s, 'fetch_user_memberships',
+                              return_value=memberships), \
+            mock.patch.object(s, 'fetch_courses', side_effect=lambda
+                              course_id: BBCourse(id=course_id,
+                                                  termId=COURSES[course_id])):
+        yield s
+
+
+def test_term_is_current():
+    term = BBTerm(**TERMS['past'])
+    assert term.availability.duration.end.year == NOW - 1
+    assert not term.is_current()
+    assert term.is_current(datetime(NOW - 1, 10, 1, tzinfo=timezone.utc))
+    assert BBTerm(**TERMS['always']).is_current()
+    assert BBTerm(id='t').is_current()
+
+
+def test_term_resolver(session):
+    resolver = TermResolver(session, ttl=60)
+    terms = resolver.resolve(['now', 'past', None, 'now', 'hidden'] * 5)
+
+    assert sorted(terms) == ['now', 'past']
+    assert session.fetch_terms.call_count == 3
+
+    # Shared across callers until it expires
+    assert resolver.get('now') is terms['now']
+    assert session.fetch_terms.call_count == 3
+    resolver.invalidate()
+    resolver.get('now')
+    assert session.fetch_terms.call_count == 4
+
+
+def test_term_resolver_errors(session):
+    resolver = TermResolver(session)
+    session.fetch_terms.side_effect = requests.ConnectionError()
+
+    with pytest.raises(requests.ConnectionError):
+        resolver.get('now')
+
+    # Failures are not cached
+    session.fetch_terms.side_effect = _term
+    assert resolver.get('now').name == 'Current'
+
+
+def test_ex_fetch_courses_by_term(session):
+    courses = session.ex_fetch_courses(user_id='me', term_ids=['now', 'past'])
+    assert [c.id for c in courses] == ['c1', 'c2', 'c3']
+
+    courses = session.ex_fetch_courses(user_id='me', current_term=True)
+    assert [c.id for c in courses] == ['c1', 'c3', 'c5']
+
+    groups = session.ex_group_courses_by_term(
+        session.ex_fetch_courses(user_id='me')
+    )
+    assert {t: [c.id for c in g] for t, g in groups.items()} == {
+        'now': ['c1', 'c3'], 'past': ['c2'], 'always': ['c5'],
+        'hidden': ['c6'], None: ['c4'],
+    }
+    assert list(groups) == ['now', 'past', 'always', 'hidden', None]
+
+    # Each term was fetched once, by the session's resolver
+    assert session.fetch_terms.call_count == 4
+
+
+def test_shared_resolver(session):
+    other = BlackboardExtended(API_URL, cookies=None, terms=session.terms)
+    session.terms.get('now')
+    assert other.terms.get('now').id == 'now'
+    assert session.fetch_terms.call_count == 1
@@ -0,0 +1,132 @@
+"""
+Test per-endpoint timeouts and deadlines
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from blackboard.timeouts import (
+    ContextExecutor,
+    TimeoutTransport,
+    current_deadline,
+    deadline
+)
+from blackboard.exceptions import BBDeadlineExceededError
+
+
+HOST = "http://blackboard.example.org"
+API = f"{HOST}/learn/api/public/v1"
+
+
+class FakeAdapter(BaseAdapter):
+    """Records the timeout of each request."""
+
+    def __init__(self):
+        super().__init__()
+        self.timeouts = []
+
+    def send(self, request, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def session():
+    adapter = FakeAdapter()
+    transport = TimeoutTransport(adapter, timeouts={
+        r'.*/bbcswebdav/.*': (5, 300),
+        r'.*/v\d+/courses': 20,
+    })
+    s = requests.Session()
+    s.mount('http://', transport)
+    return s, adapter
+
+
+def test_endpoint_timeouts(session):
+    s, adapter = session
+    s.get(f"{HOST}/bbcswebdav/courses/CS101/notes.pdf", timeout=12)
+    s.get(f"{API}/courses", timeout=12)
+    s.get(f"{API}/users/me", timeout=12)
+    assert adapter.timeouts == [(5, 300), 20, 12]
+
+
+def test_deadline_caps_timeouts(session):
+    s, adapter = session
+
+    with deadline(60):
+        # Nested deadlines can only shorten the budget
+        with deadline(3600) as inner:
+            assert inner.remaining() <= 60
+            s.get(f"{HOST}/bbcswebdav/courses/CS101/notes.pdf")
+
+        with deadline(2):
+            s.get(f"{API}/users/me", timeout=12)
+
+    assert current_deadline() is None
+    connect, read = adapter.timeouts[0]
+    assert connect == 5 and 59 < read <= 60
+    assert adapter.timeouts[1] <= 2
+
+
+def test_deadline_exceeded(session):
+    s, adapter = session
+
+    with deadline(0):
+        with pytest.raises(BBDeadlineExceededError) as e:
+            s.get(f"{API}/users/me")
+
+    assert isinstance(e.value, requests.Timeout)
+    assert adapter.timeouts == []
+
+
+def test_executor_propagates_deadline():
+    def slow(i):
+        time.sleep(0.05)
+        return current_deadline()
+
+    with deadline(10) as budget:
+        with ContextExecutor(max_workers=2) as executor:
+            assert executor.submit(slow, 0).result() == budget
+
+    # Work still queued once the budget runs out is not started
+    started = []
+
+    def work(i):
+        started.append(i)
+        time.sleep(0.05)
+
+    with pytest.raises(BBDeadlineExceededError):
+        with deadline(0.02):
+            with ContextExecutor(max_workers=1) as executor:
+                futures = [executor.submit(work, i) for i in range(20)]
+                for f in futures:
+                    f.result()
+
+    assert len(started) < 20
+    assert all(f.done() for f in futures)
@@ -0,0 +1,103 @@
+"""
+Test the record and replay transports
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+import time
+
+import pytest
+import requests
+
+from blackboard.exceptions import BBReplayError
+from blackboard.testing.server import MockConfig, MockBlackboardServer
+from blackboard.transport import (
+    Cassette,
+    Interaction,
+    ReplayTransport,
+    RecordingTransport
+)
+
+
+API = '/learn/api/public/v1'
+
+
+def _session(adapter):
+    s = requests.Session()
+    s.mount('http://', adapter)
+    return s
+
+
+@pytest.fixture(scope='module')
+def recorded():
+    config = MockConfig(courses=1, attachment_size=5000, latency=0.02)
+
+    with MockBlackboardServer(config) as server:
+        cassette = Cassette()
+        s = _session(RecordingTransport(cassette))
+        content_id, attachments = next(iter(server.data.attachments.items()))
+        urls = [
+            f"{server.url}{API}/users/me",
+            f"{server.url}{API}/courses/_1_1/contents",
+            f"{server.url}{API}/courses/_1_1/contents/{content_id}"
+            f"/attachments/{attachments[0]['id']}/download",
+        ]
+        responses = [s.get(url, cookies={'session': 'secret'})
+                     for url in urls]
+        yield cassette, urls, responses
+
+
+def test_record(recorded):
+    cassette, urls, responses = recorded
+    assert [i.url for i in cassette] == urls
+    assert [i.body for i in cassette] == [r.content for r in responses]
+    assert all(i.elapsed >= 0.02 for i in cassette)
+    assert all('Cookie' not in i.request_headers for i in cassette)
+
+
+def test_replay(recorded, tmp_path):
+    cassette, urls, responses = recorded
+    cassette.save(tmp_path / 'crawl.cassette')
+    loaded = Cassette.load(tmp_path / 'crawl.cassette')
+    s = _session(ReplayTransport(loaded))
+
+    for url, expected in zip(urls, responses):
+        r = s.get(url, stream=True)
+        assert r.status_code == expected.status_code
+        assert r.headers['ETag'] == expected.headers['ETag']
+        assert b''.join(r.iter_content(1024)) == expected.content
+
+    with pytest.raises(BBReplayError):
+        s.get(urls[0])
+
+
+def test_replay_repeat(recorded):
+    cassette, urls, responses = recorded
+    s = _session(ReplayTransport(cassette, repeat=True))
+
+    for _ in range(3):
+        assert s.get(urls[0]).json() == responses[0].json()
+
+
+def test_replay_speed():
+    cassette = Cassette([Interaction('GET', 'http://bb/a', 200, elapsed=0.1)])
+    s = _session(ReplayTransport(cassette, speed=2, repeat=True))
+
+    start = time.perf_counter()
+    s.get('http://bb/a')
+    assert time.perf_counter() - start >= 0.05
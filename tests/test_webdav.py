@@ -0,0 +1,193 @@
+"""
+Test WebDAV listing and mirroring
+"""
+
+# Copyright (C) 2026, Jacob Sánchez Pérez
+
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA  02110-1301, USA.
+
+from pathlib import Path
+from unittest import mock
+from xml.etree import ElementTree
+
+import pytest
+import requests
+
+from blackboard.api_extended import BlackboardExtended
+from blackboard.blackboard import BBWebDAVEntry
+from blackboard.webdav import parse_multistatus, relative_path
+
+
+API_URL = "http://blackboard.example.org/api/v{version}"
+ROOT = "http://blackboard.example.org/bbcswebdav/courses/CO1"
+
+MULTISTATUS = """<?xml version="1.0" encoding="utf-8"?>
+<D:multistatus xmlns:D="DAV:">
+  <D:response>
+    <D:href>/bbcswebdav/courses/CO1/</D:href>
+    <D:propstat>
+      <D:prop><D:resourcetype><D:collection/></D:resourcetype></D:prop>
+      <D:status>HTTP/1.1 200 OK</D:status>
+    </D:propstat>
+  </D:response>
+  <D:response>
+    <D:href>/bbcswebdav/courses/CO1/Week%201.pdf</D:href>
+    <D:propstat>
+      <D:prop>
+        <D:resourcetype/>
+        <D:getcontentlength>5</D:getcontentlength>
+        <D:getetag>"abc"</D:getetag>
+        <D:getlastmodified>Mon, 12 Jan 2026 09:25:56 GMT</D:getlastmodified>
+      </D:prop>
+      <D:status>HTTP/1.1 200 OK</D:status>
+    </D:propstat>
+    <D:propstat>
+      <D:prop><D:displayname/></D:prop>
+      <D:status>HTTP/1.1 404 Not Found</D:status>
+    </D:propstat>
+  </D:response>
+</D:multistatus>
+"""
+
+
+def test_parse_multistatus():
+    folder, file = parse_multistatus(ElementTree.fromstring(MULTISTATUS))
+    assert folder.isCollection
+    assert not file.isCollection
+    assert file.href == '/bbcswebdav/courses/CO1/Week%201.pdf'
+    assert file.contentLength == 5
+    assert file.etag == '"abc"'
+    assert file.lastModified.year == 2026
+
+
+@pytest.mark.parametrize("href,expected", [
+    ('/bbcswebdav/courses/CO1/', None),
+    ('/bbcswebdav/courses/CO2/a.pdf', None),
+    ('/bbcswebdav/courses/CO1/Week%201/a.pdf', Path('Week 1', 'a.pdf')),
+    ('/bbcswebdav/courses/CO1/a/%2E%2E/b', Path('a', '_', 'b')),
+])
+def test_relative_path(href, expected):
+    assert relative_path(ROOT, href) == expected
+
+
+def _entry(href, collection=False, etag='"1"'):
+    return BBWebDAVEntry(href=href, isCollection=collection,
+                         contentLength=None if collection else 5, etag=etag)
+
+
+def test_ex_mirror_webdav(tmp_path):
+    tree = {
+        ROOT: [_entry('/bbcswebdav/courses/CO1/', True),
+               _entry('/bbcswebdav/courses/CO1/a.txt'),
+               _entry('/bbcswebdav/courses/CO1/sub/', True)],
+        f"{ROOT}/sub/": [_entry('/bbcswebdav/courses/CO1/sub/', True),
+                         _entry('/bbcswebdav/courses/CO1/sub/b.txt')],
+    }
+
+    def download(webdav_url):
+        response = mock.MagicMock(status_code=200)
+        response.iter_content.return_value = [webdav_url[-5:].encode()]
+        return response
+
+    s = BlackboardExtended(API_URL, cookies=None)
+
+    with (mock.patch.object(s, 'list_webdav',
+                            side_effect=lambda webdav_url: tree[webdav_url]),
+          mock.patch.object(s, 'download_webdav',
+                            side_effect=download) as download_webdav):
+        report = s.ex_mirror_webdav(ROOT, tmp_path, max_workers=2)
+        assert sorted(report.downloaded) == [Path('a.txt'),
+                                             Path('sub', 'b.txt')]
+        assert (tmp_path / 'sub' / 'b.txt').read_text() == 'b.txt'
+
+        report = s.ex_mirror_webdav(ROOT, tmp_path)
+        assert report.downloaded == []
+        assert len(report.unchanged) == 2
+
+        tree[ROOT][1] = _entry('/bbcswebdav/courses/CO1/a.txt', etag='"2"')
+        report = s.ex_mirror_webdav(ROOT, tmp_path)
+        assert report.downloaded == [Path('a.txt')]
+
+    assert download_webdav.call_count == 3
+
+
+def test_ex_mirror_webdav_failed_folder(tmp_path):
+    tree = {
+        ROOT: [_entry('/bbcswebdav/courses/CO1/a.txt'),
+               _entry('/bbcswebdav/courses/CO1/hidden/', True),
+               _entry('/bbcswebdav/courses/CO1/sub/', True)],
+        f"{ROOT}/sub/": [_entry('/bbcswebdav/courses/CO1/sub/b.txt')],
+    }
+
+    def list_webdav(webdav_url):
+        if webdav_url.endswith('/hidden/'):
+            raise requests.HTTPError('403 Forbidden')
+        return tree[webdav_url]
+
+    def download(webdav_url):
+        response = mock.MagicMock(status_code=200)
+        response.iter_content.return_value = [b'data']
+        return response
+
+    s = BlackboardExtended(API_URL, cookies=None)
+
+    with (mock.patch.object(s, 'list_webdav', side_effect=list_webdav),
+          mock.patch.object(s, 'download_webdav', side_effect=download)):
+        report = s.ex_mirror_webdav(ROOT, tmp_path)
+
+        # The rest of the tree is still mirrored
+        assert sorted(report.downloaded) == [Path('a.txt'),
+                                             Path('sub', 'b.txt')]
+        assert list(report.failed) == [Path('hidden')]
+
+        with pytest.raises(requests.HTTPError):
+            s.ex_list_webdav_tree(ROOT)
+
+
+def test_ex_mirror_webdav_collisions(tmp_path):
+    tree = {
+        ROOT: [_entry('/bbcswebdav/courses/CO1/a_b.pdf'),
+               _entry('/bbcswebdav/courses/CO1/a%3Ab.pdf'),
+               _entry('/bbcswebdav/courses/CO1/A_B.pdf/', True)],
+        f"{ROOT}/A_B.pdf/": [_entry('/bbcswebdav/courses/CO1/A_B.pdf/c')],
+    }
+
+    bodies = {'a_b.pdf': b'plain', 'a%3Ab.pdf': b'colon', 'c': b'inner'}
+
+    def download(webdav_url):
+        response = mock.MagicMock(status_code=200)
+        response.iter_content.return_value = [
+            bodies[webdav_url.rsplit('/', 1)[1]]
+        ]
+        return response
+
+    s = BlackboardExtended(API_URL, cookies=None)
+
+    with (mock.patch.object(s, 'list_webdav',
+                            side_effect=lambda webdav_url: tree[webdav_url]),
+          mock.patch.object(s, 'download_webdav', side_effect=download)):
+        report = s.ex_mirror_webdav(ROOT, tmp_path)
+
+        # Each remote file has its own local file, numbered by URL
+        assert sorted(report.downloaded) == [
+            Path('A_B.pdf', 'c'), Path('a_b (2).pdf'), Path('a_b (3).pdf')
+        ]
+        assert (tmp_path / 'a_b (2).pdf').read_text() == 'colon'
+        assert (tmp_path / 'a_b (3).pdf').read_text() == 'plain'
+
+        report = s.ex_mirror_webdav(ROOT, tmp_path)
+        assert report.downloaded == []
+        assert len(report.unchanged) == 3